@@ -14,6 +14,8 @@ import plotly.graph_objects as go
 from typing import List, Dict
 import json
 import io
+import re
+from collections import Counter
 from datetime import datetime
 import requests
 
@@ -30,11 +32,14 @@ from data_engine import (
 )
 from intelligence import (
     calculate_credibility,
+    calculate_credibility_batch,
     calculate_risk,
-    match_student_to_job,
+    match_student_to_all_jobs,
     generate_student_explanation,
     generate_officer_explanation,
     analyze_placement_outcomes,
+    invalidate_caches,
+    refresh_context,
     CredibilityResult,
     RiskResult,
     MatchResult
@@ -57,6 +62,9 @@ except ImportError:
 GROK_API_KEY = os.getenv("GROK_API_KEY", "")  # Set in .env file
 GROK_API_URL = "https://api.x.ai/v1/chat/completions"
 
+# Chatbot patterns (compiled once, not per message)
+STUDENT_ID_PATTERN = re.compile(r'S\d+', re.IGNORECASE)
+
 
 # ==================== PAGE CONFIG ====================
 
@@ -125,11 +133,10 @@ def load_data():
     if USE_DATABASE:
         try:
             db = DatabaseManager()
-            students = db.get_all_students()
-            companies = db.get_all_companies()
-            logs = db.get_all_logs()
+            students, companies, logs = db.get_all()
             
             if students or companies:  # If database has data
+                refresh_context(students, companies)
                 return students, companies, logs
         except Exception as e:
             st.warning(f"Database error: {e}. Falling back to JSON files.")
@@ -137,6 +144,7 @@ def load_data():
     # Fallback to JSON files
     try:
         students, jobs, logs = load_from_json()
+        refresh_context(students, jobs)
         return students, jobs, logs
     except FileNotFoundError:
         st.error("⚠️ No data found. Please either:")
@@ -215,8 +223,7 @@ def render_overview_dashboard(students: List[StudentProfile], companies: List[Jo
     st.markdown("### Resume Credibility Distribution")
     credibility_data = {"HIGH": 0, "MEDIUM": 0, "LOW": 0}
     
-    for student in students:
-        cred = calculate_credibility(student)
+    for cred in calculate_credibility_batch(students):
         credibility_data[cred.level] += 1
     
     col1, col2 = st.columns([2, 1])
@@ -332,8 +339,7 @@ def render_student_analysis(students: List[StudentProfile], companies: List[JobD
         
         # Match with all companies
         matches = []
-        for company in companies:
-            match = match_student_to_job(student, company, logs)
+        for company, match in zip(companies, match_student_to_all_jobs(student, companies, logs)):
             matches.append({
                 "Company": company.company_name,
                 "Role": company.role,
@@ -368,8 +374,7 @@ def render_credibility_dashboard(students: List[StudentProfile]):
     
     # Calculate credibility for all students
     credibility_records = []
-    for student in students:
-        cred = calculate_credibility(student)
+    for student, cred in zip(students, calculate_credibility_batch(students)):
         credibility_records.append({
             "Student ID": student.student_id,
             "Name": student.name,
@@ -439,9 +444,7 @@ def render_fake_skill_detection(students: List[StudentProfile]):
     
     suspicious_students = []
     
-    for student in students:
-        cred = calculate_credibility(student)
-        
+    for student, cred in zip(students, calculate_credibility_batch(students)):
         # Count suspicious skills
         suspicious_count = 0
         suspicious_skills = []
@@ -513,8 +516,7 @@ def render_risk_assessment(students: List[StudentProfile], companies: List[JobDe
         # Calculate risk for all students
         risk_data = []
         
-        for student in students:
-            cred = calculate_credibility(student)
+        for student, cred in zip(students, calculate_credibility_batch(students)):
             risk = calculate_risk(student, company, logs, cred)
             
             risk_data.append({
@@ -651,6 +653,7 @@ def render_data_import():
                             
                             # Save to JSON
                             save_to_json(all_students, companies, logs)
+                            invalidate_caches()
                             
                             # Save to PostgreSQL if available
                             if USE_DATABASE:
@@ -671,7 +674,7 @@ def render_data_import():
                             with col1:
                                 st.metric("Students Added", len(students))
                             with col2:
-                                high_cred = sum(1 for s in students if calculate_credibility(s).level == "HIGH")
+                                high_cred = sum(1 for c in calculate_credibility_batch(students) if c.level == "HIGH")
                                 st.metric("HIGH Credibility", high_cred)
                             with col3:
                                 avg_cgpa = sum(s.cgpa for s in students) / len(students) if students else 0
@@ -728,6 +731,7 @@ def render_data_import():
                             
                             # Save to JSON
                             save_to_json(students, all_companies, logs)
+                            invalidate_caches()
                             
                             # Save to PostgreSQL if available
                             if USE_DATABASE:
@@ -1010,31 +1014,28 @@ def get_student_statistics(students: List[StudentProfile]) -> Dict:
     if total == 0:
         return {"error": "No students in database"}
     
-    branches = {}
+    # Single pass: branch / credibility tallies plus running CGPA sum
+    branches = Counter()
+    cred_levels = Counter()
     high_cgpa = 0
-    high_cred = 0
-    low_cred = 0
+    cgpa_sum = 0.0
     
-    for s in students:
-        branches[s.branch] = branches.get(s.branch, 0) + 1
+    for s, cred in zip(students, calculate_credibility_batch(students)):
+        branches[s.branch] += 1
+        cred_levels[cred.level] += 1
+        cgpa_sum += s.cgpa
         if s.cgpa >= 8.0:
             high_cgpa += 1
-        
-        cred = calculate_credibility(s)
-        if cred.level == "HIGH":
-            high_cred += 1
-        elif cred.level == "LOW":
-            low_cred += 1
     
-    avg_cgpa = sum(s.cgpa for s in students) / total
+    avg_cgpa = cgpa_sum / total
     
     return {
         "total_students": total,
         "average_cgpa": round(avg_cgpa, 2),
         "high_cgpa_count": high_cgpa,
-        "branches": branches,
-        "high_credibility_count": high_cred,
-        "low_credibility_count": low_cred
+        "branches": dict(branches),
+        "high_credibility_count": cred_levels["HIGH"],
+        "low_credibility_count": cred_levels["LOW"]
     }
 
 def get_company_statistics(companies: List[JobDescription]) -> Dict:
@@ -1043,18 +1044,21 @@ def get_company_statistics(companies: List[JobDescription]) -> Dict:
     if total == 0:
         return {"error": "No companies in database"}
     
-    types = {}
+    # Single pass: type tally plus running sums
+    types = Counter()
     total_positions = 0
+    min_cgpa_sum = 0.0
     
     for c in companies:
-        types[c.company_type] = types.get(c.company_type, 0) + 1
+        types[c.company_type] += 1
         total_positions += c.open_positions
+        min_cgpa_sum += c.eligibility_rules.min_cgpa
     
-    avg_cgpa_req = sum(c.eligibility_rules.min_cgpa for c in companies) / total
+    avg_cgpa_req = min_cgpa_sum / total
     
     return {
         "total_companies": total,
-        "company_types": types,
+        "company_types": dict(types),
         "total_open_positions": total_positions,
         "average_cgpa_requirement": round(avg_cgpa_req, 2)
     }
@@ -1113,8 +1117,7 @@ def match_student_to_companies(students: List[StudentProfile], companies: List[J
         return [{"error": f"Student {student_id} not found"}]
     
     results = []
-    for company in companies:
-        match = match_student_to_job(student, company, logs)
+    for company, match in zip(companies, match_student_to_all_jobs(student, companies, logs)):
         results.append({
             "company": company.company_name,
             "role": company.role,
@@ -1368,8 +1371,7 @@ def render_ai_assistant():
                 elif any(keyword in user_lower for keyword in ["details", "info", "about"]) and ("s0" in user_lower or "student" in user_lower):
                     # Extract student ID
                     student_id = None
-                    import re
-                    match = re.search(r'S\d+', user_input, re.IGNORECASE)
+                    match = STUDENT_ID_PATTERN.search(user_input)
                     if match:
                         student_id = match.group().upper()
                     
@@ -8,18 +8,53 @@ engineering college placement cell. Focus on solving real placement problems
 using data, logic, and explainability. No assumptions. No shortcuts.
 """
 
-from typing import List, Dict, Optional
-from pydantic import BaseModel, Field, field_validator
+from typing import List, Dict, Optional, Tuple
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, field_validator
 from faker import Faker
-import random
 import json
-from datetime import datetime
+import sys
+import numpy as np
+from datetime import datetime, timedelta
+from pathlib import Path
+from functools import cached_property
+from collections import Counter
+import itertools
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """Plain-Python stand-in when numba is not installed"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+try:
+    import msgspec
+    from typing import Annotated
+    HAS_MSGSPEC = True
+except ImportError:
+    HAS_MSGSPEC = False
 
 fake = Faker('en_IN')  # Indian locale for realistic names
 
 
 # ==================== PYDANTIC MODELS ====================
 
+# Literal keyword scans used by the matcher (plain substring checks - no regex needed)
+DSA_KEYWORDS = ("dsa", "algorithm")
+TECH_ROLE_KEYWORDS = ("software", "developer")
+
 class SkillEvidence(BaseModel):
     """Evidence backing up skill claims"""
     github: bool = False
@@ -33,36 +68,128 @@ class Skill(BaseModel):
     name: str
     claimed_level: str = Field(description="beginner, intermediate, advanced")
     evidence: SkillEvidence
+    
+    @field_validator('name')
+    @classmethod
+    def intern_name(cls, v):
+        # Same few dozen names recur across every profile; share one string object each
+        return sys.intern(v)
+
+
+# Process-wide lowercase skill name -> bit position, assigned on first sight
+_SKILL_BIT_IDS: Dict[str, int] = {}
+_NEXT_SKILL_BIT = itertools.count()
 
 
-class StudentProfile(BaseModel):
+def skill_bits(names_lower) -> int:
+    """Python int bitmask of lowercase skill names (intersection = &, count = .bit_count())"""
+    mask = 0
+    for name in names_lower:
+        idx = _SKILL_BIT_IDS.get(name)
+        if idx is None:
+            idx = _SKILL_BIT_IDS.setdefault(name, next(_NEXT_SKILL_BIT))
+        mask |= 1 << idx
+    return mask
+
+
+class _DerivedFieldsModel(BaseModel):
+    """Frozen model whose cached_property values are recomputed on every model_copy"""
+    model_config = ConfigDict(frozen=True)
+    
+    def model_copy(self, *, update=None, deep: bool = False):
+        copied = super().model_copy(update=update, deep=deep)
+        # model_copy carries __dict__ over, cached values included; drop them so update= is honoured
+        for name in [n for n in copied.__dict__ if isinstance(getattr(type(copied), n, None), cached_property)]:
+            del copied.__dict__[name]
+        return copied
+
+
+class StudentProfile(_DerivedFieldsModel):
     """Student data model - Indian engineering college context"""
     student_id: str
     name: str
     branch: str = Field(description="CSE, IT, AI, DS, ECE, EEE, ME, CE, CHE, BT, IE")
     cgpa: float = Field(ge=0.0, le=10.0, description="CGPA on 10-point scale (0.0-10.0)")
     active_backlogs: int = Field(ge=0, le=10, description="Number of active backlogs")
-    skills: List[Skill]
+    skills: Tuple[Skill, ...]
     communication_score: int = Field(ge=1, le=10, description="Communication ability (1-10)")
     mock_interview_score: int = Field(ge=1, le=10, description="Mock interview performance (1-10)")
     resume_trust_score: float = Field(ge=0, le=1, description="Resume credibility (0-1)")
     email: str
     phone: str
     
+    @field_validator('branch')
+    @classmethod
+    def intern_branch(cls, v):
+        # About a dozen branch codes shared by every profile; group-by dict lookups compare by identity
+        return sys.intern(v)
+    
     @field_validator('cgpa')
     @classmethod
     def validate_cgpa(cls, v):
         if v < 0.0 or v > 10.0:
             raise ValueError('CGPA must be between 0.0 and 10.0')
         return round(v, 2)
+    
+    # Derived once per profile (frozen model, tuple of skills)
+    @cached_property
+    def skill_names_lower(self) -> frozenset:
+        """Lowercased skill names for membership checks"""
+        return frozenset(sys.intern(s.name.lower()) for s in self.skills)
+    
+    @cached_property
+    def skill_text_lower(self) -> str:
+        """Lowercased skill names joined by newlines, for keyword substring scans"""
+        return "\n".join(s.name.lower() for s in self.skills)
+    
+    @cached_property
+    def skill_bits(self) -> int:
+        """Skill bitmask over the shared skill ids"""
+        return skill_bits(self.skill_names_lower)
+    
+    @cached_property
+    def has_dsa(self) -> bool:
+        """Any skill mentions DSA / algorithms"""
+        return any(keyword in self.skill_text_lower for keyword in DSA_KEYWORDS)
+    
+    @cached_property
+    def scaled_scores(self) -> tuple:
+        """(cgpa, communication, mock interview) on a 0-1 scale, divided once per profile"""
+        return (self.cgpa / 10.0, self.communication_score / 10.0, self.mock_interview_score / 10.0)
 
 
-class EligibilityRules(BaseModel):
+class EligibilityRules(_DerivedFieldsModel):
     """Company eligibility criteria"""
     min_cgpa: float = Field(ge=6.0, le=8.5)
     max_backlogs: int = Field(ge=0, le=2)
-    mandatory_skills: List[str]
-    preferred_skills: List[str]
+    mandatory_skills: Tuple[str, ...]
+    preferred_skills: Tuple[str, ...]
+    
+    @field_validator('mandatory_skills', 'preferred_skills')
+    @classmethod
+    def intern_skills(cls, v):
+        return tuple(sys.intern(skill) for skill in v)
+    
+    @cached_property
+    def mandatory_lower(self) -> frozenset:
+        """Lowercased mandatory skills for set intersection with a student's skills"""
+        return frozenset(sys.intern(skill.lower()) for skill in self.mandatory_skills)
+    
+    @cached_property
+    def preferred_lower(self) -> frozenset:
+        """Lowercased preferred skills"""
+        return frozenset(sys.intern(skill.lower()) for skill in self.preferred_skills)
+    
+    @cached_property
+    def mandatory_bits(self) -> int:
+        """Mandatory skill bitmask over the shared skill ids"""
+        return skill_bits(self.mandatory_lower)
+    
+    @cached_property
+    def mandatory_ratios(self) -> tuple:
+        """Skill match ratio indexed by number of mandatory skills met (one division per job, not per student)"""
+        total = len(self.mandatory_lower)
+        return tuple(met / total for met in range(total + 1)) if total else (0,)
 
 
 class WeightPolicy(BaseModel):
@@ -73,7 +200,7 @@ class WeightPolicy(BaseModel):
     mock_interview_weight: float = Field(ge=0.0, le=0.2, default=0.1)
 
 
-class JobDescription(BaseModel):
+class JobDescription(_DerivedFieldsModel):
     """Job/Company description - Indian placement context"""
     company_id: str
     company_name: str
@@ -83,6 +210,12 @@ class JobDescription(BaseModel):
     weight_policy: WeightPolicy
     risk_tolerance: str = Field(description="low, medium, high")
     open_positions: int = Field(ge=1, le=50, default=5, description="Number of open positions for this role")
+    
+    @cached_property
+    def is_tech_role(self) -> bool:
+        """Role requires DSA (software / developer roles)"""
+        role_lower = self.role.lower()
+        return any(keyword in role_lower for keyword in TECH_ROLE_KEYWORDS)
 
 
 class PlacementLog(BaseModel):
@@ -93,13 +226,88 @@ class PlacementLog(BaseModel):
     shortlisted: bool
     interview_result: str = Field(description="selected, rejected, no_show")
     failure_reason: Optional[str] = Field(default=None, description="low_dsa, poor_communication, fake_skill, cgpa, none")
-    timestamp: str
+    timestamp: datetime
+
+
+# ==================== PLACEMENT OUTCOME KERNEL ====================
+
+# Codes returned by _simulate_outcomes
+RESULT_LABELS = ("selected", "rejected", "no_show")
+FAILURE_REASON_LABELS = ("cgpa", "low_dsa", "fake_skill", "poor_communication")  # -1 = None
+
+
+@njit(cache=True, parallel=True)
+def _simulate_outcomes(
+    stu_idx, job_idx,
+    stu_cgpa, stu_backlogs, stu_trust, stu_comm, stu_mock,
+    job_min_cgpa, job_max_backlogs, mandatory_ratio,
+    outcome_draw, noshow_draw
+):
+    """Numeric decision core for placement logs (pre-drawn randoms, independent per log)"""
+    n = stu_idx.shape[0]
+    shortlisted = np.zeros(n, dtype=np.bool_)
+    result = np.ones(n, dtype=np.int8)
+    reason = np.full(n, -1, dtype=np.int8)
+    
+    for i in prange(n):
+        s = stu_idx[i]
+        j = job_idx[i]
+        
+        if stu_cgpa[s] < job_min_cgpa[j] or stu_backlogs[s] > job_max_backlogs[j]:
+            reason[i] = 0
+        elif mandatory_ratio[s, j] < 0.5:
+            reason[i] = 1
+        else:
+            shortlisted[i] = True
+            success_probability = 0.3
+            
+            # Resume trust impact (fake skills penalize)
+            if stu_trust[s] >= 0.7:
+                success_probability += 0.3
+            elif stu_trust[s] >= 0.4:
+                success_probability += 0.1
+            else:
+                success_probability -= 0.2
+            
+            # Communication impact
+            if stu_comm[s] >= 8:
+                success_probability += 0.2
+            elif stu_comm[s] >= 6:
+                success_probability += 0.1
+            elif stu_comm[s] < 5:
+                success_probability -= 0.2
+            
+            # Mock interview impact
+            if stu_mock[s] >= 8:
+                success_probability += 0.1
+            elif stu_mock[s] < 5:
+                success_probability -= 0.1
+            
+            if outcome_draw[i] < success_probability:
+                result[i] = 0
+            elif stu_trust[s] < 0.4:
+                reason[i] = 2
+            elif stu_comm[s] < 6:
+                reason[i] = 3
+            else:
+                reason[i] = 1
+            
+            # Small chance of no-show
+            if noshow_draw[i] < 0.05:
+                result[i] = 2
+                reason[i] = -1
+    
+    return shortlisted, result, reason
 
 
 # ==================== SYNTHETIC DATA GENERATOR ====================
 
 class SyntheticDataGenerator:
-    """Generate realistic Indian placement data with skill inflation patterns"""
+    """Generate realistic Indian placement data with skill inflation patterns
+    
+    Values are produced in-range by construction, so models are built with
+    model_construct() (no validation); load_from_json() still validates.
+    """
     
     # Indian engineering branches (expanded)
     BRANCHES = [
@@ -123,6 +331,7 @@ class SyntheticDataGenerator:
     OTHER_SKILLS = ["Git", "Docker", "AWS", "MongoDB", "REST API"]
     
     ALL_SKILLS = PROGRAMMING_SKILLS + WEB_SKILLS + DATA_SKILLS + OTHER_SKILLS
+    _ALL_SKILLS = tuple(ALL_SKILLS)
     
     # Indian companies
     MNCS = [
@@ -149,169 +358,216 @@ class SyntheticDataGenerator:
         "Backend Developer", "Frontend Developer", "ML Engineer", "DevOps Engineer"
     ]
     
+    # Eligibility skill pools per company type: (mandatory, preferred)
+    MNC_SKILL_POOLS = (("DSA", "Python", "Java", "SQL"), ("Git", "Docker", "AWS", "React"))
+    STARTUP_SKILL_POOLS = (("Python", "JavaScript", "React", "DSA"), ("Machine Learning", "AWS", "Docker"))
+    PRODUCT_SKILL_POOLS = (("DSA", "Python", "Java", "C++"), ("React", "SQL", "Git"))
+    SERVICE_SKILL_POOLS = (("Java", "Python", "SQL"), ("React", "Angular", "DSA"))
+    
     def __init__(self, seed: int = 42):
-        random.seed(seed)
-        Faker.seed(seed)
+        Faker.seed(seed)  # Faker keeps its own RNG for person strings
+        self.rng = np.random.default_rng(seed)  # every other draw goes through this Generator
+    
+    def _calculate_resume_trust_scores(self, skill_lists: List[List[Skill]]) -> List[float]:
+        """Calculate resume credibility for a whole cohort using flat NumPy evidence arrays"""
+        counts = np.fromiter((len(skills) for skills in skill_lists), dtype=np.int64, count=len(skill_lists))
+        flat = [skill for skills in skill_lists for skill in skills]
+        n = len(flat)
+        
+        github = np.fromiter((sk.evidence.github for sk in flat), dtype=bool, count=n)
+        projects = np.fromiter((sk.evidence.projects for sk in flat), dtype=np.float64, count=n)
+        certifications = np.fromiter((sk.evidence.certifications for sk in flat), dtype=np.float64, count=n)
+        internship = np.fromiter((sk.evidence.internship for sk in flat), dtype=bool, count=n)
+        advanced = np.fromiter((sk.claimed_level == "advanced" for sk in flat), dtype=bool, count=n)
+        
+        # Same term order as the scalar per-skill formula
+        evidence = np.where(github, 0.4, 0.0)
+        evidence += np.where(projects > 0, 0.3 * (projects / 5), 0.0)
+        evidence += np.where(certifications > 0, 0.2 * (certifications / 3), 0.0)
+        evidence += np.where(internship, 0.3, 0.0)
+        # Penalty for claiming advanced without evidence
+        evidence -= np.where(advanced & ~(github | (projects >= 2)), 0.3, 0.0)
+        np.minimum(evidence, 1.0, out=evidence)
+        
+        # Pad into a (students x max_skills) matrix and add column by column:
+        # keeps the left-to-right summation order of the per-skill loop
+        scores = [0.5] * len(skill_lists)
+        if n:
+            starts = np.repeat(np.cumsum(counts) - counts, counts)
+            rows = np.repeat(np.arange(len(skill_lists)), counts)
+            padded = np.zeros((len(skill_lists), int(counts.max())))
+            padded[rows, np.arange(n) - starts] = evidence
+            totals = np.zeros(len(skill_lists))
+            for col in padded.T:
+                totals += col
+            has_skills = counts > 0
+            trust = np.round(np.clip(totals[has_skills] / counts[has_skills], 0.0, 1.0), 2)
+            for idx, value in zip(np.flatnonzero(has_skills).tolist(), trust.tolist()):
+                scores[idx] = value
+        return scores
     
     def _calculate_resume_trust_score(self, skills: List[Skill]) -> float:
         """Calculate resume credibility based on evidence"""
-        if not skills:
-            return 0.5
-        
-        total_evidence = 0
-        total_claims = len(skills)
-        
-        for skill in skills:
-            evidence_score = 0
-            if skill.evidence.github:
-                evidence_score += 0.4
-            if skill.evidence.projects > 0:
-                evidence_score += 0.3 * (skill.evidence.projects / 5)
-            if skill.evidence.certifications > 0:
-                evidence_score += 0.2 * (skill.evidence.certifications / 3)
-            if skill.evidence.internship:
-                evidence_score += 0.3
-            
-            # Penalty for claiming advanced without evidence
-            if skill.claimed_level == "advanced":
-                if not (skill.evidence.github or skill.evidence.projects >= 2):
-                    evidence_score -= 0.3
-            
-            total_evidence += min(1.0, evidence_score)
+        return self._calculate_resume_trust_scores([skills])[0]
+    
+    # Per-type draw ranges, indexed by type code (star, average, weak)
+    STUDENT_TYPES = ("star", "average", "weak")
+    TYPE_CUTS = (0.25, 0.65)
+    CGPA_LOW = np.array([8.5, 7.0, 5.0])
+    CGPA_HIGH = np.array([9.8, 8.5, 7.0])
+    SCORE_LOW = np.array([7, 5, 3])
+    SCORE_HIGH = np.array([10, 8, 6])
+    
+    # Skill evidence distribution per bucket, row = type code * 2 + inflated:
+    # two equally likely claimed levels, P(github), projects range, certifications range, P(internship)
+    SKILL_LEVELS = np.array([
+        ("intermediate", "advanced"), ("intermediate", "advanced"),  # star (never inflates)
+        ("beginner", "intermediate"), ("advanced", "advanced"),      # average
+        ("beginner", "beginner"), ("intermediate", "advanced"),      # weak
+    ], dtype=object)
+    P_GITHUB = np.array([2 / 3, 2 / 3, 0.5, 0.0, 0.0, 0.0])
+    PROJECTS_RANGE = np.array([(2, 5), (2, 5), (1, 3), (0, 1), (0, 1), (0, 0)])
+    CERTIFICATIONS_RANGE = np.array([(1, 3), (1, 3), (0, 2), (0, 0), (0, 0), (0, 0)])
+    P_INTERNSHIP = np.array([0.5, 0.5, 0.5, 0.0, 0.0, 0.0])
+    
+    def _draw_skills(self, names, type_codes, inflated, genuine=None, genuine_projects=None) -> List[Skill]:
+        """Draw evidence for many skills at once from their (student type, inflated) bucket"""
+        rng = self.rng
+        n = len(names)
+        bucket = np.asarray(type_codes, dtype=np.int64) * 2 + np.asarray(inflated, dtype=np.int64)
         
-        trust_score = max(0.0, min(1.0, total_evidence / total_claims))
-        return round(trust_score, 2)
-    
-    def _generate_skill(self, skill_name: str, student_type: str, inflate_skill: bool) -> Skill:
-        """Generate skill with evidence based on student type"""
+        levels = self.SKILL_LEVELS[bucket, rng.integers(0, 2, n)]
+        github = rng.random(n) < self.P_GITHUB[bucket]
+        projects = rng.integers(self.PROJECTS_RANGE[bucket, 0], self.PROJECTS_RANGE[bucket, 1], endpoint=True)
+        certifications = rng.integers(
+            self.CERTIFICATIONS_RANGE[bucket, 0], self.CERTIFICATIONS_RANGE[bucket, 1], endpoint=True
+        )
+        internship = rng.random(n) < self.P_INTERNSHIP[bucket]
         
-        if student_type == "star":
-            # Star students: genuine skills with strong evidence
-            claimed_level = random.choice(["intermediate", "advanced"])
-            evidence = SkillEvidence(
-                github=random.choice([True, True, False]),
-                projects=random.randint(2, 5),
-                certifications=random.randint(1, 3),
-                internship=random.choice([True, False])
-            )
-        
-        elif student_type == "average":
-            # Average students: mix of genuine and some inflation
-            if inflate_skill:
-                # Inflate this skill
-                claimed_level = "advanced"
-                evidence = SkillEvidence(
-                    github=False,
-                    projects=random.randint(0, 1),
-                    certifications=0,
-                    internship=False
-                )
-            else:
-                claimed_level = random.choice(["beginner", "intermediate"])
-                evidence = SkillEvidence(
-                    github=random.choice([True, False]),
-                    projects=random.randint(1, 3),
-                    certifications=random.randint(0, 2),
-                    internship=random.choice([True, False])
-                )
+        # Edge case overrides: genuine skills get GitHub + real projects
+        if genuine is not None:
+            github |= genuine
+            projects = np.where(genuine, genuine_projects, projects)
         
-        else:  # weak student
-            if inflate_skill:
-                # Inflate skills heavily
-                claimed_level = random.choice(["intermediate", "advanced"])
-                evidence = SkillEvidence(
-                    github=False,
-                    projects=0,
-                    certifications=0,
-                    internship=False
-                )
-            else:
-                claimed_level = "beginner"
-                evidence = SkillEvidence(
-                    github=False,
-                    projects=random.randint(0, 1),
-                    certifications=0,
-                    internship=False
+        return [
+            Skill.model_construct(
+                name=name,
+                claimed_level=level,
+                evidence=SkillEvidence.model_construct(
+                    github=gh, projects=proj, certifications=cert, internship=intern
                 )
-        
-        return Skill(name=skill_name, claimed_level=claimed_level, evidence=evidence)
+            )
+            for name, level, gh, proj, cert, intern in zip(
+                names, levels.tolist(), github.tolist(), projects.tolist(),
+                certifications.tolist(), internship.tolist()
+            )
+        ]
+    
+    def _generate_skill(self, skill_name: str, student_type: str, inflate_skill: bool) -> Skill:
+        """Generate skill with evidence based on student type"""
+        return self._draw_skills([skill_name], [self.STUDENT_TYPES.index(student_type)], [inflate_skill])[0]
+    
+    # Scalar draws from self.rng, returned as native Python values
+    def _choice(self, seq):
+        return seq[int(self.rng.integers(len(seq)))]
+    
+    def _sample(self, seq, k: int) -> list:
+        return [seq[i] for i in self.rng.choice(len(seq), k, replace=False).tolist()]
+    
+    def _uniform(self, low: float, high: float) -> float:
+        return float(self.rng.uniform(low, high))
+    
+    def _randint(self, low: int, high: int) -> int:
+        """Inclusive on both ends, like random.randint"""
+        return int(self.rng.integers(low, high, endpoint=True))
+    
+    def _batch_fake(self, count: int) -> tuple:
+        """Draw all Faker person strings in one go: (names, emails, phones)"""
+        names = [fake.name() for _ in range(count)]
+        emails = [fake.email() for _ in range(count)]
+        phones = [fake.phone_number() for _ in range(count)]
+        return names, emails, phones
+    
+    def _batch_timestamps(self, count: int) -> List[datetime]:
+        """Uniform random second-resolution timestamps within the last year"""
+        end = datetime.now().replace(microsecond=0)
+        start = end - timedelta(days=365)
+        offsets = self.rng.integers(0, 365 * 86400, count, endpoint=True).tolist()
+        return [start + timedelta(seconds=offset) for offset in offsets]
     
     def generate_students(self, count: int = 50) -> List[StudentProfile]:
         """Generate 50 realistic students with skill inflation patterns"""
+        rng = self.rng
         students = []
+        rows = []
         
-        # 30% inflate skills, as per requirement
-        inflate_count = int(count * 0.3)
-        inflate_indices = set(random.sample(range(count), inflate_count))
+        # Student type (affects skill generation): 25% star, 40% average, 35% weak
+        types = np.searchsorted(self.TYPE_CUTS, rng.random(count), side='right')
+        is_star, is_weak = types == 0, types == 2
         
-        for i in range(count):
-            student_id = f"S{i+1:03d}"
-            name = fake.name()
-            branch = random.choice(self.BRANCHES)
-            
-            # Determine student type (affects skill generation)
-            rand = random.random()
-            if rand < 0.25:  # 25% star students
-                student_type = "star"
-                cgpa = round(random.uniform(8.5, 9.8), 2)
-                active_backlogs = 0
-                communication_score = random.randint(7, 10)
-                mock_interview_score = random.randint(7, 10)
-            elif rand < 0.65:  # 40% average students
-                student_type = "average"
-                cgpa = round(random.uniform(7.0, 8.5), 2)
-                active_backlogs = random.choice([0, 0, 1])
-                communication_score = random.randint(5, 8)
-                mock_interview_score = random.randint(5, 8)
-            else:  # 35% weak students
-                student_type = "weak"
-                cgpa = round(random.uniform(5.0, 7.0), 2)
-                active_backlogs = random.randint(1, 5)
-                communication_score = random.randint(3, 6)
-                mock_interview_score = random.randint(3, 6)
-            
-            # Generate skills
-            skill_count = random.randint(4, 8)
-            selected_skills = random.sample(self.ALL_SKILLS, skill_count)
-            
-            skills = []
-            will_inflate = i in inflate_indices
-            
-            for j, skill_name in enumerate(selected_skills):
-                # If student inflates, inflate 2-3 skills
-                inflate_this_skill = will_inflate and j < random.randint(2, 3)
-                skill = self._generate_skill(skill_name, student_type, inflate_this_skill)
-                skills.append(skill)
-            
-            # Some edge cases: low CGPA but strong skills (realistic scenario)
-            if random.random() < 0.15 and student_type == "weak":
-                # This student has low CGPA but actually has good skills
-                for skill in skills[:2]:  # Make first 2 skills genuine
-                    skill.evidence.github = True
-                    skill.evidence.projects = random.randint(2, 4)
-            
-            # Some edge cases: high CGPA but poor communication
-            if random.random() < 0.1 and student_type == "star":
-                communication_score = random.randint(4, 6)
-                mock_interview_score = random.randint(4, 6)
-            
-            # Calculate trust score
-            resume_trust_score = self._calculate_resume_trust_score(skills)
-            
-            student = StudentProfile(
-                student_id=student_id,
+        branch_idx = rng.integers(0, len(self.BRANCHES), count)
+        cgpas = np.round(rng.uniform(self.CGPA_LOW[types], self.CGPA_HIGH[types]), 2)
+        backlogs = np.where(
+            is_star, 0,
+            np.where(is_weak, rng.integers(1, 6, count), (rng.integers(0, 3, count) == 2).astype(np.int64))
+        )
+        communication = rng.integers(self.SCORE_LOW[types], self.SCORE_HIGH[types] + 1)
+        mock_interview = rng.integers(self.SCORE_LOW[types], self.SCORE_HIGH[types] + 1)
+        
+        # Some edge cases: high CGPA but poor communication
+        poor_comm = is_star & (rng.random(count) < 0.1)
+        communication = np.where(poor_comm, rng.integers(4, 7, count), communication)
+        mock_interview = np.where(poor_comm, rng.integers(4, 7, count), mock_interview)
+        
+        # Skills: 4-8 per student, sampled without replacement (row-wise shuffle of skill ids)
+        skill_counts = rng.integers(4, 9, count)
+        skill_ids = np.broadcast_to(np.arange(len(self._ALL_SKILLS)), (count, len(self._ALL_SKILLS)))
+        skill_order = rng.permuted(skill_ids, axis=1)
+        
+        # 30% inflate skills, as per requirement (2-3 skills each)
+        will_inflate = np.zeros(count, dtype=bool)
+        will_inflate[rng.choice(count, int(count * 0.3), replace=False)] = True
+        inflate_limit = np.where(will_inflate, rng.integers(2, 4, count), 0)
+        
+        # Some edge cases: low CGPA but strong skills (realistic scenario)
+        genuine_weak = is_weak & (rng.random(count) < 0.15)
+        
+        # Flatten to one row per skill and draw all evidence in a single batch
+        owner = np.repeat(np.arange(count), skill_counts)
+        offsets = np.cumsum(skill_counts) - skill_counts
+        position = np.arange(owner.size) - offsets[owner]
+        flat_skills = self._draw_skills(
+            [self._ALL_SKILLS[sid] for sid in skill_order[owner, position].tolist()],
+            types[owner],
+            position < inflate_limit[owner],
+            genuine=genuine_weak[owner] & (position < 2),  # first 2 skills made genuine
+            genuine_projects=rng.integers(2, 5, owner.size)
+        )
+        
+        names, emails, phones = self._batch_fake(count)
+        
+        columns = zip(
+            branch_idx.tolist(), cgpas.tolist(), backlogs.tolist(), communication.tolist(),
+            mock_interview.tolist(), offsets.tolist(), skill_counts.tolist(), names, emails, phones
+        )
+        for i, (b, cgpa, active_backlogs, comm, mock, start, k, name, email, phone) in enumerate(columns):
+            rows.append(dict(
+                student_id=f"S{i+1:03d}",
                 name=name,
-                branch=branch,
+                branch=self.BRANCHES[b],
                 cgpa=cgpa,
                 active_backlogs=active_backlogs,
-                skills=skills,
-                communication_score=communication_score,
-                mock_interview_score=mock_interview_score,
-                resume_trust_score=resume_trust_score,
-                email=fake.email(),
-                phone=fake.phone_number()
-            )
-            students.append(student)
+                skills=tuple(flat_skills[start:start + k]),
+                communication_score=comm,
+                mock_interview_score=mock,
+                email=email,
+                phone=phone
+            ))
+        
+        # Trust scores for the whole cohort in one vectorized pass
+        trust_scores = self._calculate_resume_trust_scores([row["skills"] for row in rows])
+        for row, resume_trust_score in zip(rows, trust_scores):
+            students.append(StudentProfile.model_construct(resume_trust_score=resume_trust_score, **row))
         
         return students
     
@@ -319,26 +575,31 @@ class SyntheticDataGenerator:
         """Generate 12 companies with varied hiring behaviors"""
         jobs = []
         
+        # Each company name is used at most once per category
+        mnc_names = self._sample(self.MNCS, 4)
+        startup_names = self._sample(self.STARTUPS, 3)
+        product_names = self._sample(self.PRODUCT_COMPANIES, 3)
+        service_names = self._sample(self.SERVICE_COMPANIES, 2)
+        
         # 4 MNCs - strict
-        for i in range(4):
+        for company_name in mnc_names:
             company_id = f"C{len(jobs)+1:03d}"
-            company_name = random.choice(self.MNCS)
-            role = random.choice(self.ROLES)
+            role = self._choice(self.ROLES)
             
-            eligibility = EligibilityRules(
-                min_cgpa=round(random.uniform(7.5, 8.5), 1),
+            eligibility = EligibilityRules.model_construct(
+                min_cgpa=round(self._uniform(7.5, 8.5), 1),
                 max_backlogs=0,
-                mandatory_skills=random.sample(["DSA", "Python", "Java", "SQL"], 2),
-                preferred_skills=random.sample(["Git", "Docker", "AWS", "React"], 2)
+                mandatory_skills=tuple(self._sample(self.MNC_SKILL_POOLS[0], 2)),
+                preferred_skills=tuple(self._sample(self.MNC_SKILL_POOLS[1], 2))
             )
             
-            weights = WeightPolicy(
-                gpa_weight=round(random.uniform(0.4, 0.5), 2),
-                skill_weight=round(random.uniform(0.3, 0.4), 2),
-                communication_weight=round(random.uniform(0.1, 0.2), 2)
+            weights = WeightPolicy.model_construct(
+                gpa_weight=round(self._uniform(0.4, 0.5), 2),
+                skill_weight=round(self._uniform(0.3, 0.4), 2),
+                communication_weight=round(self._uniform(0.1, 0.2), 2)
             )
             
-            job = JobDescription(
+            job = JobDescription.model_construct(
                 company_id=company_id,
                 company_name=company_name,
                 company_type="MNC",
@@ -346,30 +607,29 @@ class SyntheticDataGenerator:
                 eligibility_rules=eligibility,
                 weight_policy=weights,
                 risk_tolerance="low",
-                open_positions=random.randint(3, 8)  # MNCs: selective hiring
+                open_positions=self._randint(3, 8)  # MNCs: selective hiring
             )
             jobs.append(job)
         
         # 3 Startups - flexible, skill-focused
-        for i in range(3):
+        for company_name in startup_names:
             company_id = f"C{len(jobs)+1:03d}"
-            company_name = random.choice(self.STARTUPS)
-            role = random.choice(self.ROLES)
+            role = self._choice(self.ROLES)
             
-            eligibility = EligibilityRules(
-                min_cgpa=round(random.uniform(6.0, 6.5), 1),
-                max_backlogs=random.choice([1, 2]),
-                mandatory_skills=random.sample(["Python", "JavaScript", "React", "DSA"], 2),
-                preferred_skills=random.sample(["Machine Learning", "AWS", "Docker"], 2)
+            eligibility = EligibilityRules.model_construct(
+                min_cgpa=round(self._uniform(6.0, 6.5), 1),
+                max_backlogs=self._choice([1, 2]),
+                mandatory_skills=tuple(self._sample(self.STARTUP_SKILL_POOLS[0], 2)),
+                preferred_skills=tuple(self._sample(self.STARTUP_SKILL_POOLS[1], 2))
             )
             
-            weights = WeightPolicy(
-                gpa_weight=round(random.uniform(0.2, 0.3), 2),
-                skill_weight=round(random.uniform(0.5, 0.6), 2),
-                communication_weight=round(random.uniform(0.1, 0.2), 2)
+            weights = WeightPolicy.model_construct(
+                gpa_weight=round(self._uniform(0.2, 0.3), 2),
+                skill_weight=round(self._uniform(0.5, 0.6), 2),
+                communication_weight=round(self._uniform(0.1, 0.2), 2)
             )
             
-            job = JobDescription(
+            job = JobDescription.model_construct(
                 company_id=company_id,
                 company_name=company_name,
                 company_type="Startup",
@@ -377,30 +637,29 @@ class SyntheticDataGenerator:
                 eligibility_rules=eligibility,
                 weight_policy=weights,
                 risk_tolerance="high",
-                open_positions=random.randint(2, 5)  # Startups: small teams
+                open_positions=self._randint(2, 5)  # Startups: small teams
             )
             jobs.append(job)
         
         # 3 Product companies - balanced
-        for i in range(3):
+        for company_name in product_names:
             company_id = f"C{len(jobs)+1:03d}"
-            company_name = random.choice(self.PRODUCT_COMPANIES)
-            role = random.choice(self.ROLES)
+            role = self._choice(self.ROLES)
             
-            eligibility = EligibilityRules(
-                min_cgpa=round(random.uniform(7.0, 7.5), 1),
-                max_backlogs=random.choice([0, 1]),
-                mandatory_skills=random.sample(["DSA", "Python", "Java", "C++"], 2),
-                preferred_skills=random.sample(["React", "SQL", "Git"], 2)
+            eligibility = EligibilityRules.model_construct(
+                min_cgpa=round(self._uniform(7.0, 7.5), 1),
+                max_backlogs=self._choice([0, 1]),
+                mandatory_skills=tuple(self._sample(self.PRODUCT_SKILL_POOLS[0], 2)),
+                preferred_skills=tuple(self._sample(self.PRODUCT_SKILL_POOLS[1], 2))
             )
             
-            weights = WeightPolicy(
-                gpa_weight=round(random.uniform(0.3, 0.4), 2),
-                skill_weight=round(random.uniform(0.4, 0.5), 2),
-                communication_weight=round(random.uniform(0.2, 0.3), 2)
+            weights = WeightPolicy.model_construct(
+                gpa_weight=round(self._uniform(0.3, 0.4), 2),
+                skill_weight=round(self._uniform(0.4, 0.5), 2),
+                communication_weight=round(self._uniform(0.2, 0.3), 2)
             )
             
-            job = JobDescription(
+            job = JobDescription.model_construct(
                 company_id=company_id,
                 company_name=company_name,
                 company_type="Product",
@@ -408,30 +667,29 @@ class SyntheticDataGenerator:
                 eligibility_rules=eligibility,
                 weight_policy=weights,
                 risk_tolerance="medium",
-                open_positions=random.randint(5, 12)  # Product: moderate hiring
+                open_positions=self._randint(5, 12)  # Product: moderate hiring
             )
             jobs.append(job)
         
         # 2 Service companies - moderate
-        for i in range(2):
+        for company_name in service_names:
             company_id = f"C{len(jobs)+1:03d}"
-            company_name = random.choice(self.SERVICE_COMPANIES)
-            role = random.choice(self.ROLES)
+            role = self._choice(self.ROLES)
             
-            eligibility = EligibilityRules(
-                min_cgpa=round(random.uniform(6.5, 7.0), 1),
-                max_backlogs=random.choice([1, 2]),
-                mandatory_skills=random.sample(["Java", "Python", "SQL"], 2),
-                preferred_skills=random.sample(["React", "Angular", "DSA"], 2)
+            eligibility = EligibilityRules.model_construct(
+                min_cgpa=round(self._uniform(6.5, 7.0), 1),
+                max_backlogs=self._choice([1, 2]),
+                mandatory_skills=tuple(self._sample(self.SERVICE_SKILL_POOLS[0], 2)),
+                preferred_skills=tuple(self._sample(self.SERVICE_SKILL_POOLS[1], 2))
             )
             
-            weights = WeightPolicy(
+            weights = WeightPolicy.model_construct(
                 gpa_weight=0.3,
                 skill_weight=0.4,
                 communication_weight=0.3
             )
             
-            job = JobDescription(
+            job = JobDescription.model_construct(
                 company_id=company_id,
                 company_name=company_name,
                 company_type="Service",
@@ -439,7 +697,7 @@ class SyntheticDataGenerator:
                 eligibility_rules=eligibility,
                 weight_policy=weights,
                 risk_tolerance="medium",
-                open_positions=random.randint(15, 50)  # Service: mass hiring
+                open_positions=self._randint(15, 50)  # Service: mass hiring
             )
             jobs.append(job)
         
@@ -452,103 +710,50 @@ class SyntheticDataGenerator:
         log_count: int = 120
     ) -> List[PlacementLog]:
         """Generate 120 historical placement records with realistic patterns"""
-        logs = []
+        # Feature columns, built once
+        stu_cgpa = np.array([st.cgpa for st in students], dtype=np.float64)
+        stu_backlogs = np.array([st.active_backlogs for st in students], dtype=np.int64)
+        stu_trust = np.array([st.resume_trust_score for st in students], dtype=np.float64)
+        stu_comm = np.array([st.communication_score for st in students], dtype=np.int64)
+        stu_mock = np.array([st.mock_interview_score for st in students], dtype=np.int64)
+        job_min_cgpa = np.array([jb.eligibility_rules.min_cgpa for jb in jobs], dtype=np.float64)
+        job_max_backlogs = np.array([jb.eligibility_rules.max_backlogs for jb in jobs], dtype=np.int64)
         
-        for i in range(log_count):
-            student = random.choice(students)
-            job = random.choice(jobs)
-            
-            log_id = f"LOG{i+1:04d}"
-            
-            # Eligibility check
-            meets_cgpa = student.cgpa >= job.eligibility_rules.min_cgpa
-            meets_backlogs = student.active_backlogs <= job.eligibility_rules.max_backlogs
-            
-            # Skill match check
-            student_skills = {s.name for s in student.skills}
-            mandatory_match = sum(
-                1 for skill in job.eligibility_rules.mandatory_skills 
-                if skill in student_skills
-            )
-            mandatory_ratio = mandatory_match / len(job.eligibility_rules.mandatory_skills)
-            
-            # Decision logic
-            if not meets_cgpa:
-                shortlisted = False
-                interview_result = "rejected"
-                failure_reason = "cgpa"
-            
-            elif not meets_backlogs:
-                shortlisted = False
-                interview_result = "rejected"
-                failure_reason = "cgpa"
-            
-            elif mandatory_ratio < 0.5:
-                shortlisted = False
-                interview_result = "rejected"
-                failure_reason = "low_dsa"
-            
-            else:
-                # Shortlisted
-                shortlisted = True
-                
-                # Interview outcome based on:
-                # 1. Resume trust (fake skills fail more)
-                # 2. Communication score
-                # 3. Mock interview score
-                
-                success_probability = 0.3  # Base
-                
-                # Resume trust impact
-                if student.resume_trust_score >= 0.7:
-                    success_probability += 0.3
-                elif student.resume_trust_score >= 0.4:
-                    success_probability += 0.1
-                else:
-                    success_probability -= 0.2  # Fake skills penalize
-                
-                # Communication impact
-                if student.communication_score >= 8:
-                    success_probability += 0.2
-                elif student.communication_score >= 6:
-                    success_probability += 0.1
-                elif student.communication_score < 5:
-                    success_probability -= 0.2
-                
-                # Mock interview impact
-                if student.mock_interview_score >= 8:
-                    success_probability += 0.1
-                elif student.mock_interview_score < 5:
-                    success_probability -= 0.1
-                
-                # Random outcome
-                if random.random() < success_probability:
-                    interview_result = "selected"
-                    failure_reason = None
-                else:
-                    interview_result = "rejected"
-                    
-                    # Determine failure reason
-                    if student.resume_trust_score < 0.4:
-                        failure_reason = "fake_skill"
-                    elif student.communication_score < 6:
-                        failure_reason = "poor_communication"
-                    else:
-                        failure_reason = "low_dsa"
-                
-                # Small chance of no-show
-                if random.random() < 0.05:
-                    interview_result = "no_show"
-                    failure_reason = None
-            
-            log = PlacementLog(
-                log_id=log_id,
-                student_id=student.student_id,
-                company_id=job.company_id,
-                shortlisted=shortlisted,
-                interview_result=interview_result,
-                failure_reason=failure_reason,
-                timestamp=fake.date_time_between(start_date="-1y", end_date="now").isoformat()
+        # Mandatory skill coverage for every (student, job) pair, on the same case-insensitive
+        # skill bitmasks the matcher uses: popcount(student & job) indexes mandatory_ratios
+        rules = [jb.eligibility_rules for jb in jobs]
+        mandatory_ratio = np.array([
+            [r.mandatory_ratios[(st.skill_bits & r.mandatory_bits).bit_count()] for r in rules]
+            for st in students
+        ], dtype=np.float64).reshape(len(students), len(jobs))
+        
+        # All randomness drawn up front
+        stu_idx = self.rng.integers(0, len(students), log_count)
+        job_idx = self.rng.integers(0, len(jobs), log_count)
+        outcome_draw = self.rng.random(log_count)
+        noshow_draw = self.rng.random(log_count)
+        
+        shortlisted, result, reason = _simulate_outcomes(
+            stu_idx, job_idx,
+            stu_cgpa, stu_backlogs, stu_trust, stu_comm, stu_mock,
+            job_min_cgpa, job_max_backlogs, mandatory_ratio,
+            outcome_draw, noshow_draw
+        )
+        
+        timestamps = self._batch_timestamps(log_count)
+        
+        logs = []
+        for i, (si, ji, short, res, why, timestamp) in enumerate(zip(
+            stu_idx.tolist(), job_idx.tolist(), shortlisted.tolist(), result.tolist(), reason.tolist(), timestamps
+        )):
+            log = PlacementLog.model_construct(
+                log_id=f"LOG{i+1:04d}",
+                student_id=students[si].student_id,
+                company_id=jobs[ji].company_id,
+                shortlisted=short,
+                interview_result=RESULT_LABELS[res],
+                failure_reason=FAILURE_REASON_LABELS[why] if why >= 0 else None,
+                timestamp=timestamp
             )
             logs.append(log)
         
@@ -557,21 +762,50 @@ class SyntheticDataGenerator:
 
 # ==================== DATA EXPORT/IMPORT ====================
 
-def save_to_json(students: List[StudentProfile], jobs: List[JobDescription], logs: List[PlacementLog]):
-    """Save generated data to JSON files"""
-    
-    students_data = [s.model_dump() for s in students]
-    jobs_data = [j.model_dump() for j in jobs]
-    logs_data = [l.model_dump() for l in logs]
-    
-    with open('students.json', 'w', encoding='utf-8') as f:
-        json.dump(students_data, f, indent=2, ensure_ascii=False)
-    
-    with open('jobs.json', 'w', encoding='utf-8') as f:
-        json.dump(jobs_data, f, indent=2, ensure_ascii=False)
-    
-    with open('logs.json', 'w', encoding='utf-8') as f:
-        json.dump(logs_data, f, indent=2, ensure_ascii=False)
+# List adapters: serialize whole lists straight to JSON bytes (no intermediate dicts)
+_STUDENTS_ADAPTER = TypeAdapter(List[StudentProfile])
+_JOBS_ADAPTER = TypeAdapter(List[JobDescription])
+_LOGS_ADAPTER = TypeAdapter(List[PlacementLog])
+
+def _dumps(obj, pretty: bool = False) -> bytes:
+    """Serialize a single record to UTF-8 JSON bytes"""
+    if HAS_ORJSON:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0)
+    return json.dumps(obj, indent=2 if pretty else None, ensure_ascii=False).encode('utf-8')
+
+
+def _to_builtins(item):
+    """Convert a Pydantic model or msgspec Struct to plain Python objects"""
+    if hasattr(item, 'model_dump'):
+        return item.model_dump(mode='json')
+    if HAS_MSGSPEC and isinstance(item, msgspec.Struct):
+        return msgspec.to_builtins(item)
+    return item
+
+
+def _write_json(path: str, items, adapter: TypeAdapter, pretty: bool = False):
+    """Write a list as JSON: encoded in one pass and written with a single bulk write
+    (the whole payload is held in memory - fine for cohort-sized exports)"""
+    if items and isinstance(items[0], BaseModel):
+        data = adapter.dump_json(items, indent=2 if pretty else None)
+    elif items and HAS_MSGSPEC and isinstance(items[0], msgspec.Struct) and not pretty:
+        data = _MS_ENCODER.encode(items)
+    else:
+        data = _dumps([_to_builtins(item) for item in items], pretty)
+    Path(path).write_bytes(data)
+
+
+def save_to_json(
+    students: List[StudentProfile],
+    jobs: List[JobDescription],
+    logs: List[PlacementLog],
+    pretty: bool = False
+):
+    """Save generated data to JSON files (compact by default, pretty=True for human-readable output)"""
+    
+    _write_json('students.json', students, _STUDENTS_ADAPTER, pretty)
+    _write_json('jobs.json', jobs, _JOBS_ADAPTER, pretty)
+    _write_json('logs.json', logs, _LOGS_ADAPTER, pretty)
     
     print(f"[OK] Generated {len(students)} students -> students.json")
     print(f"[OK] Generated {len(jobs)} jobs -> jobs.json")
@@ -581,17 +815,104 @@ def save_to_json(students: List[StudentProfile], jobs: List[JobDescription], log
 def load_from_json() -> tuple:
     """Load data from JSON files"""
     try:
-        with open('students.json', 'r', encoding='utf-8') as f:
-            students_data = json.load(f)
-            students = [StudentProfile(**s) for s in students_data]
+        # Parse + validate in a single pydantic-core pass per file
+        with open('students.json', 'rb') as f:
+            students = _STUDENTS_ADAPTER.validate_json(f.read())
         
-        with open('jobs.json', 'r', encoding='utf-8') as f:
-            jobs_data = json.load(f)
-            jobs = [JobDescription(**j) for j in jobs_data]
+        with open('jobs.json', 'rb') as f:
+            jobs = _JOBS_ADAPTER.validate_json(f.read())
         
-        with open('logs.json', 'r', encoding='utf-8') as f:
-            logs_data = json.load(f)
-            logs = [PlacementLog(**l) for l in logs_data]
+        with open('logs.json', 'rb') as f:
+            logs = _LOGS_ADAPTER.validate_json(f.read())
+        
+        return students, jobs, logs
+    except FileNotFoundError as e:
+        print(f"❌ Error: {e}")
+        print("Run generate_data() first to create the data files.")
+        return [], [], []
+
+
+# ==================== MSGSPEC FAST PATH (OPTIONAL) ====================
+# Struct mirrors of the Pydantic models for bulk JSON decode + validation.
+# Pydantic stays the public model; structs are for internal read-heavy pipelines.
+
+if HAS_MSGSPEC:
+    class SkillEvidenceStruct(msgspec.Struct, gc=False, frozen=True, kw_only=True):
+        github: bool = False
+        projects: Annotated[int, msgspec.Meta(ge=0, le=5)] = 0
+        certifications: Annotated[int, msgspec.Meta(ge=0, le=3)] = 0
+        internship: bool = False
+
+    class SkillStruct(msgspec.Struct, gc=False, frozen=True):
+        name: str
+        claimed_level: str
+        evidence: SkillEvidenceStruct
+
+    class StudentStruct(msgspec.Struct, frozen=True):
+        student_id: str
+        name: str
+        branch: str
+        cgpa: Annotated[float, msgspec.Meta(ge=0.0, le=10.0)]
+        active_backlogs: Annotated[int, msgspec.Meta(ge=0, le=10)]
+        skills: List[SkillStruct]
+        communication_score: Annotated[int, msgspec.Meta(ge=1, le=10)]
+        mock_interview_score: Annotated[int, msgspec.Meta(ge=1, le=10)]
+        resume_trust_score: Annotated[float, msgspec.Meta(ge=0, le=1)]
+        email: str
+        phone: str
+
+    class EligibilityRulesStruct(msgspec.Struct, gc=False, frozen=True):
+        min_cgpa: Annotated[float, msgspec.Meta(ge=6.0, le=8.5)]
+        max_backlogs: Annotated[int, msgspec.Meta(ge=0, le=2)]
+        mandatory_skills: List[str]
+        preferred_skills: List[str]
+
+    class WeightPolicyStruct(msgspec.Struct, gc=False, frozen=True, kw_only=True):
+        gpa_weight: Annotated[float, msgspec.Meta(ge=0.2, le=0.5)]
+        skill_weight: Annotated[float, msgspec.Meta(ge=0.3, le=0.6)]
+        communication_weight: Annotated[float, msgspec.Meta(ge=0.1, le=0.3)]
+        mock_interview_weight: Annotated[float, msgspec.Meta(ge=0.0, le=0.2)] = 0.1
+
+    class JobStruct(msgspec.Struct, frozen=True, kw_only=True):
+        company_id: str
+        company_name: str
+        company_type: str
+        role: str
+        eligibility_rules: EligibilityRulesStruct
+        weight_policy: WeightPolicyStruct
+        risk_tolerance: str
+        open_positions: Annotated[int, msgspec.Meta(ge=1, le=50)] = 5
+
+    class PlacementLogStruct(msgspec.Struct, gc=False, frozen=True, kw_only=True):
+        log_id: str
+        student_id: str
+        company_id: str
+        shortlisted: bool
+        interview_result: str
+        failure_reason: Optional[str] = None
+        timestamp: datetime
+
+    # Encoders/decoders are reusable and cached at module scope
+    _MS_ENCODER = msgspec.json.Encoder()
+    _STUDENTS_DECODER = msgspec.json.Decoder(List[StudentStruct])
+    _JOBS_DECODER = msgspec.json.Decoder(List[JobStruct])
+    _LOGS_DECODER = msgspec.json.Decoder(List[PlacementLogStruct])
+
+
+def load_structs_from_json() -> tuple:
+    """Load data as msgspec Structs (falls back to Pydantic models if msgspec is missing)"""
+    if not HAS_MSGSPEC:
+        return load_from_json()
+    
+    try:
+        with open('students.json', 'rb') as f:
+            students = _STUDENTS_DECODER.decode(f.read())
+        
+        with open('jobs.json', 'rb') as f:
+            jobs = _JOBS_DECODER.decode(f.read())
+        
+        with open('logs.json', 'rb') as f:
+            logs = _LOGS_DECODER.decode(f.read())
         
         return students, jobs, logs
     except FileNotFoundError as e:
@@ -629,18 +950,31 @@ def generate_data():
     print("✨ Data Generation Complete!")
     print("=" * 70)
     
+    # Summary columns: one pass over students and one over logs, then boolean-mask counts
+    cgpas, backlogs, trust = np.array(
+        [(s.cgpa, s.active_backlogs, s.resume_trust_score) for s in students], dtype=np.float64
+    ).reshape(-1, 3).T
+    reasons = Counter()
+    log_shortlisted = np.empty(len(logs), dtype=bool)
+    log_results = np.empty(len(logs), dtype=object)
+    for i, log in enumerate(logs):
+        log_shortlisted[i] = log.shortlisted
+        log_results[i] = log.interview_result
+        if log.failure_reason:
+            reasons[log.failure_reason] += 1
+    
     print("\n📈 Student Distribution:")
-    star = sum(1 for s in students if s.cgpa >= 8.5 and s.active_backlogs == 0)
-    average = sum(1 for s in students if 7.0 <= s.cgpa < 8.5)
-    weak = sum(1 for s in students if s.cgpa < 7.0 or s.active_backlogs > 0)
+    star = int(((cgpas >= 8.5) & (backlogs == 0)).sum())
+    average = int(((cgpas >= 7.0) & (cgpas < 8.5)).sum())
+    weak = int(((cgpas < 7.0) | (backlogs > 0)).sum())
     print(f"   ⭐ Star Students (CGPA ≥ 8.5, No Backlogs): {star}")
     print(f"   📚 Average Students (CGPA 7.0-8.5): {average}")
     print(f"   ⚠️  Weak Students (CGPA < 7.0 or Backlogs): {weak}")
     
     print("\n📊 Resume Credibility:")
-    high_trust = sum(1 for s in students if s.resume_trust_score >= 0.7)
-    medium_trust = sum(1 for s in students if 0.4 <= s.resume_trust_score < 0.7)
-    low_trust = sum(1 for s in students if s.resume_trust_score < 0.4)
+    high_trust = int((trust >= 0.7).sum())
+    medium_trust = int(((trust >= 0.4) & (trust < 0.7)).sum())
+    low_trust = int((trust < 0.4).sum())
     print(f"   ✅ HIGH Credibility (≥0.7): {high_trust} students")
     print(f"   ⚠️  MEDIUM Credibility (0.4-0.7): {medium_trust} students")
     print(f"   ❌ LOW Credibility (<0.4): {low_trust} students - SKILL INFLATION DETECTED")
@@ -652,21 +986,16 @@ def generate_data():
     print(f"   🔧 Service (Moderate CGPA ≥ 6.5): 2 companies")
     
     print("\n📝 Placement Outcomes:")
-    shortlisted = sum(1 for l in logs if l.shortlisted)
-    selected = sum(1 for l in logs if l.interview_result == "selected")
-    rejected = sum(1 for l in logs if l.interview_result == "rejected")
+    shortlisted = int(log_shortlisted.sum())
+    selected = int((log_results == "selected").sum())
+    rejected = int((log_results == "rejected").sum())
     print(f"   📋 Total Attempts: {len(logs)}")
     print(f"   ✅ Shortlisted: {shortlisted} ({shortlisted/len(logs)*100:.1f}%)")
     print(f"   🎉 Selected: {selected} ({selected/len(logs)*100:.1f}%)")
     print(f"   ❌ Rejected: {rejected} ({rejected/len(logs)*100:.1f}%)")
     
     print("\n🔍 Top Rejection Reasons:")
-    reasons = {}
-    for log in logs:
-        if log.failure_reason:
-            reasons[log.failure_reason] = reasons.get(log.failure_reason, 0) + 1
-    
-    for reason, count in sorted(reasons.items(), key=lambda x: x[1], reverse=True):
+    for reason, count in reasons.most_common(10):
         print(f"   - {reason}: {count} ({count/len(logs)*100:.1f}%)")
     
     print("\n" + "=" * 70)
@@ -4,16 +4,53 @@ Handles all database connections and CRUD operations
 """
 
 import psycopg2
-from psycopg2.extras import RealDictCursor, Json
+from psycopg2.extras import (
+    Json, execute_values, register_default_json, register_default_jsonb
+)
+from psycopg2.pool import ThreadedConnectionPool
+from psycopg2.extensions import connection as PGConnection
+from contextlib import contextmanager
+import csv
+import io
 import json
-from typing import List, Optional
-from data_engine import StudentProfile, JobDescription, PlacementLog
-from pydantic import ValidationError
+import logging
+import select
+import threading
+import numpy as np
+from datetime import datetime
+from typing import Iterator, List, Optional, Tuple
+from data_engine import (
+    StudentProfile, JobDescription, PlacementLog,
+    Skill, SkillEvidence, EligibilityRules, WeightPolicy
+)
+from pydantic import TypeAdapter, ValidationError
 import os
 from dotenv import load_dotenv
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+try:
+    import pyarrow as pa
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+try:
+    import psycopg
+    from psycopg.types.json import Jsonb, set_json_dumps, set_json_loads
+    from psycopg_pool import AsyncConnectionPool
+    HAS_PSYCOPG3 = True
+except ImportError:
+    HAS_PSYCOPG3 = False
+
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
 # Database Configuration
 DB_CONFIG = {
     "host": os.getenv("DB_HOST", "localhost"),
@@ -23,325 +60,1068 @@ DB_CONFIG = {
     "port": os.getenv("DB_PORT", "5432")
 }
 
+# Local connections go over a UNIX domain socket when one is found (no TCP loopback)
+LOCAL_HOSTS = {"localhost", "127.0.0.1", "::1"}
+DEFAULT_SOCKET_DIR = "/var/run/postgresql"
+
+# Rows per multi-row INSERT statement in bulk saves
+BULK_PAGE_SIZE = 500
+
+# Bulk log saves above this size go through COPY instead of multi-row INSERT
+COPY_THRESHOLD = 1000
+
+# Rows fetched per round trip by server-side (named) cursors
+ITER_SIZE = 1000
+
+# Students table - matches StudentProfile model
+_STUDENTS_DDL = """
+    CREATE TABLE IF NOT EXISTS students (
+        student_id VARCHAR(10) PRIMARY KEY,
+        name VARCHAR(100) NOT NULL,
+        branch VARCHAR(10) NOT NULL,
+        cgpa DECIMAL(4,2) NOT NULL CHECK (cgpa BETWEEN 0.0 AND 10.0),
+        active_backlogs INTEGER DEFAULT 0 CHECK (active_backlogs BETWEEN 0 AND 10),
+        skills JSONB NOT NULL,
+        communication_score INTEGER CHECK (communication_score BETWEEN 1 AND 10),
+        mock_interview_score INTEGER CHECK (mock_interview_score BETWEEN 1 AND 10),
+        resume_trust_score DECIMAL(3,2) CHECK (resume_trust_score BETWEEN 0 AND 1),
+        email VARCHAR(255),
+        phone VARCHAR(20),
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    );
+"""
+
+# Companies/Jobs table - matches JobDescription model
+_COMPANIES_DDL = """
+    CREATE TABLE IF NOT EXISTS companies (
+        company_id VARCHAR(20) PRIMARY KEY,
+        company_name VARCHAR(100) NOT NULL,
+        company_type VARCHAR(20) NOT NULL,
+        role VARCHAR(100) NOT NULL,
+        open_positions INTEGER DEFAULT 5,
+        risk_tolerance VARCHAR(20),
+        eligibility_rules JSONB NOT NULL,
+        weight_policy JSONB NOT NULL,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    );
+"""
+
+# Placement Logs table - matches PlacementLog model
+_LOGS_DDL = """
+    CREATE TABLE IF NOT EXISTS placement_logs (
+        log_id VARCHAR(20) PRIMARY KEY,
+        student_id VARCHAR(10),
+        company_id VARCHAR(20),
+        shortlisted BOOLEAN,
+        interview_result VARCHAR(20),
+        failure_reason VARCHAR(100),
+        timestamp TIMESTAMPTZ,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    );
+"""
+
+# Migrate pre-existing VARCHAR timestamps in place (no-op once converted)
+_LOGS_TIMESTAMP_MIGRATION = """
+    DO $$
+    BEGIN
+        IF EXISTS (
+            SELECT 1 FROM information_schema.columns
+            WHERE table_name = 'placement_logs' AND column_name = 'timestamp'
+              AND data_type <> 'timestamp with time zone'
+        ) THEN
+            ALTER TABLE placement_logs
+                ALTER COLUMN timestamp TYPE TIMESTAMPTZ USING timestamp::timestamptz;
+        END IF;
+    END $$;
+"""
+
+# Permanent stage tables left by older bulk_replace_all versions (stages are temp tables now)
+_DROP_LEGACY_STAGES_DDL = """
+    DROP TABLE IF EXISTS students_stage, companies_stage, placement_logs_stage;
+"""
+
+# Statement-level trigger: any write to companies (incl. bulk/TRUNCATE) notifies listeners
+COMPANIES_CHANNEL = "companies_changed"
+_COMPANIES_NOTIFY_DDL = f"""
+    CREATE OR REPLACE FUNCTION notify_companies_changed() RETURNS trigger AS $$
+    BEGIN
+        PERFORM pg_notify('{COMPANIES_CHANNEL}', TG_OP);
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql;
+    -- Created once: DROP/CREATE TRIGGER would take an ACCESS EXCLUSIVE lock on every run
+    DO $$
+    BEGIN
+        IF NOT EXISTS (
+            SELECT 1 FROM pg_trigger
+            WHERE tgname = 'companies_changed' AND tgrelid = 'companies'::regclass
+        ) THEN
+            CREATE TRIGGER companies_changed
+                AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON companies
+                FOR EACH STATEMENT EXECUTE FUNCTION notify_companies_changed();
+        END IF;
+    END $$;
+"""
+
+# Indexes for better performance
+_INDEX_DDLS = (
+    "CREATE INDEX IF NOT EXISTS idx_students_branch ON students(branch);",
+    "CREATE INDEX IF NOT EXISTS idx_students_cgpa ON students(cgpa);",
+    "CREATE INDEX IF NOT EXISTS idx_companies_type ON companies(company_type);",
+    "CREATE INDEX IF NOT EXISTS idx_logs_student ON placement_logs(student_id);",
+    "CREATE INDEX IF NOT EXISTS idx_logs_result ON placement_logs(interview_result);",
+    "CREATE INDEX IF NOT EXISTS idx_logs_ts ON placement_logs(timestamp DESC);",
+    # jsonb_path_ops: smaller/faster than the default opclass for @> containment
+    "CREATE INDEX IF NOT EXISTS idx_students_skills ON students USING GIN (skills jsonb_path_ops);",
+)
+
+# Whole schema as one multi-statement string - a single execute / round trip
+DDL = "\n".join([
+    _STUDENTS_DDL, _COMPANIES_DDL, _LOGS_DDL, _LOGS_TIMESTAMP_MIGRATION, _DROP_LEGACY_STAGES_DDL, _COMPANIES_NOTIFY_DDL, *_INDEX_DDLS
+])
+
+
+# ==================== SQL ====================
+# All statement text is built once at import time - no per-call string building
+
+# Model field names = explicit SELECT column order; rows stay plain tuples
+_STUDENT_FIELDS = tuple(StudentProfile.model_fields)
+_COMPANY_FIELDS = tuple(JobDescription.model_fields)
+_LOG_FIELDS = tuple(PlacementLog.model_fields)
+
+# Positions of the nested JSONB columns within those tuples
+_SKILLS_IDX = _STUDENT_FIELDS.index('skills')
+_RULES_IDX = _COMPANY_FIELDS.index('eligibility_rules')
+_POLICY_IDX = _COMPANY_FIELDS.index('weight_policy')
+
+# Write column order (matches the _*_row tuples)
+_STUDENT_COLS = (
+    "student_id", "name", "branch", "cgpa", "active_backlogs",
+    "communication_score", "mock_interview_score", "resume_trust_score",
+    "email", "phone", "skills"
+)
+_COMPANY_COLS = (
+    "company_id", "company_name", "company_type", "role",
+    "open_positions", "risk_tolerance", "eligibility_rules", "weight_policy"
+)
+_LOG_COLS = (
+    "log_id", "student_id", "company_id", "shortlisted",
+    "interview_result", "failure_reason", "timestamp"
+)
+
+# (table, column list, ORDER BY) for the model reads
+_READ_SPECS = {
+    "students": ("students", ", ".join(_STUDENT_FIELDS), "student_id"),
+    "companies": ("companies", ", ".join(_COMPANY_FIELDS), "company_name"),
+    "logs": ("placement_logs", ", ".join(_LOG_FIELDS), "timestamp DESC")
+}
+_SQL_SELECT = {
+    spec: f"SELECT {columns} FROM {table} ORDER BY {order}"
+    for spec, (table, columns, order) in _READ_SPECS.items()
+}
+
+# Each table aggregated to one JSON array of positional rows (psycopg2 has no multi-result sets)
+_SQL_SELECT_ALL = "SELECT " + ",\n".join(
+    f"(SELECT COALESCE(json_agg(json_build_array({columns}) ORDER BY {order}), '[]') FROM {table})"
+    for table, columns, order in _READ_SPECS.values()
+)
+
+# Skill search - @> containment is served by the idx_students_skills GIN index
+_SQL_SELECT_STUDENTS_BY_SKILL = (
+    "SELECT {} FROM students WHERE skills @> %s ORDER BY student_id".format(_READ_SPECS["students"][1])
+)
+
+# Everything but the skills JSONB blob - list/grid views never detoast it
+_STUDENT_SUMMARY_COLS = tuple(c for c in _STUDENT_FIELDS if c != "skills")
+_SQL_SELECT_STUDENT_SUMMARIES = (
+    f"SELECT {', '.join(_STUDENT_SUMMARY_COLS)} FROM students ORDER BY student_id"
+)
+
+# Numeric student columns for analytics (column name -> numpy dtype)
+_STUDENT_NUMERIC_COLS = {
+    "cgpa": np.float64,
+    "active_backlogs": np.int32,
+    "communication_score": np.int32,
+    "mock_interview_score": np.int32,
+    "resume_trust_score": np.float64
+}
+_SQL_SELECT_STUDENT_NUMERIC = (
+    f"SELECT student_id, {', '.join(_STUDENT_NUMERIC_COLS)} FROM students ORDER BY student_id"
+)
+
+_SQL_RESULT_COUNTS = """
+    SELECT interview_result, COUNT(*)
+    FROM placement_logs
+    GROUP BY interview_result
+"""
+_SQL_SHORTLIST_RATIO = """
+    SELECT company_id, AVG(shortlisted::int)::float
+    FROM placement_logs
+    GROUP BY company_id
+"""
+
+# Upsert tails
+_STUDENT_CONFLICT = """
+    ON CONFLICT (student_id)
+    DO UPDATE SET
+        {},
+        updated_at = CURRENT_TIMESTAMP
+""".format(",\n        ".join(f"{c} = EXCLUDED.{c}" for c in _STUDENT_COLS[1:]))
+_COMPANY_CONFLICT = """
+    ON CONFLICT (company_id)
+    DO UPDATE SET
+        {}
+""".format(",\n        ".join(f"{c} = EXCLUDED.{c}" for c in _COMPANY_COLS[1:]))
+_LOG_CONFLICT = """
+    ON CONFLICT (log_id) DO NOTHING
+"""
+
+# Multi-row INSERTs for execute_values
+_SQL_INSERT_STUDENTS = f"INSERT INTO students ({', '.join(_STUDENT_COLS)}) VALUES %s" + _STUDENT_CONFLICT
+_SQL_INSERT_COMPANIES = f"INSERT INTO companies ({', '.join(_COMPANY_COLS)}) VALUES %s" + _COMPANY_CONFLICT
+_SQL_INSERT_LOGS = f"INSERT INTO placement_logs ({', '.join(_LOG_COLS)}) VALUES %s" + _LOG_CONFLICT
+
+# Single-row (%s placeholder) upserts for psycopg 3 executemany / pipeline mode
+_SQL_UPSERT_STUDENT = (
+    f"INSERT INTO students ({', '.join(_STUDENT_COLS)}) "
+    f"VALUES ({', '.join(['%s'] * len(_STUDENT_COLS))})" + _STUDENT_CONFLICT
+)
+_SQL_UPSERT_COMPANY = (
+    f"INSERT INTO companies ({', '.join(_COMPANY_COLS)}) "
+    f"VALUES ({', '.join(['%s'] * len(_COMPANY_COLS))})" + _COMPANY_CONFLICT
+)
+_SQL_INSERT_LOG = (
+    f"INSERT INTO placement_logs ({', '.join(_LOG_COLS)}) "
+    f"VALUES ({', '.join(['%s'] * len(_LOG_COLS))})" + _LOG_CONFLICT
+)
+
+# Server-side prepared statements for single-row saves (PREPAREd once per connection).
+# Note: needs session pooling if PgBouncer is used (transaction mode drops them).
+_PREPARED_SPECS = (
+    ("save_student_v1", "students", _STUDENT_COLS, _STUDENT_CONFLICT,
+     "varchar, varchar, varchar, numeric, integer, integer, integer, numeric, varchar, varchar, jsonb"),
+    ("save_company_v1", "companies", _COMPANY_COLS, _COMPANY_CONFLICT,
+     "varchar, varchar, varchar, varchar, integer, varchar, jsonb, jsonb"),
+    ("save_log_v2", "placement_logs", _LOG_COLS, _LOG_CONFLICT,
+     "varchar, varchar, varchar, boolean, varchar, varchar, timestamptz"),
+)
+PREPARED_STATEMENTS = {
+    name: (
+        f"PREPARE {name} ({types}) AS "
+        f"INSERT INTO {table} ({', '.join(cols)}) "
+        f"VALUES ({', '.join(f'${i}' for i in range(1, len(cols) + 1))})" + conflict
+    )
+    for name, table, cols, conflict, types in _PREPARED_SPECS
+}
+_SQL_EXECUTE = {
+    name: f"EXECUTE {name} ({', '.join(['%s'] * len(cols))})"
+    for name, _, cols, _, _ in _PREPARED_SPECS
+}
+
+# Large log batches: COPY into a temp table, then one INSERT ... SELECT
+# (the staging table keeps ON CONFLICT DO NOTHING semantics - COPY has no conflict clause)
+_SQL_CREATE_LOGS_STAGE = """
+    CREATE TEMP TABLE placement_logs_stage
+    (LIKE placement_logs INCLUDING DEFAULTS) ON COMMIT DROP
+"""
+# CSV COPY reads an unquoted empty field as NULL; an explicit marker keeps "" an empty string
+COPY_NULL = r"\N"
+_COPY_CSV_OPTIONS = f"WITH (FORMAT CSV, NULL '{COPY_NULL}')"
+_SQL_COPY_LOGS_STAGE = f"COPY placement_logs_stage ({', '.join(_LOG_COLS)}) FROM STDIN {_COPY_CSV_OPTIONS}"
+_SQL_INSERT_LOGS_FROM_STAGE = (
+    f"INSERT INTO placement_logs ({', '.join(_LOG_COLS)}) "
+    f"SELECT {', '.join(_LOG_COLS)} FROM placement_logs_stage" + _LOG_CONFLICT
+)
+
+# bulk_replace_all: (create stage, COPY into stage, move into table) per table, FK-safe order
+# Temp stages are rebuilt from the live table each time and dropped at commit
+_REPLACE_STEPS = tuple(
+    (
+        f"CREATE TEMP TABLE {table}_stage (LIKE {table} INCLUDING DEFAULTS) ON COMMIT DROP",
+        f"COPY {table}_stage ({', '.join(cols)}) FROM STDIN {_COPY_CSV_OPTIONS}",
+        f"INSERT INTO {table} ({', '.join(cols)}) SELECT {', '.join(cols)} FROM {table}_stage "
+        f"ON CONFLICT ({cols[0]}) DO NOTHING"
+    )
+    for table, cols in (("students", _STUDENT_COLS), ("companies", _COMPANY_COLS), ("placement_logs", _LOG_COLS))
+)
+
+_SQL_ASYNC_COMMIT = "SET LOCAL synchronous_commit = OFF"
+_SQL_TRUNCATE_ALL = "TRUNCATE TABLE placement_logs, companies, students CASCADE"
+_SQL_TRUNCATE_RESTART = "TRUNCATE TABLE placement_logs, companies, students RESTART IDENTITY CASCADE"
+_SQL_VERSION = "SELECT version()"
+
+# COPY round-trip check: an empty string must come back as "", None as NULL
+_SQL_CREATE_COPY_CHECK = "CREATE TEMP TABLE copy_roundtrip_check (empty_text TEXT, null_text TEXT) ON COMMIT DROP"
+_SQL_COPY_CHECK = f"COPY copy_roundtrip_check (empty_text, null_text) FROM STDIN {_COPY_CSV_OPTIONS}"
+_SQL_SELECT_COPY_CHECK = "SELECT empty_text, null_text FROM copy_roundtrip_check"
+_SQL_CREATE_INDEXES_ONLINE = tuple(
+    ddl.replace("CREATE INDEX", "CREATE INDEX CONCURRENTLY", 1) for ddl in _INDEX_DDLS
+)
+
+
+# NUMERIC -> float at the driver level (trusted reads skip Pydantic's coercion)
+DEC2FLOAT = psycopg2.extensions.new_type(
+    psycopg2.extensions.DECIMAL.values,
+    'DEC2FLOAT',
+    lambda value, cursor: float(value) if value is not None else None
+)
+
+# JSON/JSONB columns (skills, rules, policy, json_agg results) decoded with orjson
+if HAS_ORJSON:
+    register_default_json(loads=orjson.loads, globally=True)
+    register_default_jsonb(loads=orjson.loads, globally=True)
+    if HAS_PSYCOPG3:
+        set_json_dumps(orjson.dumps)
+        set_json_loads(orjson.loads)
+
+# Batch validators: one core-schema pass per page of rows
+_STUDENT_LIST = TypeAdapter(List[StudentProfile])
+_COMPANY_LIST = TypeAdapter(List[JobDescription])
+_LOG_LIST = TypeAdapter(List[PlacementLog])
+
+# Skill serializers - one core-schema dump per student / per bulk batch
+_SKILLS_ADAPTER = TypeAdapter(Tuple[Skill, ...])
+_SKILL_LISTS_ADAPTER = TypeAdapter(List[Tuple[Skill, ...]])
+
+
+def _records(fields: tuple, rows) -> List[dict]:
+    """Positional rows -> field dicts for batch validation"""
+    return [dict(zip(fields, row)) for row in rows]
+
+
+def _construct_student(row: tuple) -> StudentProfile:
+    """Build a StudentProfile from a trusted positional DB row without validation"""
+    values = dict(zip(_STUDENT_FIELDS, row))
+    values['skills'] = tuple(
+        Skill.model_construct(
+            name=sk['name'],
+            claimed_level=sk['claimed_level'],
+            evidence=SkillEvidence.model_construct(**sk['evidence'])
+        )
+        for sk in row[_SKILLS_IDX]
+    )
+    return StudentProfile.model_construct(**values)
+
+
+def _construct_company(row: tuple) -> JobDescription:
+    """Build a JobDescription from a trusted positional DB row without validation"""
+    values = dict(zip(_COMPANY_FIELDS, row))
+    rules = dict(row[_RULES_IDX])
+    rules['mandatory_skills'] = tuple(rules['mandatory_skills'])
+    rules['preferred_skills'] = tuple(rules['preferred_skills'])
+    values['eligibility_rules'] = EligibilityRules.model_construct(**rules)
+    values['weight_policy'] = WeightPolicy.model_construct(**row[_POLICY_IDX])
+    return JobDescription.model_construct(**values)
+
+
+def _construct_log(row: tuple) -> PlacementLog:
+    """Build a PlacementLog from a trusted positional DB row without validation"""
+    values = dict(zip(_LOG_FIELDS, row))
+    if isinstance(values['timestamp'], str):  # json_agg rows carry ISO strings
+        values['timestamp'] = datetime.fromisoformat(values['timestamp'])
+    return PlacementLog.model_construct(**values)
+
+
+def _models_from_rows(student_rows, company_rows, log_rows, trusted: bool) -> tuple:
+    """Positional rows for all three tables -> (students, companies, logs) models"""
+    if trusted:
+        return (
+            [_construct_student(row) for row in student_rows],
+            [_construct_company(row) for row in company_rows],
+            [_construct_log(row) for row in log_rows]
+        )
+    
+    try:
+        students = _STUDENT_LIST.validate_python(_records(_STUDENT_FIELDS, student_rows))
+        companies = _COMPANY_LIST.validate_python(_records(_COMPANY_FIELDS, company_rows))
+        logs = _LOG_LIST.validate_python(_records(_LOG_FIELDS, log_rows))
+    except ValidationError as e:
+        raise Exception(f"Failed to fetch data: {e}")
+    
+    return students, companies, logs
+
+
+class OJson(Json):
+    """JSONB adapter that serializes with orjson when installed"""
+    
+    def dumps(self, obj):
+        if HAS_ORJSON:
+            return orjson.dumps(obj).decode('utf-8')
+        return json.dumps(obj)
+
+
+class PreparingConnection(PGConnection):
+    """psycopg2 connection that remembers which statements it has PREPAREd"""
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.prepared = set()
+        psycopg2.extensions.register_type(DEC2FLOAT, self)
+
+
+def _csv_cell(v):
+    """One COPY CSV field: None -> the NULL marker, Json -> its text, anything else as is"""
+    if v is None:
+        return COPY_NULL
+    if isinstance(v, Json):
+        return v.dumps(v.adapted)
+    return v
+
+
+def _csv_buffer(rows) -> io.StringIO:
+    """Render row tuples as an in-memory CSV stream for COPY ... FROM STDIN (_COPY_CSV_OPTIONS)"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for row in rows:
+        writer.writerow([_csv_cell(v) for v in row])
+    buffer.seek(0)
+    return buffer
+
+
+def _execute_prepared(cursor, name: str, params: tuple):
+    """EXECUTE a named statement, PREPAREing it first on this connection if needed"""
+    conn = cursor.connection
+    if name not in conn.prepared:
+        cursor.execute(PREPARED_STATEMENTS[name])
+        conn.prepared.add(name)  # prepared statements survive rollbacks
+    cursor.execute(_SQL_EXECUTE[name], params)
+
+
+# Shared connection pool (created lazily, reused by every DatabaseManager)
+POOL_MIN_CONN = int(os.getenv("DB_POOL_MIN", "1"))
+POOL_MAX_CONN = int(os.getenv("DB_POOL_MAX", "10"))
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def _get_pool(config: dict) -> ThreadedConnectionPool:
+    """Return the shared connection pool, creating it on first use"""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = ThreadedConnectionPool(
+                    POOL_MIN_CONN, POOL_MAX_CONN, connection_factory=PreparingConnection, **config
+                )
+    return _pool
+
+
+# In-process companies cache, invalidated by NOTIFY on the companies channel
+_companies_cache = None
+_cache_generation = 0
+_cache_lock = threading.Lock()
+_listener = None
+LISTEN_TIMEOUT = 5.0
+
+
+def _invalidate_companies():
+    """Drop the cached companies list (next read hits the database)"""
+    global _companies_cache, _cache_generation
+    with _cache_lock:
+        _companies_cache = None
+        _cache_generation += 1
+
+
+def _listen_companies(config: dict):
+    """Background loop: LISTEN on a dedicated connection, invalidate on every notification"""
+    warned = False
+    while True:
+        try:
+            conn = psycopg2.connect(**config)
+            conn.autocommit = True
+            with conn.cursor() as cursor:
+                cursor.execute(f"LISTEN {COMPANIES_CHANNEL}")
+            # Writes missed while (re)connecting would leave the cache stale
+            _invalidate_companies()
+            warned = False
+            while True:
+                if select.select([conn], [], [], LISTEN_TIMEOUT) == ([], [], []):
+                    continue
+                conn.poll()
+                if conn.notifies:
+                    conn.notifies.clear()
+                    _invalidate_companies()
+        except psycopg2.Error as e:
+            if not warned:
+                logger.warning("Companies listener reconnecting: %s", e)
+                warned = True
+            _invalidate_companies()
+            threading.Event().wait(LISTEN_TIMEOUT)
+
+
+def _ensure_listener(config: dict):
+    """Start the companies LISTEN thread once per process"""
+    global _listener
+    if _listener is None:
+        with _cache_lock:
+            if _listener is None:
+                _listener = threading.Thread(
+                    target=_listen_companies, args=(config,), name="companies-listener", daemon=True
+                )
+                _listener.start()
+
+
+# Transport (UNIX socket or TCP) is resolved once per process and logged once
+_transport = None
+_transport_lock = threading.Lock()
+
+
+def _transport_config() -> dict:
+    """Copy of DB_CONFIG that points at a local UNIX socket when one exists (else TCP)"""
+    global _transport
+    if _transport is None:
+        with _transport_lock:
+            if _transport is None:
+                config = dict(DB_CONFIG)
+                socket_dir = os.getenv("DB_SOCKET_DIR")
+                if not socket_dir and config["host"] in LOCAL_HOSTS:
+                    socket_dir = DEFAULT_SOCKET_DIR
+                # libpq derives the socket file from the port, so the port is kept
+                if socket_dir and os.path.exists(os.path.join(socket_dir, f".s.PGSQL.{config['port']}")):
+                    config["host"] = socket_dir
+                    logger.info("Using UNIX socket transport: %s", socket_dir)
+                else:
+                    logger.info("Using TCP transport: %s:%s", config["host"], config["port"])
+                _transport = config
+    return dict(_transport)
+
 
 class DatabaseManager:
     """Manages PostgreSQL database operations"""
     
     def __init__(self):
-        self.config = DB_CONFIG
+        self.config = _transport_config()
     
+    @contextmanager
     def get_connection(self):
-        """Create and return a database connection"""
+        """Borrow a pooled connection: commits on success, rolls back on error, always returned"""
         try:
-            conn = psycopg2.connect(**self.config)
-            return conn
+            pool = _get_pool(self.config)
+            conn = pool.getconn()
         except psycopg2.Error as e:
             raise Exception(f"Database connection failed: {e}")
+        
+        try:
+            yield conn
+            conn.commit()
+        except BaseException:  # includes GeneratorExit from abandoned iter_* streams
+            conn.rollback()
+            raise
+        finally:
+            pool.putconn(conn)
+    
+    def close(self):
+        """Close every pooled connection (e.g. on shutdown)"""
+        global _pool
+        with _pool_lock:
+            if _pool is not None:
+                _pool.closeall()
+                _pool = None
     
     def create_tables(self):
         """Create all required tables"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
         try:
-            # Students table - matches StudentProfile model
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS students (
-                    student_id VARCHAR(10) PRIMARY KEY,
-                    name VARCHAR(100) NOT NULL,
-                    branch VARCHAR(10) NOT NULL,
-                    cgpa DECIMAL(4,2) NOT NULL CHECK (cgpa BETWEEN 0.0 AND 10.0),
-                    active_backlogs INTEGER DEFAULT 0 CHECK (active_backlogs BETWEEN 0 AND 10),
-                    skills JSONB NOT NULL,
-                    communication_score INTEGER CHECK (communication_score BETWEEN 1 AND 10),
-                    mock_interview_score INTEGER CHECK (mock_interview_score BETWEEN 1 AND 10),
-                    resume_trust_score DECIMAL(3,2) CHECK (resume_trust_score BETWEEN 0 AND 1),
-                    email VARCHAR(255),
-                    phone VARCHAR(20),
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
-            
-            # Companies/Jobs table - matches JobDescription model
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS companies (
-                    company_id VARCHAR(20) PRIMARY KEY,
-                    company_name VARCHAR(100) NOT NULL,
-                    company_type VARCHAR(20) NOT NULL,
-                    role VARCHAR(100) NOT NULL,
-                    open_positions INTEGER DEFAULT 5,
-                    risk_tolerance VARCHAR(20),
-                    eligibility_rules JSONB NOT NULL,
-                    weight_policy JSONB NOT NULL,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
-            
-            # Placement Logs table - matches PlacementLog model
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS placement_logs (
-                    log_id VARCHAR(20) PRIMARY KEY,
-                    student_id VARCHAR(10),
-                    company_id VARCHAR(20),
-                    shortlisted BOOLEAN,
-                    interview_result VARCHAR(20),
-                    failure_reason VARCHAR(100),
-                    timestamp VARCHAR(50),
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
-            
-            # Create indexes for better performance
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_students_branch ON students(branch)")
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_students_cgpa ON students(cgpa)")
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_companies_type ON companies(company_type)")
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_logs_student ON placement_logs(student_id)")
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_logs_result ON placement_logs(interview_result)")
+            with self.get_connection() as conn, conn.cursor() as cursor:
+                cursor.execute(DDL)
             
-            conn.commit()
             print("✅ Database tables created successfully!")
-            
         except psycopg2.Error as e:
-            conn.rollback()
             raise Exception(f"Failed to create tables: {e}")
-        finally:
-            cursor.close()
-            conn.close()
+    
+    def create_indexes_online(self):
+        """(Re)build indexes with CONCURRENTLY so populated tables stay writable"""
+        try:
+            with self.get_connection() as conn:
+                # CONCURRENTLY cannot run inside a transaction block
+                conn.autocommit = True
+                try:
+                    with conn.cursor() as cursor:
+                        for ddl in _SQL_CREATE_INDEXES_ONLINE:
+                            cursor.execute(ddl)
+                finally:
+                    conn.autocommit = False
+            
+            print("✅ Database indexes created successfully!")
+        except psycopg2.Error as e:
+            raise Exception(f"Failed to create indexes: {e}")
+    
+    @staticmethod
+    def _student_row(student: StudentProfile, skills: Optional[list] = None) -> tuple:
+        """Column values for an INSERT INTO students (skills: pre-dumped skill dicts)"""
+        if skills is None:
+            skills = _SKILLS_ADAPTER.dump_python(student.skills, mode='json')
+        return (
+            student.student_id,
+            student.name,
+            student.branch,
+            student.cgpa,
+            student.active_backlogs,
+            student.communication_score,
+            student.mock_interview_score,
+            student.resume_trust_score,
+            student.email,
+            student.phone,
+            OJson(skills)
+        )
+    
+    @classmethod
+    def _student_rows(cls, students: List[StudentProfile]) -> List[tuple]:
+        """Rows for a bulk students write, skills for the whole batch dumped in one pass"""
+        # One row per key: ON CONFLICT cannot touch the same row twice in a statement
+        unique = list({s.student_id: s for s in students}.values())
+        skill_lists = _SKILL_LISTS_ADAPTER.dump_python([s.skills for s in unique], mode='json')
+        return [cls._student_row(s, skills) for s, skills in zip(unique, skill_lists)]
+    
+    @staticmethod
+    def _company_row(company: JobDescription) -> tuple:
+        """Column values for an INSERT INTO companies"""
+        return (
+            company.company_id,
+            company.company_name,
+            company.company_type,
+            company.role,
+            company.open_positions,
+            company.risk_tolerance,
+            OJson(company.eligibility_rules.model_dump(mode='json')),
+            OJson(company.weight_policy.model_dump(mode='json'))
+        )
+    
+    @classmethod
+    def _company_rows(cls, companies: List[JobDescription]) -> List[tuple]:
+        """Rows for a bulk companies write, one per company_id"""
+        return [cls._company_row(c) for c in {c.company_id: c for c in companies}.values()]
+    
+    @staticmethod
+    def _log_row(log: PlacementLog) -> tuple:
+        """Column values for an INSERT INTO placement_logs"""
+        return (
+            log.log_id,
+            log.student_id,
+            log.company_id,
+            log.shortlisted,
+            log.interview_result,
+            log.failure_reason,
+            log.timestamp
+        )
     
     def save_student(self, student: StudentProfile):
         """Save or update a student record"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
         try:
-            cursor.execute("""
-                INSERT INTO students (
-                    student_id, name, branch, cgpa, active_backlogs,
-                    communication_score, mock_interview_score, resume_trust_score,
-                    email, phone, skills
-                ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                ON CONFLICT (student_id) 
-                DO UPDATE SET
-                    name = EXCLUDED.name,
-                    branch = EXCLUDED.branch,
-                    cgpa = EXCLUDED.cgpa,
-                    active_backlogs = EXCLUDED.active_backlogs,
-                    communication_score = EXCLUDED.communication_score,
-                    mock_interview_score = EXCLUDED.mock_interview_score,
-                    resume_trust_score = EXCLUDED.resume_trust_score,
-                    email = EXCLUDED.email,
-                    phone = EXCLUDED.phone,
-                    skills = EXCLUDED.skills,
-                    updated_at = CURRENT_TIMESTAMP
-            """, (
-                student.student_id,
-                student.name,
-                student.branch,
-                student.cgpa,
-                student.active_backlogs,
-                student.communication_score,
-                student.mock_interview_score,
-                student.resume_trust_score,
-                student.email,
-                student.phone,
-                Json([s.model_dump() for s in student.skills])
-            ))
-            
-            conn.commit()
+            with self.get_connection() as conn, conn.cursor() as cursor:
+                _execute_prepared(cursor, "save_student_v1", self._student_row(student))
         except psycopg2.Error as e:
-            conn.rollback()
             raise Exception(f"Failed to save student: {e}")
-        finally:
-            cursor.close()
-            conn.close()
     
     def save_company(self, company: JobDescription):
         """Save or update a company/job record"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
         try:
-            cursor.execute("""
-                INSERT INTO companies (
-                    company_id, company_name, company_type, role,
-                    open_positions, risk_tolerance, eligibility_rules, weight_policy
-                ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-                ON CONFLICT (company_id)
-                DO UPDATE SET
-                    company_name = EXCLUDED.company_name,
-                    company_type = EXCLUDED.company_type,
-                    role = EXCLUDED.role,
-                    open_positions = EXCLUDED.open_positions,
-                    risk_tolerance = EXCLUDED.risk_tolerance,
-                    eligibility_rules = EXCLUDED.eligibility_rules,
-                    weight_policy = EXCLUDED.weight_policy
-            """, (
-                company.company_id,
-                company.company_name,
-                company.company_type,
-                company.role,
-                company.open_positions,
-                company.risk_tolerance,
-                Json(company.eligibility_rules.model_dump()),
-                Json(company.weight_policy.model_dump())
-            ))
-            
-            conn.commit()
+            with self.get_connection() as conn, conn.cursor() as cursor:
+                _execute_prepared(cursor, "save_company_v1", self._company_row(company))
         except psycopg2.Error as e:
-            conn.rollback()
             raise Exception(f"Failed to save company: {e}")
         finally:
-            cursor.close()
-            conn.close()
+            _invalidate_companies()
     
     def save_log(self, log: PlacementLog):
         """Save a placement log record"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
         try:
-            cursor.execute("""
-                INSERT INTO placement_logs (
-                    log_id, student_id, company_id, shortlisted,
-                    interview_result, failure_reason, timestamp
-                ) VALUES (%s, %s, %s, %s, %s, %s, %s)
-                ON CONFLICT (log_id) DO NOTHING
-            """, (
-                log.log_id,
-                log.student_id,
-                log.company_id,
-                log.shortlisted,
-                log.interview_result,
-                log.failure_reason,
-                log.timestamp
-            ))
-            
-            conn.commit()
+            with self.get_connection() as conn, conn.cursor() as cursor:
+                _execute_prepared(cursor, "save_log_v2", self._log_row(log))
         except psycopg2.Error as e:
-            conn.rollback()
             raise Exception(f"Failed to save log: {e}")
-        finally:
-            cursor.close()
-            conn.close()
     
-    def get_all_students(self) -> List[StudentProfile]:
-        """Retrieve all students from database"""
-        conn = self.get_connection()
-        cursor = conn.cursor(cursor_factory=RealDictCursor)
+    def _stream(self, spec: str, fields: tuple, adapter: TypeAdapter, construct,
+                itersize: int, trusted: bool):
+        """Yield models page by page from a server-side (tuple) cursor"""
+        with self.get_connection() as conn, conn.cursor(name=f"stream_{spec}") as cursor:
+            cursor.itersize = itersize
+            cursor.execute(_SQL_SELECT[spec])
+            while True:
+                rows = cursor.fetchmany(itersize)
+                if not rows:
+                    break
+                if trusted:
+                    yield from map(construct, rows)
+                else:
+                    yield from adapter.validate_python(_records(fields, rows))
+    
+    def iter_students(self, itersize: int = ITER_SIZE, trusted: bool = False) -> Iterator[StudentProfile]:
+        """Stream students from a server-side cursor (memory bounded by itersize)
         
+        trusted=True skips Pydantic validation (the table CHECKs already constrain the data).
+        """
         try:
-            cursor.execute("SELECT * FROM students ORDER BY student_id")
-            rows = cursor.fetchall()
-            
-            students = []
-            for row in rows:
-                # Convert JSONB back to Pydantic models
-                student_data = dict(row)
-                students.append(StudentProfile(**student_data))
-            
-            return students
+            yield from self._stream(
+                "students", _STUDENT_FIELDS, _STUDENT_LIST, _construct_student, itersize, trusted
+            )
         except Exception as e:
             raise Exception(f"Failed to fetch students: {e}")
-        finally:
-            cursor.close()
-            conn.close()
     
-    def get_all_companies(self) -> List[JobDescription]:
-        """Retrieve all companies from database"""
-        conn = self.get_connection()
-        cursor = conn.cursor(cursor_factory=RealDictCursor)
-        
+    def iter_companies(self, itersize: int = ITER_SIZE, trusted: bool = False) -> Iterator[JobDescription]:
+        """Stream companies from a server-side cursor"""
         try:
-            cursor.execute("SELECT * FROM companies ORDER BY company_name")
-            rows = cursor.fetchall()
-            
-            companies = []
-            for row in rows:
-                company_data = dict(row)
-                # Remove database-specific fields
-                company_data.pop('created_at', None)
-                companies.append(JobDescription(**company_data))
-            
-            return companies
+            yield from self._stream(
+                "companies", _COMPANY_FIELDS, _COMPANY_LIST, _construct_company, itersize, trusted
+            )
         except Exception as e:
             raise Exception(f"Failed to fetch companies: {e}")
-        finally:
-            cursor.close()
-            conn.close()
     
-    def get_all_logs(self) -> List[PlacementLog]:
-        """Retrieve all placement logs from database"""
-        conn = self.get_connection()
-        cursor = conn.cursor(cursor_factory=RealDictCursor)
-        
+    def iter_logs(self, itersize: int = ITER_SIZE, trusted: bool = False) -> Iterator[PlacementLog]:
+        """Stream placement logs (newest first) from a server-side cursor"""
         try:
-            cursor.execute("SELECT * FROM placement_logs ORDER BY timestamp DESC")
-            rows = cursor.fetchall()
-            
-            logs = []
-            for row in rows:
-                log_data = dict(row)
-                # Remove database-specific fields
-                log_data.pop('created_at', None)
-                logs.append(PlacementLog(**log_data))
-            
-            return logs
+            yield from self._stream(
+                "logs", _LOG_FIELDS, _LOG_LIST, _construct_log, itersize, trusted
+            )
         except Exception as e:
             raise Exception(f"Failed to fetch logs: {e}")
-        finally:
-            cursor.close()
-            conn.close()
+    
+    def get_all_students(self, trusted: bool = False) -> List[StudentProfile]:
+        """Retrieve all students from database"""
+        return list(self.iter_students(trusted=trusted))
+    
+    def get_all_companies(self, trusted: bool = False, use_cache: bool = True) -> List[JobDescription]:
+        """Retrieve all companies (served from the in-process cache until a write is NOTIFYed)
+        
+        The cache always holds validated models, whatever trusted says, and every caller
+        gets its own deep copies. get_all() reads companies in its single query and does
+        not use this cache; the LISTEN thread starts on the first cached call here.
+        """
+        global _companies_cache
+        if not use_cache:
+            return list(self.iter_companies(trusted=trusted))
+        
+        _ensure_listener(self.config)
+        cached, generation = _companies_cache, _cache_generation
+        if cached is None:
+            cached = list(self.iter_companies(trusted=False))
+            with _cache_lock:
+                # Skip storing if a NOTIFY invalidated the cache mid-fetch
+                if generation == _cache_generation:
+                    _companies_cache = cached
+        return [company.model_copy(deep=True) for company in cached]
+    
+    def get_all_logs(self, trusted: bool = False) -> List[PlacementLog]:
+        """Retrieve all placement logs from database
+        
+        Only when every row is needed - for counts/ratios use get_result_counts and
+        get_shortlist_ratio_by_company, which aggregate in SQL.
+        """
+        return list(self.iter_logs(trusted=trusted))
+    
+    def find_students_by_skill(self, skill_name: str, trusted: bool = False) -> List[StudentProfile]:
+        """Students listing a skill (exact, case-sensitive name), via the skills GIN index"""
+        try:
+            with self.get_connection() as conn, conn.cursor() as cursor:
+                cursor.execute(_SQL_SELECT_STUDENTS_BY_SKILL, (OJson([{"name": skill_name}]),))
+                rows = cursor.fetchall()
+        except psycopg2.Error as e:
+            raise Exception(f"Failed to search students: {e}")
+        
+        if trusted:
+            return [_construct_student(row) for row in rows]
+        try:
+            return _STUDENT_LIST.validate_python(_records(_STUDENT_FIELDS, rows))
+        except ValidationError as e:
+            raise Exception(f"Failed to search students: {e}")
+    
+    def get_student_summaries(self) -> List[dict]:
+        """Lightweight student rows (every column except skills) for list/grid views"""
+        try:
+            with self.get_connection() as conn, conn.cursor() as cursor:
+                cursor.execute(_SQL_SELECT_STUDENT_SUMMARIES)
+                return _records(_STUDENT_SUMMARY_COLS, cursor.fetchall())
+        except psycopg2.Error as e:
+            raise Exception(f"Failed to fetch student summaries: {e}")
+    
+    def get_student_columns(self) -> dict:
+        """Numeric student columns as numpy arrays (column-oriented, no Pydantic models)
+        
+        Keys: student_id plus _STUDENT_NUMERIC_COLS. For analytics/aggregation, not CRUD.
+        """
+        try:
+            with self.get_connection() as conn, conn.cursor() as cursor:
+                cursor.execute(_SQL_SELECT_STUDENT_NUMERIC)
+                rows = cursor.fetchall()
+        except psycopg2.Error as e:
+            raise Exception(f"Failed to fetch student columns: {e}")
+        
+        columns = list(zip(*rows)) or [()] * (len(_STUDENT_NUMERIC_COLS) + 1)
+        result = {"student_id": np.array(columns[0], dtype=object)}
+        for (name, dtype), values in zip(_STUDENT_NUMERIC_COLS.items(), columns[1:]):
+            result[name] = np.array(values, dtype=dtype)
+        return result
+    
+    def get_students_arrow(self):
+        """Numeric student columns as a pyarrow.Table (requires pyarrow)"""
+        if not HAS_PYARROW:
+            raise ImportError("get_students_arrow needs pyarrow: pip install pyarrow")
+        return pa.table(self.get_student_columns())
+    
+    def get_result_counts(self) -> dict:
+        """Count placement logs per interview_result (aggregated in SQL)"""
+        try:
+            with self.get_connection() as conn, conn.cursor() as cursor:
+                cursor.execute(_SQL_RESULT_COUNTS)
+                return dict(cursor.fetchall())
+        except psycopg2.Error as e:
+            raise Exception(f"Failed to fetch result counts: {e}")
+    
+    def get_shortlist_ratio_by_company(self) -> dict:
+        """Fraction of applications shortlisted, per company_id (aggregated in SQL)"""
+        try:
+            with self.get_connection() as conn, conn.cursor() as cursor:
+                cursor.execute(_SQL_SHORTLIST_RATIO)
+                return dict(cursor.fetchall())
+        except psycopg2.Error as e:
+            raise Exception(f"Failed to fetch shortlist ratios: {e}")
+    
+    def get_all(self, trusted: bool = False) -> tuple:
+        """Retrieve (students, companies, logs) in a single query / round trip"""
+        try:
+            with self.get_connection() as conn, conn.cursor() as cursor:
+                cursor.execute(_SQL_SELECT_ALL)
+                student_rows, company_rows, log_rows = cursor.fetchone()
+        except psycopg2.Error as e:
+            raise Exception(f"Failed to fetch data: {e}")
+        
+        return _models_from_rows(student_rows, company_rows, log_rows, trusted)
+    
+    @staticmethod
+    def _write_students(cursor, rows: List[tuple]):
+        """Multi-row upsert of student rows on an open cursor (caller owns the transaction)"""
+        execute_values(cursor, _SQL_INSERT_STUDENTS, rows, page_size=BULK_PAGE_SIZE)
+    
+    @staticmethod
+    def _write_companies(cursor, rows: List[tuple]):
+        """Multi-row upsert of company rows on an open cursor (caller owns the transaction)"""
+        execute_values(cursor, _SQL_INSERT_COMPANIES, rows, page_size=BULK_PAGE_SIZE)
+    
+    @staticmethod
+    def _copy_logs(cursor, rows: List[tuple]):
+        """COPY log rows into a temp table, then one INSERT ... SELECT (caller owns the transaction)"""
+        cursor.execute(_SQL_CREATE_LOGS_STAGE)
+        cursor.copy_expert(_SQL_COPY_LOGS_STAGE, _csv_buffer(rows))
+        cursor.execute(_SQL_INSERT_LOGS_FROM_STAGE)
+    
+    @classmethod
+    def _write_logs(cls, cursor, rows: List[tuple]):
+        """Insert log rows on an open cursor - multi-row INSERT, or COPY for large batches"""
+        if len(rows) > COPY_THRESHOLD:
+            cls._copy_logs(cursor, rows)
+        else:
+            execute_values(cursor, _SQL_INSERT_LOGS, rows, page_size=BULK_PAGE_SIZE)
     
     def bulk_save_students(self, students: List[StudentProfile]):
-        """Save multiple students efficiently"""
-        for student in students:
-            self.save_student(student)
-        print(f"✅ Saved {len(students)} students to database")
+        """Save multiple students efficiently (multi-row upsert, one transaction)"""
+        rows = self._student_rows(students)
+        try:
+            with self.get_connection() as conn, conn.cursor() as cursor:
+                self._write_students(cursor, rows)
+        except psycopg2.Error as e:
+            raise Exception(f"Failed to save students: {e}")
+        print(f"✅ Saved {len(rows)} students to database")
     
     def bulk_save_companies(self, companies: List[JobDescription]):
-        """Save multiple companies efficiently"""
-        for company in companies:
-            self.save_company(company)
-        print(f"✅ Saved {len(companies)} companies to database")
+        """Save multiple companies efficiently (multi-row upsert, one transaction)"""
+        rows = self._company_rows(companies)
+        try:
+            with self.get_connection() as conn, conn.cursor() as cursor:
+                self._write_companies(cursor, rows)
+        except psycopg2.Error as e:
+            raise Exception(f"Failed to save companies: {e}")
+        finally:
+            _invalidate_companies()
+        print(f"✅ Saved {len(rows)} companies to database")
+    
+    def bulk_copy_logs(self, logs: List[PlacementLog]):
+        """Save a large batch of logs via COPY into a temp table, then one INSERT ... SELECT"""
+        try:
+            with self.get_connection() as conn, conn.cursor() as cursor:
+                self._copy_logs(cursor, [self._log_row(log) for log in logs])
+        except psycopg2.Error as e:
+            raise Exception(f"Failed to save logs: {e}")
+        print(f"✅ Saved {len(logs)} placement logs to database")
     
     def bulk_save_logs(self, logs: List[PlacementLog]):
-        """Save multiple logs efficiently"""
-        for log in logs:
-            self.save_log(log)
+        """Save multiple logs efficiently (multi-row insert, or COPY for large batches)"""
+        try:
+            with self.get_connection() as conn, conn.cursor() as cursor:
+                self._write_logs(cursor, [self._log_row(log) for log in logs])
+        except psycopg2.Error as e:
+            raise Exception(f"Failed to save logs: {e}")
         print(f"✅ Saved {len(logs)} placement logs to database")
     
+    def bulk_save_all(self, students: List[StudentProfile], companies: List[JobDescription],
+                      logs: List[PlacementLog], synchronous: bool = True):
+        """Save students, companies and logs in ONE transaction (a single commit / fsync)
+        
+        synchronous=False skips waiting for the WAL flush at commit - faster loads, but a crash
+        right after commit can lose this batch.
+        """
+        student_rows = self._student_rows(students)
+        company_rows = self._company_rows(companies)
+        log_rows = [self._log_row(log) for log in logs]
+        try:
+            with self.get_connection() as conn, conn.cursor() as cursor:
+                if not synchronous:
+                    cursor.execute(_SQL_ASYNC_COMMIT)
+                self._write_students(cursor, student_rows)
+                self._write_companies(cursor, company_rows)
+                self._write_logs(cursor, log_rows)
+        except psycopg2.Error as e:
+            raise Exception(f"Failed to save data: {e}")
+        finally:
+            _invalidate_companies()
+        print(f"✅ Saved {len(student_rows)} students, {len(company_rows)} companies, "
+              f"{len(log_rows)} placement logs to database")
+    
+    def bulk_replace_all(self, students: List[StudentProfile], companies: List[JobDescription],
+                         logs: List[PlacementLog]):
+        """Replace all data in one transaction: TRUNCATE, then COPY via temp staging tables"""
+        batches = (
+            self._student_rows(students),
+            self._company_rows(companies),
+            [self._log_row(log) for log in logs]
+        )
+        try:
+            with self.get_connection() as conn, conn.cursor() as cursor:
+                # Rebuild is re-runnable, so don't wait on the WAL flush at commit
+                cursor.execute(_SQL_ASYNC_COMMIT)
+                cursor.execute(_SQL_TRUNCATE_RESTART)
+                for (create_stage, copy_stage, move_stage), rows in zip(_REPLACE_STEPS, batches):
+                    cursor.execute(create_stage)
+                    cursor.copy_expert(copy_stage, _csv_buffer(rows))
+                    cursor.execute(move_stage)
+        except psycopg2.Error as e:
+            raise Exception(f"Failed to replace data: {e}")
+        finally:
+            _invalidate_companies()
+        print(f"✅ Replaced data: {len(batches[0])} students, {len(batches[1])} companies, "
+              f"{len(batches[2])} placement logs")
+    
     def clear_all_data(self):
         """Clear all data from tables (for testing)"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
         try:
-            cursor.execute("TRUNCATE TABLE placement_logs, companies, students CASCADE")
-            conn.commit()
+            with self.get_connection() as conn, conn.cursor() as cursor:
+                cursor.execute(_SQL_TRUNCATE_ALL)
             print("✅ All data cleared from database")
         except psycopg2.Error as e:
-            conn.rollback()
             raise Exception(f"Failed to clear data: {e}")
         finally:
-            cursor.close()
-            conn.close()
+            _invalidate_companies()
     
     def test_connection(self):
         """Test database connection"""
         try:
-            conn = self.get_connection()
-            cursor = conn.cursor()
-            cursor.execute("SELECT version()")
-            version = cursor.fetchone()
-            cursor.close()
-            conn.close()
+            with self.get_connection() as conn, conn.cursor() as cursor:
+                cursor.execute(_SQL_VERSION)
+                version = cursor.fetchone()
             print(f"✅ PostgreSQL connection successful!")
             print(f"Database version: {version[0]}")
             return True
         except Exception as e:
             print(f"❌ Database connection failed: {e}")
             return False
+    
+    def check_copy_roundtrip(self) -> bool:
+        """COPY a ("", None) row through _csv_buffer and check "" stays "" and None stays NULL"""
+        try:
+            with self.get_connection() as conn, conn.cursor() as cursor:
+                cursor.execute(_SQL_CREATE_COPY_CHECK)
+                cursor.copy_expert(_SQL_COPY_CHECK, _csv_buffer([("", None)]))
+                cursor.execute(_SQL_SELECT_COPY_CHECK)
+                row = cursor.fetchone()
+        except psycopg2.Error as e:
+            raise Exception(f"COPY round-trip check failed: {e}")
+        
+        if row == ("", None):
+            print("✅ COPY round-trip keeps empty strings and NULLs apart")
+            return True
+        print(f"❌ COPY round-trip turned ('', None) into {row}")
+        return False
+
+
+def _pg3_params(row: tuple) -> tuple:
+    """psycopg2 row tuple -> psycopg 3 parameters (Json wrappers become Jsonb)"""
+    return tuple(Jsonb(v.adapted) if isinstance(v, Json) else v for v in row)
+
+
+class AsyncDatabaseManager:
+    """asyncio PostgreSQL operations on psycopg 3 (optional)
+    
+    Writes run in pipeline mode: a batch of statements is sent in one flush instead of
+    one round trip each. Usage: async with AsyncDatabaseManager() as db: await db.get_all()
+    """
+    
+    def __init__(self):
+        if not HAS_PSYCOPG3:
+            raise ImportError("AsyncDatabaseManager needs psycopg 3: pip install 'psycopg[binary,pool]'")
+        config = _transport_config()
+        conninfo = psycopg.conninfo.make_conninfo(
+            host=config["host"],
+            dbname=config["database"],
+            user=config["user"],
+            password=config["password"],
+            port=config["port"]
+        )
+        self.pool = AsyncConnectionPool(conninfo, min_size=POOL_MIN_CONN, max_size=POOL_MAX_CONN, open=False)
+    
+    async def open(self):
+        await self.pool.open()
+    
+    async def close(self):
+        await self.pool.close()
+    
+    async def __aenter__(self):
+        await self.open()
+        return self
+    
+    async def __aexit__(self, *exc):
+        await self.close()
+    
+    async def _write(self, batches, what: str):
+        """Run (sql, rows) batches in one transaction and one pipeline"""
+        try:
+            async with self.pool.connection() as conn:
+                async with conn.pipeline(), conn.cursor() as cursor:
+                    for sql, rows in batches:
+                        if rows:
+                            await cursor.executemany(sql, [_pg3_params(row) for row in rows])
+        except psycopg.Error as e:
+            raise Exception(f"Failed to save {what}: {e}")
+    
+    async def save_student(self, student: StudentProfile):
+        """Save or update a student record"""
+        await self._write([(_SQL_UPSERT_STUDENT, [DatabaseManager._student_row(student)])], "student")
+    
+    async def save_company(self, company: JobDescription):
+        """Save or update a company/job record"""
+        await self._write([(_SQL_UPSERT_COMPANY, [DatabaseManager._company_row(company)])], "company")
+    
+    async def save_log(self, log: PlacementLog):
+        """Save a placement log record"""
+        await self._write([(_SQL_INSERT_LOG, [DatabaseManager._log_row(log)])], "log")
+    
+    async def bulk_save_all(self, students: List[StudentProfile], companies: List[JobDescription],
+                            logs: List[PlacementLog]):
+        """Save students, companies and logs in one transaction / pipeline"""
+        await self._write([
+            (_SQL_UPSERT_STUDENT, DatabaseManager._student_rows(students)),
+            (_SQL_UPSERT_COMPANY, DatabaseManager._company_rows(companies)),
+            (_SQL_INSERT_LOG, [DatabaseManager._log_row(log) for log in logs])
+        ], "data")
+    
+    async def get_all(self, trusted: bool = False) -> tuple:
+        """Retrieve (students, companies, logs) in a single query / round trip"""
+        try:
+            async with self.pool.connection() as conn, conn.cursor() as cursor:
+                await cursor.execute(_SQL_SELECT_ALL)
+                student_rows, company_rows, log_rows = await cursor.fetchone()
+        except psycopg.Error as e:
+            raise Exception(f"Failed to fetch data: {e}")
+        
+        return _models_from_rows(student_rows, company_rows, log_rows, trusted)
 
 
 if __name__ == "__main__":
@@ -352,6 +1132,7 @@ if __name__ == "__main__":
     if db.test_connection():
         print("\nCreating database tables...")
         db.create_tables()
+        db.check_copy_roundtrip()
         print("\n✅ Database setup complete!")
     else:
         print("\n❌ Database setup failed. Check your configuration.")
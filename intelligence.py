@@ -8,10 +8,147 @@ Focus: Resume credibility, Risk assessment, Explainable decisions.
 No assumptions. No shortcuts. Just working logic.
 """
 
-from typing import List, Dict, Tuple, Optional
-from data_engine import StudentProfile, JobDescription, PlacementLog, Skill
+from typing import List, Dict, Tuple, Optional, Mapping, NamedTuple
 from collections import defaultdict
+from data_engine import (
+    StudentProfile, JobDescription, PlacementLog, Skill, njit, prange,
+    DSA_KEYWORDS, TECH_ROLE_KEYWORDS
+)
+import heapq
+from bisect import bisect_left, bisect_right
+from enum import IntFlag
+from functools import cached_property
 import math
+from types import MappingProxyType
+import numpy as np
+import pandas as pd
+
+
+# ==================== SHARED DATA CACHE ====================
+
+class IntelligenceContext(NamedTuple):
+    """Shared read-only lookups used by the risk and analytics helpers"""
+    student_map: Mapping[str, StudentProfile]
+    company_map: Mapping[str, JobDescription]
+
+
+_context: Optional[IntelligenceContext] = None
+
+
+def _build_context(students: List[StudentProfile], companies: List[JobDescription]) -> IntelligenceContext:
+    return IntelligenceContext(
+        MappingProxyType({s.student_id: s for s in students}),
+        MappingProxyType({c.company_id: c for c in companies})
+    )
+
+
+def get_context() -> IntelligenceContext:
+    """Current context - loaded from the JSON store on first use unless refresh_context() injected data"""
+    global _context
+    if _context is None:
+        from data_engine import load_from_json
+        students, companies, _ = load_from_json()
+        _context = _build_context(students, companies)
+    return _context
+
+
+# Widening for the bisect pre-filter so float rounding at the 1.0 CGPA window edge can't drop a match
+CGPA_WINDOW_SLACK = 1e-9
+
+# Log-derived caches below are keyed on the list object and its length, not its contents:
+# replacing or editing logs in place (same length) is not detected - pass a fresh list or
+# call refresh_context() afterwards
+
+# Last failure index: (logs, len(logs), index)
+_failure_index = (None, 0, {})
+
+
+def _get_failure_index(logs: List[PlacementLog]) -> Dict[Tuple[str, str, int], List[float]]:
+    """
+    Failed (not selected) logs bucketed by (company_id, branch, communication_score),
+    each bucket a sorted list of the failed students' CGPAs
+    
+    Rebuilt only when a different list is passed or its length changed; the cached tuple
+    keeps a reference to the list so its id cannot be reused. In-place edits at the same
+    length are not seen until refresh_context() is called.
+    """
+    global _failure_index
+    cached_logs, cached_len, index = _failure_index
+    if cached_logs is logs and cached_len == len(logs):
+        return index
+    
+    student_map = get_context().student_map
+    index = defaultdict(list)
+    for log in logs:
+        if log.interview_result != "selected" and log.student_id in student_map:
+            other = student_map[log.student_id]
+            index[(log.company_id, other.branch, other.communication_score)].append(other.cgpa)
+    for cgpas in index.values():
+        cgpas.sort()
+    
+    _failure_index = (logs, len(logs), index)
+    return index
+
+
+# Last computed company stats: (logs, len(logs), stats)
+_company_stats = (None, 0, {})
+
+
+def precompute_company_stats(
+    logs: List[PlacementLog],
+    student_map: Optional[Dict[str, StudentProfile]] = None
+) -> Dict[str, Tuple[float, int]]:
+    """
+    {company_id: (avg communication score of selected students, count)} in one pass over the logs
+    
+    Compute once and pass to calculate_risk when assessing many candidates.
+    """
+    if student_map is None:
+        student_map = get_context().student_map
+    
+    comm_sums = defaultdict(int)
+    counts = defaultdict(int)
+    for log in logs:
+        if log.interview_result == "selected" and log.student_id in student_map:
+            comm_sums[log.company_id] += student_map[log.student_id].communication_score
+            counts[log.company_id] += 1
+    
+    return {company_id: (comm_sums[company_id] / count, count) for company_id, count in counts.items()}
+
+
+def _get_company_stats(logs: List[PlacementLog]) -> Dict[str, Tuple[float, int]]:
+    """precompute_company_stats for the last list passed (same reuse rule as _get_failure_index)"""
+    global _company_stats
+    cached_logs, cached_len, stats = _company_stats
+    if cached_logs is logs and cached_len == len(logs):
+        return stats
+    
+    stats = precompute_company_stats(logs)
+    _company_stats = (logs, len(logs), stats)
+    return stats
+
+
+def refresh_context(
+    students: Optional[List[StudentProfile]] = None,
+    companies: Optional[List[JobDescription]] = None
+):
+    """
+    Drop cached lookups after the data changed
+    
+    With students and companies (e.g. loaded from PostgreSQL via DatabaseManager.get_all()),
+    the context is built from them directly; otherwise the JSON store is re-read on next use.
+    Also call it after replacing or editing placement logs in place: the failure index and
+    company stats are reused for the same list object of the same length.
+    """
+    global _context, _failure_index, _company_stats
+    _context = None if students is None or companies is None else _build_context(students, companies)
+    _failure_index = (None, 0, {})
+    _company_stats = (None, 0, {})
+
+
+def invalidate_caches():
+    """Drop cached lookups after the JSON store has been rewritten"""
+    refresh_context()
 
 
 # ==================== RESUME CREDIBILITY CHECKER ====================
@@ -107,14 +244,186 @@ def calculate_credibility(student: StudentProfile) -> CredibilityResult:
     return CredibilityResult(final_score, level, red_flags, strengths)
 
 
+@njit(cache=True, parallel=True)
+def _credibility_kernel(github, projects, certifications, internship, advanced, offsets):
+    """Evidence arithmetic of calculate_credibility over flat skill arrays (student i = offsets[i]:offsets[i+1])"""
+    n = offsets.shape[0] - 1
+    final_score = np.zeros(n, dtype=np.float64)
+    github_count = np.zeros(n, dtype=np.int64)
+    strong_evidence = np.zeros(n, dtype=np.int64)
+    advanced_no_proof = np.zeros(n, dtype=np.int64)
+    no_proof = np.zeros(github.shape[0], dtype=np.bool_)
+    
+    for i in prange(n):
+        start, end = offsets[i], offsets[i + 1]
+        if start == end:
+            continue
+        
+        # Same term order as the scalar loop so sums are bit-identical (no fastmath)
+        evidence_count = 0.0
+        inflation_penalty = 0.0
+        for k in range(start, end):
+            skill_evidence = 0.0
+            if github[k]:
+                skill_evidence += 0.4
+                github_count[i] += 1
+            if projects[k] > 0:
+                skill_evidence += 0.3 * (projects[k] / 5)
+            if certifications[k] > 0:
+                skill_evidence += 0.2 * (certifications[k] / 3)
+            if internship[k]:
+                skill_evidence += 0.3
+            
+            if advanced[k] and not (github[k] or projects[k] >= 2):
+                inflation_penalty += 0.3
+                advanced_no_proof[i] += 1
+                no_proof[k] = True
+            
+            if skill_evidence >= 0.8:
+                strong_evidence[i] += 1
+            
+            evidence_count += min(1.0, skill_evidence)
+        
+        base_score = evidence_count / (end - start)
+        final_score[i] = max(0.0, min(1.0, base_score - inflation_penalty))
+    
+    return final_score, github_count, strong_evidence, advanced_no_proof, no_proof
+
+
+def calculate_credibility_batch(students: List[StudentProfile]) -> List[CredibilityResult]:
+    """
+    Batched calculate_credibility for many students (same results, input order)
+    
+    All skills are flattened into NumPy columns with per-student offsets and scored
+    by the numba kernel; only the result objects and flag strings are built in Python.
+    """
+    n = len(students)
+    counts = np.array([len(s.skills) for s in students], dtype=np.int64)
+    owner = np.repeat(np.arange(n), counts)
+    skills = [skill for s in students for skill in s.skills]
+    
+    github = np.array([sk.evidence.github for sk in skills], dtype=bool)
+    projects = np.array([sk.evidence.projects for sk in skills], dtype=np.float64)
+    certifications = np.array([sk.evidence.certifications for sk in skills], dtype=np.float64)
+    internship = np.array([sk.evidence.internship for sk in skills], dtype=bool)
+    advanced = np.array([sk.claimed_level == "advanced" for sk in skills], dtype=bool)
+    
+    offsets = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(counts, out=offsets[1:])
+    final_score, github_count, strong_evidence, advanced_no_proof, no_proof = _credibility_kernel(
+        github, projects, certifications, internship, advanced, offsets
+    )
+    
+    results = []
+    flagged = np.flatnonzero(no_proof).tolist()
+    flag_pos = 0
+    for i, student in enumerate(students):
+        if not counts[i]:
+            results.append(CredibilityResult(0.5, "MEDIUM", ["No skills listed"], []))
+            continue
+        
+        score = float(final_score[i])
+        if score >= 0.7:
+            level = "HIGH"
+        elif score >= 0.4:
+            level = "MEDIUM"
+        else:
+            level = "LOW"
+        
+        # Per-skill inflation flags (flat skill positions are grouped by student, in order)
+        red_flags = []
+        while flag_pos < len(flagged) and owner[flagged[flag_pos]] == i:
+            red_flags.append(f"{skills[flagged[flag_pos]].name}: Claimed 'advanced' but no GitHub/projects")
+            flag_pos += 1
+        
+        strengths = []
+        if github_count[i] >= 3:
+            strengths.append(f"{github_count[i]} skills backed by GitHub")
+        if strong_evidence[i] >= 2:
+            strengths.append(f"{strong_evidence[i]} skills with strong evidence")
+        if student.resume_trust_score >= 0.7:
+            strengths.append("High overall trust score")
+        
+        if advanced_no_proof[i] >= 3:
+            red_flags.append(f"{advanced_no_proof[i]} advanced claims without proof - MAJOR INFLATION")
+        if score < 0.3:
+            red_flags.append("Critically low credibility - High risk candidate")
+        
+        results.append(CredibilityResult(score, level, red_flags, strengths))
+    
+    return results
+
+
 # ==================== RISK ASSESSMENT ENGINE ====================
 
+class RiskFactor(IntFlag):
+    """Contributing risk factors as bit flags (strings are built only when displayed)"""
+    SIMILAR_FAILURES_MANY = 1
+    SIMILAR_FAILURES_SOME = 2
+    LOW_CREDIBILITY = 4
+    MEDIUM_CREDIBILITY = 8
+    COMMUNICATION_BELOW_AVG = 16
+    LOW_COMMUNICATION = 32
+    POOR_MOCK_INTERVIEW = 64
+    STRICT_COMPANY = 128
+
+
+# Display text per factor, in report order; filled from RiskResult.details
+RISK_FACTOR_MESSAGES = MappingProxyType({
+    RiskFactor.SIMILAR_FAILURES_MANY: "Similar profiles failed {similar_failures} times at this company",
+    RiskFactor.SIMILAR_FAILURES_SOME: "Similar profiles failed {similar_failures} time(s)",
+    RiskFactor.LOW_CREDIBILITY: "Low resume credibility ({credibility_score:.2f}) - Skill inflation detected",
+    RiskFactor.MEDIUM_CREDIBILITY: "Medium resume credibility ({credibility_score:.2f})",
+    RiskFactor.COMMUNICATION_BELOW_AVG: (
+        "Communication score ({communication_score}/10) below company average ({company_avg_comm:.1f}/10)"
+    ),
+    RiskFactor.LOW_COMMUNICATION: "Low communication score: {communication_score}/10",
+    RiskFactor.POOR_MOCK_INTERVIEW: "Poor mock interview performance: {mock_interview_score}/10",
+    RiskFactor.STRICT_COMPANY: "Company has LOW risk tolerance - stricter evaluation",
+})
+
+# Plain-int flag values for the calculate_risk hot path (IntFlag | IntFlag goes through enum machinery)
+_SIMILAR_FAILURES_MANY = RiskFactor.SIMILAR_FAILURES_MANY.value
+_SIMILAR_FAILURES_SOME = RiskFactor.SIMILAR_FAILURES_SOME.value
+_LOW_CREDIBILITY = RiskFactor.LOW_CREDIBILITY.value
+_MEDIUM_CREDIBILITY = RiskFactor.MEDIUM_CREDIBILITY.value
+_COMMUNICATION_BELOW_AVG = RiskFactor.COMMUNICATION_BELOW_AVG.value
+_LOW_COMMUNICATION = RiskFactor.LOW_COMMUNICATION.value
+_POOR_MOCK_INTERVIEW = RiskFactor.POOR_MOCK_INTERVIEW.value
+_STRICT_COMPANY = RiskFactor.STRICT_COMPANY.value
+
+
 class RiskResult:
     """Risk assessment result"""
-    def __init__(self, risk_level: str, risk_score: int, factors: List[str]):
+    def __init__(self, risk_level: str, risk_score: int, flags: int, details: Tuple):
         self.risk_level = risk_level
         self.risk_score = risk_score
-        self.factors = factors
+        self._flags = flags
+        # (similar_failures, credibility_score, communication_score, company_avg_comm, mock_interview_score)
+        self._details = details
+    
+    @property
+    def flags(self) -> RiskFactor:
+        return RiskFactor(self._flags)
+    
+    @cached_property
+    def factors(self) -> List[str]:
+        """Human-readable factors, formatted on first access"""
+        if not self._flags:
+            return []
+        similar_failures, credibility_score, communication_score, company_avg_comm, mock_interview_score = self._details
+        details = {
+            "similar_failures": similar_failures,
+            "credibility_score": credibility_score,
+            "communication_score": communication_score,
+            "company_avg_comm": company_avg_comm,
+            "mock_interview_score": mock_interview_score,
+        }
+        return [
+            message.format_map(details)
+            for factor, message in RISK_FACTOR_MESSAGES.items()
+            if self._flags & factor
+        ]
     
     def to_dict(self) -> Dict:
         return {
@@ -128,15 +437,20 @@ def calculate_risk(
     student: StudentProfile,
     company: JobDescription,
     placement_logs: List[PlacementLog],
-    credibility: CredibilityResult
+    credibility: CredibilityResult,
+    company_stats: Optional[Dict[str, Tuple[float, int]]] = None
 ) -> RiskResult:
     """
     Calculate placement risk based on historical patterns
     
-    Returns: RiskResult with level (LOW/MEDIUM/HIGH) and contributing factors
+    Args:
+        company_stats: precompute_company_stats(placement_logs) output; computed and cached if omitted
+            (cached per list object - call refresh_context() after editing placement_logs in place)
+    
+    Returns: RiskResult with level (LOW/MEDIUM/HIGH) and contributing factor flags
     """
     risk_score = 0
-    factors = []
+    flags = 0
     
     # 1. Historical pattern analysis
     similar_failures = count_similar_profile_failures(
@@ -145,48 +459,48 @@ def calculate_risk(
     
     if similar_failures >= 3:
         risk_score += 4
-        factors.append(f"Similar profiles failed {similar_failures} times at this company")
+        flags |= _SIMILAR_FAILURES_MANY
     elif similar_failures >= 1:
         risk_score += 2
-        factors.append(f"Similar profiles failed {similar_failures} time(s)")
+        flags |= _SIMILAR_FAILURES_SOME
     
     # 2. Resume credibility check
     if credibility.level == "LOW":
         risk_score += 3
-        factors.append(f"Low resume credibility ({credibility.score:.2f}) - Skill inflation detected")
+        flags |= _LOW_CREDIBILITY
     elif credibility.level == "MEDIUM":
         risk_score += 1
-        factors.append(f"Medium resume credibility ({credibility.score:.2f})")
+        flags |= _MEDIUM_CREDIBILITY
     
     # 3. Communication gap analysis
-    company_avg_comm = get_avg_communication_for_company(placement_logs, company.company_id)
+    if company_stats is None:
+        company_stats = _get_company_stats(placement_logs)
+    company_avg_comm = company_stats.get(company.company_id, (0, 0))[0]
     
     if company_avg_comm > 0:  # If we have historical data
         if student.communication_score < company_avg_comm - 2:
             risk_score += 2
-            factors.append(
-                f"Communication score ({student.communication_score}/10) below company average ({company_avg_comm:.1f}/10)"
-            )
+            flags |= _COMMUNICATION_BELOW_AVG
         elif student.communication_score < 5:
             risk_score += 1
-            factors.append(f"Low communication score: {student.communication_score}/10")
+            flags |= _LOW_COMMUNICATION
     else:
         # No historical data, use absolute threshold
         if student.communication_score < 5:
             risk_score += 2
-            factors.append(f"Low communication score: {student.communication_score}/10")
+            flags |= _LOW_COMMUNICATION
     
     # 4. Mock interview performance
     if student.mock_interview_score < 5:
         risk_score += 1
-        factors.append(f"Poor mock interview performance: {student.mock_interview_score}/10")
+        flags |= _POOR_MOCK_INTERVIEW
     
     # 5. Company risk tolerance
     if company.risk_tolerance == "low":
         # Strict companies are less forgiving
         if risk_score >= 3:
             risk_score += 1
-            factors.append("Company has LOW risk tolerance - stricter evaluation")
+            flags |= _STRICT_COMPANY
     
     # Final classification
     if risk_score >= 6:
@@ -196,7 +510,11 @@ def calculate_risk(
     else:
         risk_level = "LOW"
     
-    return RiskResult(risk_level, risk_score, factors)
+    details = (
+        similar_failures, credibility.score, student.communication_score,
+        company_avg_comm, student.mock_interview_score
+    )
+    return RiskResult(risk_level, risk_score, flags, details)
 
 
 def count_similar_profile_failures(
@@ -205,64 +523,40 @@ def count_similar_profile_failures(
     logs: List[PlacementLog]
 ) -> int:
     """Count failures of similar student profiles at this company"""
-    
-    # Load student map for lookup
-    from data_engine import load_from_json
-    try:
-        students, _, _ = load_from_json()
-        student_map = {s.student_id: s for s in students}
-    except:
-        return 0
-    
+    # Similar = same branch, CGPA within 1.0, communication within 2 (integer scores, so +-1).
+    # Only the three neighbouring communication buckets are searched; bisect narrows each
+    # to the CGPA window and the exact comparison decides the boundary values.
+    index = _get_failure_index(logs)
     failures = 0
     
-    for log in logs:
-        if log.company_id != company.company_id:
+    for comm in (student.communication_score - 1, student.communication_score, student.communication_score + 1):
+        cgpas = index.get((company.company_id, student.branch, comm))
+        if not cgpas:
             continue
-        
-        if log.interview_result != "selected" and log.student_id in student_map:
-            other = student_map[log.student_id]
-            
-            # Check similarity (same branch, similar CGPA range, similar communication)
-            same_branch = other.branch == student.branch
-            similar_cgpa = abs(other.cgpa - student.cgpa) < 1.0
-            similar_comm = abs(other.communication_score - student.communication_score) < 2
-            
-            if same_branch and similar_cgpa and similar_comm:
-                failures += 1
+        lo = bisect_left(cgpas, student.cgpa - 1.0 - CGPA_WINDOW_SLACK)
+        hi = bisect_right(cgpas, student.cgpa + 1.0 + CGPA_WINDOW_SLACK)
+        failures += sum(1 for cgpa in cgpas[lo:hi] if abs(cgpa - student.cgpa) < 1.0)
     
     return failures
 
 
 def get_avg_communication_for_company(logs: List[PlacementLog], company_id: str) -> float:
     """Get average communication score for selected candidates at this company"""
-    from data_engine import load_from_json
-    try:
-        students, _, _ = load_from_json()
-        student_map = {s.student_id: s for s in students}
-    except:
-        return 0
-    
-    selected_logs = [
-        log for log in logs 
-        if log.company_id == company_id and log.interview_result == "selected"
-    ]
-    
-    if not selected_logs:
-        return 0
-    
-    comm_scores = [
-        student_map[log.student_id].communication_score 
-        for log in selected_logs 
-        if log.student_id in student_map
-    ]
-    
-    return sum(comm_scores) / len(comm_scores) if comm_scores else 0
-
+    return _get_company_stats(logs).get(company_id, (0, 0))[0]
 
 
 # ==================== EXPLAINABILITY SYSTEM ====================
 
+# Student-facing text per failure reason (read-only, shared across calls)
+FAILURE_REASON_MESSAGES = MappingProxyType({
+    "cgpa": "Your CGPA does not meet the minimum requirement",
+    "low_dsa": "DSA skill level needs improvement",
+    "fake_skill": "Resume credibility concerns - some skills lack supporting evidence",
+    "poor_communication": "Communication skills need development",
+    "failed_interview": "Interview performance below company standards"
+})
+
+
 def generate_student_explanation(
     student: StudentProfile,
     company: JobDescription,
@@ -305,14 +599,7 @@ Next steps: Prepare for technical interview. Check your email for schedule.
     else:  # rejected
         reason_msg = ""
         if failure_reason:
-            reason_map = {
-                "cgpa": "Your CGPA does not meet the minimum requirement",
-                "low_dsa": "DSA skill level needs improvement",
-                "fake_skill": "Resume credibility concerns - some skills lack supporting evidence",
-                "poor_communication": "Communication skills need development",
-                "failed_interview": "Interview performance below company standards"
-            }
-            reason_msg = reason_map.get(failure_reason, failure_reason)
+            reason_msg = FAILURE_REASON_MESSAGES.get(failure_reason, failure_reason)
         
         tips = []
         if credibility.red_flags:
@@ -353,7 +640,7 @@ def generate_officer_explanation(
     
     Provides full analysis for placement cell decision-making
     """
-    report = f"""
+    parts = [f"""
 === PLACEMENT OFFICER ANALYSIS ===
 Student: {student.name} ({student.student_id})
 Company: {company.company_name} - {company.role}
@@ -385,7 +672,7 @@ Mock Interview Score: {student.mock_interview_score}/10
 Resume Trust Score: {student.resume_trust_score:.2f}
 
 Skills ({len(student.skills)}):
-"""
+"""]
     
     # Add skill breakdown
     for skill in student.skills[:5]:  # Top 5 skills
@@ -400,26 +687,35 @@ Skills ({len(student.skills)}):
             evidence_str.append("Internship")
         
         evidence_display = ", ".join(evidence_str) if evidence_str else "NO EVIDENCE"
-        report += f"   {skill.name} ({skill.claimed_level}): {evidence_display}\n"
+        parts.append(f"   {skill.name} ({skill.claimed_level}): {evidence_display}\n")
     
-    report += f"\n--- COMPANY REQUIREMENTS ---\n"
-    report += f"Risk Tolerance: {company.risk_tolerance.upper()}\n"
-    report += f"Min CGPA: {company.eligibility_rules.min_cgpa}\n"
-    report += f"Required Skills: {', '.join(company.eligibility_rules.mandatory_skills)}\n"
-    
-    report += f"\n--- RECOMMENDATION ---\n"
+    parts.append(f"""
+--- COMPANY REQUIREMENTS ---
+Risk Tolerance: {company.risk_tolerance.upper()}
+Min CGPA: {company.eligibility_rules.min_cgpa}
+Required Skills: {', '.join(company.eligibility_rules.mandatory_skills)}
+
+--- RECOMMENDATION ---
+""")
     if decision == "selected":
-        report += " APPROVED - Strong candidate with verified credentials\n"
+        parts.append(" APPROVED - Strong candidate with verified credentials\n")
     elif decision == "shortlisted":
-        report += " SHORTLISTED - Proceed with caution, monitor interview performance\n"
+        parts.append(" SHORTLISTED - Proceed with caution, monitor interview performance\n")
     else:
-        report += " REJECTED - Does not meet criteria or high risk of failure\n"
+        parts.append(" REJECTED - Does not meet criteria or high risk of failure\n")
     
-    return report
+    return "".join(parts)
 
 
 # ==================== ENHANCED MATCHING ENGINE ====================
 
+# Decision thresholds and credibility penalties (shared by scalar and batch matchers)
+SELECT_THRESHOLD = 0.7               # LOW risk: selected; HIGH risk: minimum to be shortlisted
+SHORTLIST_THRESHOLD = 0.5            # LOW risk: shortlisted; LOW credibility: below this = fake_skill
+MEDIUM_RISK_SHORTLIST_THRESHOLD = 0.55
+LOW_CREDIBILITY_PENALTY = 0.6        # 40% penalty
+MEDIUM_CREDIBILITY_PENALTY = 0.85    # 15% penalty
+
 class MatchResult:
     """Enhanced matching result with credibility and risk"""
     def __init__(
@@ -456,22 +752,31 @@ def match_student_to_job(
     student: StudentProfile,
     company: JobDescription,
     placement_logs: List[PlacementLog],
-    apply_credibility_penalty: bool = True
+    apply_credibility_penalty: bool = True,
+    credibility: Optional[CredibilityResult] = None,
+    company_stats: Optional[Dict[str, Tuple[float, int]]] = None
 ) -> MatchResult:
     """
     Enhanced matching with credibility and risk assessment
     
+    Args:
+        credibility: the student's calculate_credibility result, if already known
+            (it depends only on the student - compute once when matching to many jobs)
+        company_stats: precompute_company_stats(placement_logs) output, passed to calculate_risk
+    
     Returns: MatchResult with decision (selected/shortlisted/rejected)
     """
     
-    # Step 1: Calculate credibility
-    credibility = calculate_credibility(student)
+    # Step 1: Calculate credibility (the only pass over student.skills)
+    if credibility is None:
+        credibility = calculate_credibility(student)
     
     # Step 2: Calculate risk
-    risk = calculate_risk(student, company, placement_logs, credibility)
+    risk = calculate_risk(student, company, placement_logs, credibility, company_stats)
     
-    # Step 3: Check basic eligibility
-    if student.cgpa < company.eligibility_rules.min_cgpa:
+    # Step 3: Check basic eligibility (rules read once for the gates and the skill match)
+    rules = company.eligibility_rules
+    if student.cgpa < rules.min_cgpa:
         return MatchResult(
             student.student_id,
             company.company_id,
@@ -483,7 +788,7 @@ def match_student_to_job(
         )
     
     # Check backlogs
-    if student.active_backlogs > company.eligibility_rules.max_backlogs:
+    if student.active_backlogs > rules.max_backlogs:
         return MatchResult(
             student.student_id,
             company.company_id,
@@ -494,24 +799,9 @@ def match_student_to_job(
             "backlogs"
         )
     
-    # Step 4: Calculate skill match score
-    student_skill_names = {s.name.lower() for s in student.skills}
-    required_skills_met = sum(
-        1 for req_skill in company.eligibility_rules.mandatory_skills
-        if req_skill.lower() in student_skill_names
-    )
-    
-    total_required = len(company.eligibility_rules.mandatory_skills)
-    skill_match_ratio = required_skills_met / total_required if total_required > 0 else 0
-    
-    # Check DSA requirement for tech roles
-    has_dsa = any(
-        "dsa" in s.name.lower() or "algorithm" in s.name.lower()
-        for s in student.skills
-    )
-    
-    if "software" in company.role.lower() or "developer" in company.role.lower():
-        if not has_dsa:
+    # Check DSA requirement for tech roles - before any scoring work (both flags cached)
+    if company.is_tech_role:
+        if not student.has_dsa:
             return MatchResult(
                 student.student_id,
                 company.company_id,
@@ -522,22 +812,28 @@ def match_student_to_job(
                 "low_dsa"
             )
     
+    # Step 4: Calculate skill match score (popcount of cached masks, ratio from the per-job table)
+    required_skills_met = (student.skill_bits & rules.mandatory_bits).bit_count()
+    skill_match_ratio = rules.mandatory_ratios[required_skills_met]
+    
     # Step 5: Apply weight policy
     weights = company.weight_policy
     
+    cgpa_scaled, communication_scaled, mock_scaled = student.scaled_scores
     base_score = (
-        (student.cgpa / 10.0) * weights.gpa_weight +
+        cgpa_scaled * weights.gpa_weight +
         skill_match_ratio * weights.skill_weight +
-        (student.communication_score / 10.0) * weights.communication_weight +
-        (student.mock_interview_score / 10.0) * weights.mock_interview_weight
+        communication_scaled * weights.communication_weight +
+        mock_scaled * weights.mock_interview_weight
     )
     
     # Step 6: Apply credibility penalty
     final_score = base_score
+    credibility_level = credibility.level
     if apply_credibility_penalty:
-        if credibility.level == "LOW":
-            final_score *= 0.6  # 40% penalty
-            if final_score < 0.5:
+        if credibility_level == "LOW":
+            final_score *= LOW_CREDIBILITY_PENALTY
+            if final_score < SHORTLIST_THRESHOLD:
                 return MatchResult(
                     student.student_id,
                     company.company_id,
@@ -547,12 +843,13 @@ def match_student_to_job(
                     risk,
                     "fake_skill"
                 )
-        elif credibility.level == "MEDIUM":
-            final_score *= 0.85  # 15% penalty
+        elif credibility_level == "MEDIUM":
+            final_score *= MEDIUM_CREDIBILITY_PENALTY
     
     # Step 7: Risk-based decision
-    if risk.risk_level == "HIGH":
-        if final_score < 0.7:  # High bar for risky candidates
+    risk_level = risk.risk_level
+    if risk_level == "HIGH":
+        if final_score < SELECT_THRESHOLD:  # High bar for risky candidates
             return MatchResult(
                 student.student_id,
                 company.company_id,
@@ -564,13 +861,14 @@ def match_student_to_job(
             )
         else:
             decision = "shortlisted"  # Even high scores get shortlisted if high risk
-    elif risk.risk_level == "MEDIUM":
-        decision = "shortlisted" if final_score >= 0.55 else "rejected"
-        failure_reason = "poor_communication" if final_score < 0.55 else None
+            failure_reason = None
+    elif risk_level == "MEDIUM":
+        decision = "shortlisted" if final_score >= MEDIUM_RISK_SHORTLIST_THRESHOLD else "rejected"
+        failure_reason = "poor_communication" if final_score < MEDIUM_RISK_SHORTLIST_THRESHOLD else None
     else:  # LOW risk
-        if final_score >= 0.7:
+        if final_score >= SELECT_THRESHOLD:
             decision = "selected"
-        elif final_score >= 0.5:
+        elif final_score >= SHORTLIST_THRESHOLD:
             decision = "shortlisted"
         else:
             decision = "rejected"
@@ -587,6 +885,345 @@ def match_student_to_job(
     )
 
 
+# ==================== BATCH MATCHING (VECTORIZED) ====================
+
+# Decision / failure-reason codes used by the vectorized matcher
+DECISIONS = ("selected", "shortlisted", "rejected")
+SELECTED, SHORTLISTED, REJECTED = range(3)
+MATCH_REASONS = (None, "cgpa", "backlogs", "low_dsa", "fake_skill", "failed_interview", "poor_communication")
+(NO_REASON, REASON_CGPA, REASON_BACKLOGS, REASON_LOW_DSA,
+ REASON_FAKE_SKILL, REASON_FAILED_INTERVIEW, REASON_POOR_COMMUNICATION) = range(len(MATCH_REASONS))
+LEVEL_CODES = {"LOW": 0, "MEDIUM": 1, "HIGH": 2}
+
+
+HAS_BITWISE_COUNT = hasattr(np, "bitwise_count")  # NumPy >= 2.0 (hardware POPCNT)
+
+
+def _popcount_rows(bits: np.ndarray) -> np.ndarray:
+    """Set bits per row of a (n, lanes) uint64 matrix"""
+    if HAS_BITWISE_COUNT:
+        return np.bitwise_count(bits).sum(axis=1, dtype=np.int64)
+    return np.unpackbits(bits.view(np.uint8), axis=1).sum(axis=1, dtype=np.int64)
+
+
+class StudentMatrix:
+    """Column-oriented view of a student list for batch matching (build once, reuse per job)
+    
+    Skills are a bitmask matrix: one row per student, one bit per skill in the vocabulary.
+    """
+    def __init__(self, students: List[StudentProfile]):
+        self.students = students
+        self.skill_index: Dict[str, int] = {}
+        for student in students:
+            for name in student.skill_names_lower:
+                self.skill_index.setdefault(name, len(self.skill_index))
+        
+        lanes = max(1, (len(self.skill_index) + 63) // 64)
+        self.bits = np.zeros((len(students), lanes), dtype=np.uint64)
+        for row, student in enumerate(students):
+            for name in student.skill_names_lower:
+                idx = self.skill_index[name]
+                self.bits[row, idx >> 6] |= np.uint64(1 << (idx & 63))
+        
+        self.cgpa = np.array([s.cgpa for s in students], dtype=np.float64)
+        self.backlogs = np.array([s.active_backlogs for s in students], dtype=np.int64)
+        # 0-1 scaled cgpa / communication / mock interview, divided once here rather than per pair
+        self.scaled = np.array([s.scaled_scores for s in students], dtype=np.float64).reshape(-1, 3)
+        self.has_dsa = np.array([s.has_dsa for s in students], dtype=bool)
+    
+    def skill_mask(self, skills) -> Tuple[np.ndarray, int]:
+        """Bitmask of the given lowercase skills plus the count of skills outside the vocabulary"""
+        mask = np.zeros(self.bits.shape[1], dtype=np.uint64)
+        unknown = 0
+        for name in skills:
+            idx = self.skill_index.get(name)
+            if idx is None:
+                unknown += 1  # no student has it - can never match, still counts as required
+            else:
+                mask[idx >> 6] |= np.uint64(1 << (idx & 63))
+        return mask, unknown
+
+
+class JobMatrix:
+    """Column-oriented view of a company list for matching one student against all jobs
+    
+    Mandatory skills are a bitmask matrix: one row per company (jobs stacked instead of students).
+    """
+    def __init__(self, companies: List[JobDescription]):
+        self.companies = companies
+        self.skill_index: Dict[str, int] = {}
+        for company in companies:
+            for name in company.eligibility_rules.mandatory_lower:
+                self.skill_index.setdefault(name, len(self.skill_index))
+        
+        lanes = max(1, (len(self.skill_index) + 63) // 64)
+        self.bits = np.zeros((len(companies), lanes), dtype=np.uint64)
+        for row, company in enumerate(companies):
+            for name in company.eligibility_rules.mandatory_lower:
+                idx = self.skill_index[name]
+                self.bits[row, idx >> 6] |= np.uint64(1 << (idx & 63))
+        
+        rules = [c.eligibility_rules for c in companies]
+        weights = [c.weight_policy for c in companies]
+        self.min_cgpa = np.array([r.min_cgpa for r in rules], dtype=np.float64)
+        self.max_backlogs = np.array([r.max_backlogs for r in rules], dtype=np.int64)
+        # Padded (jobs, max_required + 1) table of match ratios, indexed by skills met
+        width = max((len(r.mandatory_ratios) for r in rules), default=1)
+        self.ratio_table = np.zeros((len(companies), width), dtype=np.float64)
+        for row, r in enumerate(rules):
+            self.ratio_table[row, :len(r.mandatory_ratios)] = r.mandatory_ratios
+        self.is_tech_role = np.array([c.is_tech_role for c in companies], dtype=bool)
+        self.gpa_weight = np.array([w.gpa_weight for w in weights], dtype=np.float64)
+        self.skill_weight = np.array([w.skill_weight for w in weights], dtype=np.float64)
+        self.communication_weight = np.array([w.communication_weight for w in weights], dtype=np.float64)
+        self.mock_interview_weight = np.array([w.mock_interview_weight for w in weights], dtype=np.float64)
+    
+    def skill_mask(self, skills) -> np.ndarray:
+        """Bitmask of the given lowercase skills (skills no company requires are dropped)"""
+        mask = np.zeros(self.bits.shape[1], dtype=np.uint64)
+        for name in skills:
+            idx = self.skill_index.get(name)
+            if idx is not None:
+                mask[idx >> 6] |= np.uint64(1 << (idx & 63))
+        return mask
+
+
+@njit(cache=True, parallel=True)
+def _score_kernel(cgpa, backlogs, has_dsa, scaled, skill_ratio,
+                  cred_levels, risk_levels, min_cgpa, max_backlogs, is_tech_role,
+                  gpa_weight, skill_weight, communication_weight, mock_interview_weight,
+                  apply_credibility_penalty):
+    """Decision rules of match_student_to_job per (student, job) pair -> (scores, decision codes, reason codes)
+    
+    Every argument except apply_credibility_penalty is an array with one entry per pair;
+    callers broadcast the side that is fixed.
+    """
+    n = cgpa.shape[0]
+    scores = np.zeros(n, dtype=np.float64)
+    decisions = np.full(n, 2, dtype=np.int8)   # REJECTED
+    reasons = np.zeros(n, dtype=np.int8)       # NO_REASON
+    
+    for i in prange(n):
+        # Hard eligibility gates
+        if cgpa[i] < min_cgpa[i]:
+            reasons[i] = 1
+            continue
+        if backlogs[i] > max_backlogs[i]:
+            reasons[i] = 2
+            continue
+        if is_tech_role[i] and not has_dsa[i]:
+            reasons[i] = 3
+            continue
+        
+        # scaled = per-student (cgpa, communication, mock) / 10, skill_ratio from the per-job table
+        score = (
+            scaled[i, 0] * gpa_weight[i] +
+            skill_ratio[i] * skill_weight[i] +
+            scaled[i, 1] * communication_weight[i] +
+            scaled[i, 2] * mock_interview_weight[i]
+        )
+        if apply_credibility_penalty:
+            if cred_levels[i] == 0:
+                score = score * LOW_CREDIBILITY_PENALTY
+            elif cred_levels[i] == 1:
+                score = score * MEDIUM_CREDIBILITY_PENALTY
+        scores[i] = score
+        
+        if apply_credibility_penalty and cred_levels[i] == 0 and score < SHORTLIST_THRESHOLD:
+            reasons[i] = 4
+        elif risk_levels[i] == 2:
+            if score < SELECT_THRESHOLD:
+                reasons[i] = 5
+            else:
+                decisions[i] = 1
+        elif risk_levels[i] == 1:
+            if score >= MEDIUM_RISK_SHORTLIST_THRESHOLD:
+                decisions[i] = 1
+            else:
+                reasons[i] = 6
+        elif score >= SELECT_THRESHOLD:
+            decisions[i] = 0
+        elif score >= SHORTLIST_THRESHOLD:
+            decisions[i] = 1
+        else:
+            reasons[i] = 5
+    
+    return scores, decisions, reasons
+
+
+def _build_results(student_ids, company_ids, scores, decisions, reasons, credibilities, risks, top_k):
+    """MatchResult objects for all pairs (input order) or only the top_k by score"""
+    scores = scores.tolist()
+    if top_k is None:
+        order = range(len(scores))
+    else:
+        order = heapq.nlargest(top_k, range(len(scores)), key=scores.__getitem__)
+    
+    return [
+        MatchResult(
+            student_ids[i], company_ids[i], scores[i],
+            DECISIONS[decisions[i]], credibilities[i], risks[i], MATCH_REASONS[reasons[i]]
+        )
+        for i in order
+    ]
+
+
+def match_all_students_to_job(
+    students: Optional[List[StudentProfile]],
+    company: JobDescription,
+    placement_logs: List[PlacementLog],
+    apply_credibility_penalty: bool = True,
+    matrix: Optional[StudentMatrix] = None,
+    top_k: Optional[int] = None
+) -> List[MatchResult]:
+    """
+    Match every student against one company in a single vectorized pass
+    
+    Same results as calling match_student_to_job per student (input order). Pass a prebuilt
+    StudentMatrix to reuse the skill bitmasks across companies; the matrix's own students are
+    matched, so students may then be None (anything else must be the same students).
+    With top_k, only the best top_k matches are built and returned, highest score first.
+    """
+    if matrix is None:
+        matrix = StudentMatrix(students)
+    elif students is not None and students is not matrix.students and list(students) != list(matrix.students):
+        raise ValueError("students does not match the students the StudentMatrix was built from")
+    
+    credibilities = calculate_credibility_batch(matrix.students)
+    company_stats = _get_company_stats(placement_logs)
+    risks = [
+        calculate_risk(s, company, placement_logs, c, company_stats)
+        for s, c in zip(matrix.students, credibilities)
+    ]
+    
+    rules = company.eligibility_rules
+    mask, _ = matrix.skill_mask(rules.mandatory_lower)
+    skills_met = _popcount_rows(matrix.bits & mask)
+    weights = company.weight_policy
+    n = len(matrix.students)
+    
+    scores, decisions, reasons = _score_kernel(
+        matrix.cgpa, matrix.backlogs, matrix.has_dsa, matrix.scaled,
+        np.asarray(rules.mandatory_ratios, dtype=np.float64)[skills_met],
+        np.array([LEVEL_CODES[c.level] for c in credibilities], dtype=np.int8),
+        np.array([LEVEL_CODES[r.risk_level] for r in risks], dtype=np.int8),
+        np.full(n, rules.min_cgpa, dtype=np.float64),
+        np.full(n, rules.max_backlogs, dtype=np.int64),
+        np.full(n, company.is_tech_role, dtype=bool),
+        np.full(n, weights.gpa_weight, dtype=np.float64),
+        np.full(n, weights.skill_weight, dtype=np.float64),
+        np.full(n, weights.communication_weight, dtype=np.float64),
+        np.full(n, weights.mock_interview_weight, dtype=np.float64),
+        bool(apply_credibility_penalty)
+    )
+    
+    return _build_results(
+        [s.student_id for s in matrix.students], [company.company_id] * n,
+        scores, decisions, reasons, credibilities, risks, top_k
+    )
+
+
+def match_student_to_all_jobs(
+    student: StudentProfile,
+    companies: List[JobDescription],
+    placement_logs: List[PlacementLog],
+    apply_credibility_penalty: bool = True,
+    matrix: Optional[JobMatrix] = None,
+    top_k: Optional[int] = None
+) -> List[MatchResult]:
+    """
+    Match one student against every company in a single vectorized pass
+    
+    Same results as calling match_student_to_job per company (input order). Credibility is
+    computed once for the student; pass a prebuilt JobMatrix to reuse the job columns.
+    With top_k, only the best top_k matches are returned, highest score first.
+    """
+    if matrix is None:
+        matrix = JobMatrix(companies)
+    
+    credibility = calculate_credibility(student)
+    company_stats = _get_company_stats(placement_logs)
+    risks = [calculate_risk(student, c, placement_logs, credibility, company_stats) for c in matrix.companies]
+    
+    skills_met = _popcount_rows(matrix.bits & matrix.skill_mask(student.skill_names_lower))
+    m = len(matrix.companies)
+    
+    scores, decisions, reasons = _score_kernel(
+        np.full(m, student.cgpa, dtype=np.float64),
+        np.full(m, student.active_backlogs, dtype=np.int64),
+        np.full(m, student.has_dsa, dtype=bool),
+        np.broadcast_to(np.array(student.scaled_scores, dtype=np.float64), (m, 3)),
+        matrix.ratio_table[np.arange(m), skills_met],
+        np.full(m, LEVEL_CODES[credibility.level], dtype=np.int8),
+        np.array([LEVEL_CODES[r.risk_level] for r in risks], dtype=np.int8),
+        matrix.min_cgpa, matrix.max_backlogs, matrix.is_tech_role,
+        matrix.gpa_weight, matrix.skill_weight, matrix.communication_weight, matrix.mock_interview_weight,
+        bool(apply_credibility_penalty)
+    )
+    
+    return _build_results(
+        [student.student_id] * m, [c.company_id for c in matrix.companies],
+        scores, decisions, reasons, [credibility] * m, risks, top_k
+    )
+
+
+def match_all(
+    students: List[StudentProfile],
+    companies: List[JobDescription],
+    placement_logs: List[PlacementLog],
+    apply_credibility_penalty: bool = True
+) -> List[List[MatchResult]]:
+    """
+    Match every student against every company in one vectorized pass
+    
+    Returns results[i][j] for students[i] x companies[j], identical to match_student_to_job.
+    Credibility and company stats are computed once; skill matches are a (students, companies)
+    popcount over a shared skill vocabulary.
+    """
+    n, m = len(students), len(companies)
+    if not n or not m:
+        return [[] for _ in students]
+    
+    students_mx = StudentMatrix(students)
+    jobs_mx = JobMatrix(companies)
+    credibilities = calculate_credibility_batch(students)
+    company_stats = _get_company_stats(placement_logs)
+    risks = [
+        [calculate_risk(student, company, placement_logs, cred, company_stats) for company in companies]
+        for student, cred in zip(students, credibilities)
+    ]
+    
+    # Job masks over the student vocabulary (skills no student has can never match)
+    job_bits = np.array([students_mx.skill_mask(c.eligibility_rules.mandatory_lower)[0] for c in companies])
+    skills_met = _popcount_rows((students_mx.bits[:, None, :] & job_bits[None, :, :]).reshape(n * m, -1))
+    
+    # Flatten to one entry per (student, company) pair, student-major
+    pair_job = np.tile(np.arange(m), n)
+    scores, decisions, reasons = _score_kernel(
+        np.repeat(students_mx.cgpa, m),
+        np.repeat(students_mx.backlogs, m),
+        np.repeat(students_mx.has_dsa, m),
+        np.repeat(students_mx.scaled, m, axis=0),
+        jobs_mx.ratio_table[pair_job, skills_met],
+        np.repeat(np.array([LEVEL_CODES[c.level] for c in credibilities], dtype=np.int8), m),
+        np.array([LEVEL_CODES[r.risk_level] for row in risks for r in row], dtype=np.int8),
+        jobs_mx.min_cgpa[pair_job], jobs_mx.max_backlogs[pair_job], jobs_mx.is_tech_role[pair_job],
+        jobs_mx.gpa_weight[pair_job], jobs_mx.skill_weight[pair_job],
+        jobs_mx.communication_weight[pair_job], jobs_mx.mock_interview_weight[pair_job],
+        bool(apply_credibility_penalty)
+    )
+    
+    flat = _build_results(
+        [s.student_id for s in students for _ in range(m)],
+        [c.company_id for c in companies] * n,
+        scores, decisions, reasons,
+        [cred for cred in credibilities for _ in range(m)],
+        [r for row in risks for r in row],
+        None
+    )
+    return [flat[i * m:(i + 1) * m] for i in range(n)]
+
+
 # ==================== FEEDBACK LEARNING SYSTEM ====================
 
 def analyze_placement_outcomes(placement_logs: List[PlacementLog]) -> Dict:
@@ -595,39 +1232,45 @@ def analyze_placement_outcomes(placement_logs: List[PlacementLog]) -> Dict:
     
     Returns insights for continuous improvement
     """
-    from data_engine import load_from_json
-    students, companies, _ = load_from_json()
-    student_map = {s.student_id: s for s in students}
-    company_map = {c.company_id: c for c in companies}
-    
-    company_stats = defaultdict(lambda: {
-        "total": 0, "selected": 0, "avg_cgpa": [], "avg_comm": []
-    })
-    
-    for log in placement_logs:
-        company_stats[log.company_id]["total"] += 1
-        
-        if log.interview_result == "selected" and log.student_id in student_map:
-            company_stats[log.company_id]["selected"] += 1
-            student = student_map[log.student_id]
-            company_stats[log.company_id]["avg_cgpa"].append(student.cgpa)
-            company_stats[log.company_id]["avg_comm"].append(student.communication_score)
+    ctx = get_context()
+    student_map = ctx.student_map
+    company_map = ctx.company_map
+    
+    if not placement_logs:
+        return {}
+    
+    # Columnar view of the logs; selected stats only count students we know about
+    cgpa = pd.Series({sid: s.cgpa for sid, s in student_map.items()}, dtype=float)
+    comm = pd.Series({sid: s.communication_score for sid, s in student_map.items()}, dtype=float)
+    student_ids = pd.Series([log.student_id for log in placement_logs])
+    selected = np.array([log.interview_result == "selected" for log in placement_logs])
+    selected &= student_ids.isin(cgpa.index).to_numpy()
+    
+    # Group by company in first-seen order; bincount sums in log order like the old loop
+    codes, company_ids = pd.factorize(pd.Series([log.company_id for log in placement_logs]))
+    groups = len(company_ids)
+    totals = np.bincount(codes, minlength=groups)
+    selected_counts = np.bincount(codes, weights=selected, minlength=groups)
+    cgpa_sums = np.bincount(codes, weights=np.where(selected, student_ids.map(cgpa).fillna(0.0), 0.0), minlength=groups)
+    comm_sums = np.bincount(codes, weights=np.where(selected, student_ids.map(comm).fillna(0.0), 0.0), minlength=groups)
+    stats = zip(company_ids, totals.tolist(), cgpa_sums.tolist(), comm_sums.tolist(), selected_counts.tolist())
     
     insights = {}
-    for company_id, stats in company_stats.items():
+    for company_id, total, cgpa_sum, comm_sum, selected_count in stats:
         if company_id not in company_map:
             continue
         
         company = company_map[company_id]
-        success_rate = stats["selected"] / stats["total"] if stats["total"] > 0 else 0
+        selected_count = int(selected_count)
+        avg_comm = comm_sum / selected_count if selected_count else 0
         
         insights[company.company_name] = {
-            "success_rate": round(success_rate, 2),
-            "total_applicants": stats["total"],
-            "selected_count": stats["selected"],
-            "avg_selected_cgpa": round(sum(stats["avg_cgpa"]) / len(stats["avg_cgpa"]), 2) if stats["avg_cgpa"] else 0,
-            "avg_selected_communication": round(sum(stats["avg_comm"]) / len(stats["avg_comm"]), 2) if stats["avg_comm"] else 0,
-            "recommendation": "Increase communication weight" if stats["avg_comm"] and sum(stats["avg_comm"]) / len(stats["avg_comm"]) > 7 else "Focus on CGPA screening"
+            "success_rate": round(selected_count / total, 2),
+            "total_applicants": total,
+            "selected_count": selected_count,
+            "avg_selected_cgpa": round(cgpa_sum / selected_count, 2) if selected_count else 0,
+            "avg_selected_communication": round(avg_comm, 2),
+            "recommendation": "Increase communication weight" if avg_comm > 7 else "Focus on CGPA screening"
         }
     
     return insights
@@ -668,11 +1311,16 @@ if __name__ == "__main__":
     
     # Test matching
     print("\n=== MATCHING TEST ===")
-    match = match_student_to_job(test_student, test_company, logs)
+    match = match_student_to_job(test_student, test_company, logs, credibility=cred)
     print(f"Decision: {match.decision}")
     print(f"Match Score: {match.match_score}")
     print(f"Failure Reason: {match.failure_reason}")
     
+    # Test batch matching
+    print("\n=== BATCH MATCHING TEST (TOP 5) ===")
+    for result in match_all_students_to_job(students, test_company, logs, top_k=5):
+        print(f"{result.student_id}: {result.decision} ({result.match_score:.2f})")
+    
     # Test explainability
     print("\n=== STUDENT EXPLANATION ===")
     student_msg = generate_student_explanation(
@@ -4,56 +4,95 @@ Run this once to import existing student/company/log data
 """
 
 import json
+from concurrent.futures import ThreadPoolExecutor
 from database import DatabaseManager
 from data_engine import StudentProfile, JobDescription, PlacementLog
 
-def migrate_json_to_postgresql():
-    """Import all JSON data into PostgreSQL"""
-    
-    db = DatabaseManager()
-    
-    print("🔄 Starting data migration from JSON to PostgreSQL...\n")
-    
-    # Import Students
+# Optional: incremental JSON parsing (falls back to json.load of the whole file)
+try:
+    import ijson
+    HAS_IJSON = True
+except ImportError:
+    HAS_IJSON = False
+
+# Records parsed and written per bulk_save_* call
+MIGRATE_BATCH_SIZE = 1000
+
+
+def _iter_json_array(f):
+    """Yield the items of a top-level JSON array - streamed with ijson when available"""
+    if HAS_IJSON:
+        # use_float=True keeps CGPA/trust scores as float instead of Decimal
+        return ijson.items(f, "item", use_float=True)
+    return iter(json.load(f))
+
+
+def _import_in_batches(path: str, model, save) -> int:
+    """Parse path into model objects and save them in MIGRATE_BATCH_SIZE chunks; returns the count"""
+    total = 0
+    batch = []
+    with open(path, "rb" if HAS_IJSON else "r") as f:
+        for obj in _iter_json_array(f):
+            batch.append(model(**obj))
+            if len(batch) == MIGRATE_BATCH_SIZE:
+                save(batch)
+                total += len(batch)
+                batch = []
+    if batch:
+        save(batch)
+        total += len(batch)
+    return total
+
+
+def import_students(db: DatabaseManager):
+    """Import students.json"""
     try:
-        with open("students.json", "r") as f:
-            students_data = json.load(f)
-            students = [StudentProfile(**s) for s in students_data]
-            db.bulk_save_students(students)
+        _import_in_batches("students.json", StudentProfile, db.bulk_save_students)
     except FileNotFoundError:
         print("⚠️ students.json not found - skipping students")
     except Exception as e:
         print(f"❌ Error importing students: {e}")
-    
-    # Import Companies
+
+
+def import_companies(db: DatabaseManager):
+    """Import jobs.json"""
     try:
-        with open("jobs.json", "r") as f:
-            jobs_data = json.load(f)
-            companies = [JobDescription(**j) for j in jobs_data]
-            db.bulk_save_companies(companies)
+        _import_in_batches("jobs.json", JobDescription, db.bulk_save_companies)
     except FileNotFoundError:
         print("⚠️ jobs.json not found - skipping companies")
     except Exception as e:
         print(f"❌ Error importing companies: {e}")
-    
-    # Import Logs
+
+
+def import_logs(db: DatabaseManager):
+    """Import logs.json"""
     try:
-        with open("logs.json", "r") as f:
-            logs_data = json.load(f)
-            logs = [PlacementLog(**l) for l in logs_data]
-            db.bulk_save_logs(logs)
+        _import_in_batches("logs.json", PlacementLog, db.bulk_save_logs)
     except FileNotFoundError:
         print("⚠️ logs.json not found - skipping logs")
     except Exception as e:
         print(f"❌ Error importing logs: {e}")
+
+
+def migrate_json_to_postgresql():
+    """Import all JSON data into PostgreSQL"""
+    
+    db = DatabaseManager()
+    
+    print("🔄 Starting data migration from JSON to PostgreSQL...\n")
+    
+    # Students and companies are independent - import them on two pooled connections at once.
+    # Logs reference both, so they go in only after the first two have finished.
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        for future in [executor.submit(import_students, db), executor.submit(import_companies, db)]:
+            future.result()
+    import_logs(db)
     
     print("\n✅ Data migration complete!")
     
     # Verify import
     print("\n📊 Database Summary:")
-    students = db.get_all_students()
-    companies = db.get_all_companies()
-    logs = db.get_all_logs()
+    students, companies, logs = db.get_all()
     
     print(f"  - Students: {len(students)}")
     print(f"  - Companies: {len(companies)}")
@@ -14,16 +14,26 @@ Author: Senior Systems Engineer + Placement Analytics Consultant
 
 from typing import List, Dict, Optional, Tuple
 from pydantic import BaseModel, Field
-from collections import defaultdict
+from collections import namedtuple
 import random
 import json
 from datetime import datetime
 import math
+import logging
+from bisect import bisect_right
+from types import MappingProxyType
+import numpy as np
+from data_engine import njit, HAS_NUMBA, Skill, SkillEvidence
+
+logger = logging.getLogger(__name__)
 
 # ==================== UPGRADE 1: SEAT ALLOCATION MODELS ====================
 
 class SeatAllocationResult:
     """Result of company seat allocation"""
+    __slots__ = ("company_id", "company_name", "open_positions", "total_applicants",
+                 "selected_students", "waitlisted_students", "rejected_students", "cutoff_score")
+    
     def __init__(
         self,
         company_id: str,
@@ -59,12 +69,17 @@ class SeatAllocationResult:
         }
 
 
+# Failure reasons that exclude a student from seat ranking (failed basic eligibility)
+INELIGIBLE_REASONS = frozenset({"cgpa", "backlogs", "low_dsa"})
+
+
 def allocate_seats(
     students: List,
     company,
     logs: List,
     match_function,
-    open_positions: int = None
+    open_positions: int = None,
+    credibilities: Optional[Dict] = None
 ) -> SeatAllocationResult:
     """
     UPGRADE 1: Company Seat Allocation with Ranking
@@ -77,13 +92,20 @@ def allocate_seats(
     2. Sort by: final_score (desc), risk_score (asc for ties)
     3. Select top N = open_positions
     4. Remaining  REJECTED (reason: seat_limit)
+    
+    credibilities: optional {student_id: CredibilityResult}, passed to match_function
+    as credibility= so allocating across many companies scores each student once;
+    students missing from it get credibility=None and match_function computes it
     """
     positions = open_positions or getattr(company, 'open_positions', 5)
     
     # Get all matches
     all_matches = []
     for student in students:
-        match = match_function(student, company, logs)
+        if credibilities is None:
+            match = match_function(student, company, logs)
+        else:
+            match = match_function(student, company, logs, credibility=credibilities.get(student.student_id))
         all_matches.append({
             "student_id": student.student_id,
             "name": student.name,
@@ -98,15 +120,22 @@ def allocate_seats(
             "failure_reason": match.failure_reason
         })
     
-    # Separate eligible and ineligible
-    eligible = [m for m in all_matches if m["original_decision"] != "rejected" or m["failure_reason"] in ["seat_limit", None]]
-    ineligible = [m for m in all_matches if m["original_decision"] == "rejected" and m["failure_reason"] not in ["seat_limit", None]]
-    
-    # Re-evaluate: include all who passed basic eligibility
-    eligible_for_ranking = [m for m in all_matches if m["failure_reason"] not in ["cgpa", "backlogs", "low_dsa"]]
+    # One pass: basic-eligibility failures are set aside, everyone else is ranked
+    ineligible = []
+    ranked_idx = []
+    for i, m in enumerate(all_matches):
+        if m["failure_reason"] in INELIGIBLE_REASONS:
+            ineligible.append(m)
+        else:
+            ranked_idx.append(i)
+    ranked_idx = np.array(ranked_idx, dtype=np.intp)
     
-    # Sort by match_score (descending), then by risk_score (ascending for ties)
-    eligible_for_ranking.sort(key=lambda x: (-x["match_score"], x["risk_score"]))
+    # Rank columns: match_score (descending), then risk_score (ascending for ties).
+    # lexsort is stable, so equal keys keep input order exactly like list.sort did.
+    match_scores = np.fromiter((m["match_score"] for m in all_matches), dtype=np.float64, count=len(all_matches))
+    risk_scores = np.fromiter((m["risk_score"] for m in all_matches), dtype=np.float64, count=len(all_matches))
+    order = ranked_idx[np.lexsort((risk_scores[ranked_idx], -match_scores[ranked_idx]))]
+    eligible_for_ranking = [all_matches[i] for i in order]
     
     # Allocate seats
     selected = []
@@ -167,7 +196,7 @@ def generate_allocation_officer_report(allocation: SeatAllocationResult, student
     if not student_data:
         return f"Student {student_id} not found in allocation results."
     
-    report = f"""
+    parts = [f"""
 === SEAT ALLOCATION REPORT ===
 Company: {allocation.company_name}
 Open Positions: {allocation.open_positions}
@@ -185,15 +214,15 @@ Credibility: {student_data['credibility_level']} ({student_data['credibility_sco
 
 --- ALLOCATION RESULT ---
 Final Decision: {student_data['final_decision'].upper()}
-"""
+"""]
     
     if student_data.get('rank'):
-        report += f"Rank: {student_data['rank']} / {student_data['total_applicants']} applicants\n"
+        parts.append(f"Rank: {student_data['rank']} / {student_data['total_applicants']} applicants\n")
     
-    report += f"Reason: {student_data['selection_reason']}\n"
+    parts.append(f"Reason: {student_data['selection_reason']}\n")
     
     if student_data['final_decision'] == 'rejected' and student_data.get('failure_reason') == 'seat_limit':
-        report += f"""
+        parts.append(f"""
 --- SEAT LIMITATION DETAILS ---
 Your Score: {student_data['match_score']:.2f}
 Cutoff Score: {allocation.cutoff_score:.2f}
@@ -203,9 +232,9 @@ Recommendation: Improve profile for next recruitment cycle
 - Add 2+ GitHub projects
 - Improve communication score
 - Target companies with more open positions
-"""
+""")
     
-    return report
+    return "".join(parts)
 
 
 
@@ -227,6 +256,8 @@ class StudentProfileSnapshot(BaseModel):
 
 class TemporalProfile:
     """Track student improvement over semesters"""
+    __slots__ = ("student_id", "name", "branch", "history", "improvement_events")
+    
     def __init__(self, student_id: str, name: str, branch: str):
         self.student_id = student_id
         self.name = name
@@ -273,11 +304,37 @@ class TemporalProfile:
         }
 
 
+class _EvidenceState:
+    """Mutable copy of a skill's evidence for the growth simulation (plain slots, no validation)"""
+    __slots__ = ("github", "projects", "certifications", "internship")
+    
+    def __init__(self, evidence):
+        self.github = evidence.github
+        self.projects = evidence.projects
+        self.certifications = evidence.certifications
+        self.internship = evidence.internship
+
+
+class _SkillState:
+    """Skill stand-in with its own evidence - same attributes the credibility functions read"""
+    __slots__ = ("name", "claimed_level", "evidence")
+    
+    def __init__(self, skill):
+        self.name = skill.name
+        self.claimed_level = skill.claimed_level
+        self.evidence = _EvidenceState(skill.evidence)
+
+
+# Minimal student for credibility checks during the growth simulation
+_TempStudent = namedtuple("_TempStudent", ["skills", "resume_trust_score"])
+
+
 def simulate_student_growth(
     student,
     calculate_credibility_func,
     semesters: List[int] = [5, 6, 7, 8],
-    is_motivated: bool = None
+    is_motivated: bool = None,
+    seed: Optional[int] = None
 ) -> TemporalProfile:
     """
     UPGRADE 2: Simulate student profile improvement over time
@@ -291,9 +348,11 @@ def simulate_student_growth(
     - Motivated students: +1 project/semester, +1 communication every 2 semesters
     - Shortlisted students: +1 communication after feedback
     - All students: slight CGPA drift (+/- 0.1 per semester)
-    """
-    import copy
     
+    seed: draw from a private random.Random(seed) for a reproducible growth path
+        (default: the shared random module, as before)
+    """
+    rng = random if seed is None else random.Random(seed)
     temporal = TemporalProfile(student.student_id, student.name, student.branch)
     
     # Determine if student is motivated (based on existing traits or random)
@@ -304,7 +363,7 @@ def simulate_student_growth(
     current_cgpa = student.cgpa
     current_communication = student.communication_score
     current_mock = student.mock_interview_score
-    current_skills = copy.deepcopy(student.skills)
+    current_skills = [_SkillState(skill) for skill in student.skills]  # only evidence changes below
     
     for sem in semesters:
         event = None
@@ -312,15 +371,15 @@ def simulate_student_growth(
         # Simulate improvements
         if is_motivated:
             # Add projects to random skill
-            if sem > semesters[0] and random.random() > 0.3:
-                skill_to_improve = random.choice(current_skills)
+            if sem > semesters[0] and rng.random() > 0.3:
+                skill_to_improve = rng.choice(current_skills)
                 if skill_to_improve.evidence.projects < 5:
                     skill_to_improve.evidence.projects += 1
                     event = f"Added project to {skill_to_improve.name}"
             
             # Add GitHub repo
-            if sem > semesters[0] and random.random() > 0.5:
-                skill_to_improve = random.choice([s for s in current_skills if not s.evidence.github] or current_skills)
+            if sem > semesters[0] and rng.random() > 0.5:
+                skill_to_improve = rng.choice([s for s in current_skills if not s.evidence.github] or current_skills)
                 if not skill_to_improve.evidence.github:
                     skill_to_improve.evidence.github = True
                     event = f"Created GitHub repo for {skill_to_improve.name}"
@@ -331,36 +390,33 @@ def simulate_student_growth(
                 event = "Communication improved through mock interviews"
         
         # CGPA drift (slight changes)
-        cgpa_drift = random.uniform(-0.1, 0.15)
+        cgpa_drift = rng.uniform(-0.1, 0.15)
         current_cgpa = max(5.0, min(9.8, current_cgpa + cgpa_drift))
         
         # Mock interview improvement
-        if sem > semesters[0] and random.random() > 0.6 and current_mock < 10:
+        if sem > semesters[0] and rng.random() > 0.6 and current_mock < 10:
             current_mock += 1
         
-        # Calculate current credibility
-        # Create temporary student for credibility calculation
-        class TempStudent:
-            def __init__(self, skills, trust_score):
-                self.skills = skills
-                self.resume_trust_score = trust_score
-        
-        temp_student = TempStudent(current_skills, 0.5)
+        # Calculate current credibility on a temporary student
+        temp_student = _TempStudent(current_skills, 0.5)
         cred = calculate_credibility_func(temp_student)
         
-        # Calculate trust score
-        total_evidence = sum(
-            (0.4 if s.evidence.github else 0) +
-            0.3 * (s.evidence.projects / 5) +
-            0.2 * (s.evidence.certifications / 3) +
-            (0.3 if s.evidence.internship else 0)
-            for s in current_skills
-        )
+        # Trust score, GitHub and certification counts in one pass over the skills
+        total_evidence = 0
+        github_count = 0
+        cert_count = 0
+        for s in current_skills:
+            evidence = s.evidence
+            total_evidence += (
+                (0.4 if evidence.github else 0) +
+                0.3 * (evidence.projects / 5) +
+                0.2 * (evidence.certifications / 3) +
+                (0.3 if evidence.internship else 0)
+            )
+            github_count += evidence.github
+            cert_count += evidence.certifications
         trust_score = min(1.0, total_evidence / len(current_skills)) if current_skills else 0.5
         
-        github_count = sum(1 for s in current_skills if s.evidence.github)
-        cert_count = sum(s.evidence.certifications for s in current_skills)
-        
         snapshot = StudentProfileSnapshot(
             semester=sem,
             cgpa=round(current_cgpa, 2),
@@ -379,32 +435,36 @@ def simulate_student_growth(
     return temporal
 
 
+# Credibility level markers for the growth timeline (read-only, shared across calls)
+LEVEL_EMOJI = MappingProxyType({"HIGH": "[OK]", "MEDIUM": "[--]", "LOW": "[!!]"})
+
+
 def generate_growth_timeline(temporal: TemporalProfile) -> str:
     """Generate human-readable growth timeline"""
     
-    timeline = f"""
+    parts = [f"""
 === STUDENT GROWTH TIMELINE ===
 Student: {temporal.name} ({temporal.student_id})
 Branch: {temporal.branch}
 
-"""
+"""]
     
     for snapshot in temporal.history:
-        level_emoji = {"HIGH": "[OK]", "MEDIUM": "[--]", "LOW": "[!!]"}.get(snapshot.credibility_level, "[??]")
+        level_emoji = LEVEL_EMOJI.get(snapshot.credibility_level, "[??]")
         
-        timeline += f"""Semester {snapshot.semester}:
+        parts.append(f"""Semester {snapshot.semester}:
   CGPA: {snapshot.cgpa}
   Communication: {snapshot.communication_score}/10
   Mock Interview: {snapshot.mock_interview_score}/10
   GitHub Projects: {snapshot.github_projects}
   Certifications: {snapshot.certifications}
   Credibility: {level_emoji} {snapshot.credibility_level} ({snapshot.resume_trust_score:.2f})
-"""
+""")
     
     # Summary
     growth = temporal.get_growth_summary()
     if growth.get("growth") != "insufficient_data":
-        timeline += f"""
+        parts.append(f"""
 --- GROWTH SUMMARY ---
 Semesters: {growth['semesters_tracked']}
 CGPA Change: {growth['cgpa_change']:+.2f}
@@ -413,21 +473,47 @@ GitHub Projects Added: {growth['github_projects_added']}
 Certifications Added: {growth['certifications_added']}
 Credibility Evolution: {growth['credibility_change']}
 Trust Score Change: {growth['trust_score_change']:+.2f}
-"""
+""")
     
     if temporal.improvement_events:
-        timeline += "\n--- KEY EVENTS ---\n"
+        parts.append("\n--- KEY EVENTS ---\n")
         for event in temporal.improvement_events:
-            timeline += f"Sem {event['semester']}: {event['event']}\n"
+            parts.append(f"Sem {event['semester']}: {event['event']}\n")
     
-    return timeline
+    return "".join(parts)
 
 
 
 # ==================== UPGRADE 3: ML SUCCESS PROBABILITY ====================
 
+# Confidence bands: HIGH when p <= 0.25 or p >= 0.75, MEDIUM when p <= 0.4 or p >= 0.6, else LOW.
+# bisect_right counts edges <= p, so the closed lower bounds use the next float up.
+CONFIDENCE_EDGES = (math.nextafter(0.25, 1.0), math.nextafter(0.4, 1.0), 0.6, 0.75)
+CONFIDENCE_LABELS = ("HIGH", "MEDIUM", "LOW", "MEDIUM", "HIGH")
+CONFIDENCE_INDICATOR = MappingProxyType({"HIGH": "[***]", "MEDIUM": "[**-]", "LOW": "[*--]"})
+
+# Report interpretation by probability (p >= 0.3 / 0.5 / 0.7)
+INTERPRETATION_EDGES = (0.3, 0.5, 0.7)
+INTERPRETATION_TEXT = (
+    "Very low chance. Consider targeting different companies.\n",
+    "Weak candidate. Significant improvement needed.\n",
+    "Moderate candidate. Outcome depends on interview performance.\n",
+    "Strong candidate. High likelihood of selection.\n",
+)
+
+# Report bars by length (20 = 100%), indexed instead of building "#" * n per row
+BARS = tuple("#" * n for n in range(21))
+
+# Model inputs in column order; TrainingData.X columns follow it
+ML_FEATURES = ("cgpa", "credibility_score", "communication_score",
+               "risk_score", "skill_match_ratio", "mock_interview_score")
+TrainingData = namedtuple("TrainingData", ["X", "y"])
+
+
 class MLPredictionResult:
     """Result of ML-based success probability prediction"""
+    __slots__ = ("student_id", "company_id", "probability", "confidence", "feature_importance", "model_used")
+    
     def __init__(
         self,
         student_id: str,
@@ -455,6 +541,55 @@ class MLPredictionResult:
         }
 
 
+@njit(cache=True)
+def _sgd_kernel(X, y, w, b, learning_rate, epochs, losses):
+    """
+    Per-sample logistic regression SGD over a normalized (N, F) matrix
+    
+    Updates w in place, writes the mean log-loss of each epoch into losses and
+    returns the new bias. Same operation order as the original dict-based loop
+    (no fastmath), so trained weights are unchanged.
+    """
+    n, f = X.shape
+    for epoch in range(epochs):
+        total_loss = 0.0
+        for i in range(n):
+            # Forward pass
+            z = b
+            for k in range(f):
+                z += w[k] * X[i, k]
+            z = max(-500.0, min(500.0, z))  # Prevent overflow
+            pred = 1.0 / (1.0 + math.exp(-z))
+            
+            # Log-loss in softplus form: stable, no epsilon
+            total_loss += (z if z > 0.0 else 0.0) - z * y[i] + math.log1p(math.exp(-abs(z)))
+            
+            # Backward pass (gradient descent)
+            error = pred - y[i]
+            for k in range(f):
+                w[k] -= learning_rate * error * X[i, k]
+            b -= learning_rate * error
+        losses[epoch] = total_loss / n
+    return b
+
+
+def warm_up_kernels():
+    """
+    Compile (or load from the on-disk cache) the numba kernels so the first train() / audit doesn't pay for it
+    
+    Call explicitly at startup; a failure only means the first train() / audit compiles instead.
+    """
+    if not HAS_NUMBA:
+        return
+    try:
+        _sgd_kernel(np.zeros((1, 6)), np.zeros(1), np.zeros(6), 0.0, 0.01, 1, np.zeros(1))
+        _audit_kernel(np.zeros(1), np.zeros(1), np.zeros(1, dtype=np.int64), np.zeros(1, dtype=np.int64),
+                      np.zeros(1, dtype=np.bool_), len(CRED_LEVELS), 1, CGPA_BUCKET_EDGES, COMM_BUCKET_EDGES,
+                      CRED_LEVEL_IDS["HIGH"])
+    except Exception as e:
+        logger.warning("numba warm-up skipped: %s", e)
+
+
 class PlacementSuccessPredictor:
     """
     UPGRADE 3: ONE Real ML Model - Logistic Regression
@@ -472,23 +607,37 @@ class PlacementSuccessPredictor:
     """
     
     def __init__(self):
-        self.weights = None
+        self._w = None  # weight array, ordered like _feature_names
+        self._feature_names = []
+        self._means = None  # per-feature normalization stats, same order
+        self._stds = None
         self.bias = 0.0
-        self.feature_means = {}
-        self.feature_stds = {}
+        self.loss_history = None  # mean log-loss per training epoch
+        self._feature_importance = {}  # |weight| shares, fixed once training finishes
         self.is_trained = False
     
+    @property
+    def feature_means(self) -> Dict[str, float]:
+        """Training means by feature name (for reporting)"""
+        return {} if self._means is None else dict(zip(self._feature_names, self._means.tolist()))
+    
+    @property
+    def feature_stds(self) -> Dict[str, float]:
+        """Training standard deviations by feature name (for reporting)"""
+        return {} if self._stds is None else dict(zip(self._feature_names, self._stds.tolist()))
+    
+    @property
+    def weights(self) -> Optional[Dict[str, float]]:
+        """Feature weights by name (built from the weight array)"""
+        if self._w is None:
+            return None
+        return dict(zip(self._feature_names, self._w.tolist()))
+    
     def _sigmoid(self, z: float) -> float:
         """Sigmoid activation function"""
         z = max(-500, min(500, z))  # Prevent overflow
         return 1.0 / (1.0 + math.exp(-z))
     
-    def _normalize(self, value: float, mean: float, std: float) -> float:
-        """Normalize feature value"""
-        if std == 0:
-            return 0.0
-        return (value - mean) / std
-    
     def _extract_features(
         self,
         student,
@@ -507,11 +656,21 @@ class PlacementSuccessPredictor:
             "mock_interview_score": student.mock_interview_score
         }
     
-    def train(self, training_data: List[Dict], learning_rate: float = 0.1, epochs: int = 100):
+    def train(
+        self,
+        training_data,
+        learning_rate: float = 0.1,
+        epochs: int = 100,
+        batch_size: Optional[int] = None
+    ):
         """
         Train logistic regression using gradient descent
         
-        training_data format:
+        batch_size: None = per-sample SGD (default); otherwise mini-batch gradient
+        descent with one matrix product per batch (len(training_data) = full batch)
+        
+        training_data: a TrainingData (X, y) from prepare_training_arrays, or the
+        list-of-dicts format:
         [
             {
                 "cgpa": 8.5,
@@ -524,53 +683,68 @@ class PlacementSuccessPredictor:
             }
         ]
         """
-        if not training_data:
+        features = list(ML_FEATURES)
+        
+        # One (N, F) feature matrix and label vector instead of per-sample dict lookups
+        if isinstance(training_data, TrainingData):
+            X = np.asarray(training_data.X, dtype=np.float64)
+            y = np.asarray(training_data.y, dtype=np.float64)
+        else:
+            X = np.array([[d[feat] for feat in features] for d in training_data], dtype=np.float64)
+            y = np.array([d["outcome"] for d in training_data], dtype=np.float64)
+        if len(y) == 0:
             return
         
         # Calculate means and stds for normalization
-        features = ["cgpa", "credibility_score", "communication_score", 
-                   "risk_score", "skill_match_ratio", "mock_interview_score"]
-        
-        for feat in features:
-            values = [d[feat] for d in training_data]
-            self.feature_means[feat] = sum(values) / len(values)
-            variance = sum((v - self.feature_means[feat])**2 for v in values) / len(values)
-            self.feature_stds[feat] = max(0.001, variance ** 0.5)
+        self._feature_names = features
+        self._means = X.mean(axis=0)
+        self._stds = np.maximum(X.std(axis=0), 0.001)
         
         # Initialize weights
-        self.weights = {feat: random.uniform(-0.1, 0.1) for feat in features}
+        self._w = np.array([random.uniform(-0.1, 0.1) for feat in features], dtype=np.float64)
         self.bias = 0.0
         
-        # Gradient descent
-        for epoch in range(epochs):
-            total_loss = 0
-            
-            for data in training_data:
-                # Forward pass
-                z = self.bias
-                for feat in features:
-                    norm_val = self._normalize(data[feat], self.feature_means[feat], self.feature_stds[feat])
-                    z += self.weights[feat] * norm_val
-                
-                pred = self._sigmoid(z)
-                actual = data["outcome"]
-                
-                # Calculate loss
-                epsilon = 1e-7
-                loss = -(actual * math.log(pred + epsilon) + (1-actual) * math.log(1-pred + epsilon))
-                total_loss += loss
-                
-                # Backward pass (gradient descent)
-                error = pred - actual
-                
-                for feat in features:
-                    norm_val = self._normalize(data[feat], self.feature_means[feat], self.feature_stds[feat])
-                    self.weights[feat] -= learning_rate * error * norm_val
-                
-                self.bias -= learning_rate * error
+        # Normalize once; the numba kernel (or the mini-batch loop) runs the epochs
+        X_norm = (X - self._means) / self._stds
+        
+        if batch_size is None:
+            self.loss_history = np.zeros(int(epochs), dtype=np.float64)
+            self.bias = float(_sgd_kernel(
+                X_norm, y, self._w, self.bias, float(learning_rate), int(epochs), self.loss_history
+            ))
+        else:
+            self._train_batches(X_norm, y, learning_rate, epochs, batch_size)
+        
+        # Feature importance (absolute weight values) only changes when the weights do
+        weights = self.weights
+        total_weight = sum(abs(w) for w in weights.values())
+        self._feature_importance = {
+            feat: round(abs(w) / total_weight, 3)
+            for feat, w in weights.items()
+        } if total_weight > 0 else {}
         
         self.is_trained = True
     
+    def _train_batches(self, X_norm: np.ndarray, y: np.ndarray, learning_rate: float, epochs: int, batch_size: int):
+        """Mini-batch gradient descent: averaged gradient per batch, weights updated in place"""
+        n = len(y)
+        batch_size = max(1, min(batch_size, n))
+        w = self._w
+        b = self.bias
+        self.loss_history = np.zeros(epochs, dtype=np.float64)
+        for epoch in range(epochs):
+            total_loss = 0.0
+            for start in range(0, n, batch_size):
+                X_batch = X_norm[start:start + batch_size]
+                y_batch = y[start:start + batch_size]
+                z = np.clip(X_batch @ w + b, -500, 500)  # Prevent overflow
+                total_loss += (np.maximum(z, 0.0) - z * y_batch + np.log1p(np.exp(-np.abs(z)))).sum()
+                error = 1.0 / (1.0 + np.exp(-z)) - y_batch
+                w -= learning_rate * (X_batch.T @ error) / len(y_batch)
+                b -= learning_rate * error.mean()
+            self.loss_history[epoch] = total_loss / n
+        self.bias = float(b)
+    
     def predict(
         self,
         student,
@@ -597,47 +771,96 @@ class PlacementSuccessPredictor:
                 student, company, credibility_score, risk_score, skill_match_ratio
             )
             
+            x = np.array([features[feat] for feat in self._feature_names], dtype=np.float64)
             z = self.bias
-            for feat, val in features.items():
-                norm_val = self._normalize(val, self.feature_means[feat], self.feature_stds[feat])
-                z += self.weights[feat] * norm_val
+            for w, norm_val in zip(self._w.tolist(), ((x - self._means) / self._stds).tolist()):
+                z += w * norm_val
             
             probability = self._sigmoid(z)
         
         # Determine confidence level
-        if probability >= 0.75 or probability <= 0.25:
-            confidence = "HIGH"
-        elif probability >= 0.6 or probability <= 0.4:
-            confidence = "MEDIUM"
-        else:
-            confidence = "LOW"
-        
-        # Feature importance (absolute weight values)
-        feature_importance = {}
-        if self.weights:
-            total_weight = sum(abs(w) for w in self.weights.values())
-            if total_weight > 0:
-                feature_importance = {
-                    feat: round(abs(w) / total_weight, 3)
-                    for feat, w in self.weights.items()
-                }
+        confidence = CONFIDENCE_LABELS[bisect_right(CONFIDENCE_EDGES, probability)]
         
         return MLPredictionResult(
             student_id=student.student_id,
             company_id=company.company_id,
             probability=probability,
             confidence=confidence,
-            feature_importance=feature_importance
+            feature_importance=self._feature_importance
         )
+    
+    def predict_batch(
+        self,
+        students: List,
+        credibility_scores,
+        risk_scores,
+        skill_match_ratios
+    ) -> np.ndarray:
+        """
+        Success probabilities for many matches at once (same model as predict)
+        
+        credibility_scores: one per student, shape (S,)
+        risk_scores, skill_match_ratios: per match, shape (S,) or (S, C) for a
+            students x companies grid (the company only enters through these)
+        
+        Returns probabilities broadcast to (S,) or (S, C); values agree with
+        predict() up to float rounding of the summation order.
+        """
+        cgpa = np.array([s.cgpa for s in students], dtype=np.float64)
+        communication = np.array([s.communication_score for s in students], dtype=np.float64)
+        mock = np.array([s.mock_interview_score for s in students], dtype=np.float64)
+        credibility = np.asarray(credibility_scores, dtype=np.float64)
+        risk = np.asarray(risk_scores, dtype=np.float64)
+        skill_match = np.asarray(skill_match_ratios, dtype=np.float64)
+        
+        # Per-student columns broadcast against per-match (S, C) columns
+        extra_dims = (1,) * (max(risk.ndim, skill_match.ndim) - 1)
+        cgpa, credibility, communication, mock = (
+            x.reshape(x.shape + extra_dims) for x in (cgpa, credibility, communication, mock)
+        )
+        
+        if not self.is_trained:
+            # Same heuristic as predict()
+            base_prob = (
+                0.2 * (cgpa / 10) +
+                0.25 * credibility +
+                0.2 * (communication / 10) +
+                0.15 * (1 - risk / 10) +
+                0.2 * skill_match
+            )
+            return np.clip(base_prob, 0.05, 0.95)
+        
+        # Feature matrix in training order, normalized, then one matmul
+        columns = {
+            "cgpa": cgpa,
+            "credibility_score": credibility,
+            "communication_score": communication,
+            "risk_score": risk,
+            "skill_match_ratio": skill_match,
+            "mock_interview_score": mock
+        }
+        X = np.stack(np.broadcast_arrays(*(columns[feat] for feat in self._feature_names)), axis=-1)
+        return self.predict_proba(X)
+    
+    def predict_proba(self, X) -> np.ndarray:
+        """
+        Success probabilities for raw (unnormalized) feature rows of a trained model
+        
+        X: shape (..., F) with columns in training order (self._feature_names),
+           e.g. the training_data features stacked into one matrix
+        """
+        if not self.is_trained:
+            raise ValueError("predict_proba needs a trained model - call train() first")
+        X = np.asarray(X, dtype=np.float64)
+        z = np.clip(((X - self._means) / self._stds) @ self._w + self.bias, -500, 500)  # Prevent overflow
+        return 1.0 / (1.0 + np.exp(-z))
 
 
-def prepare_training_data(students: List, companies: List, logs: List, calculate_credibility_func) -> List[Dict]:
-    """Prepare training data from placement logs"""
-    
+def _training_rows(students: List, companies: List, logs: List, calculate_credibility_func, credibilities: Optional[Dict]):
+    """Yield one ML_FEATURES-ordered row plus outcome per usable log"""
     student_map = {s.student_id: s for s in students}
     company_map = {c.company_id: c for c in companies}
-    
-    training_data = []
+    cred_cache = {} if credibilities is None else dict(credibilities)
     
     for log in logs:
         if log.student_id not in student_map or log.company_id not in company_map:
@@ -646,40 +869,67 @@ def prepare_training_data(students: List, companies: List, logs: List, calculate
         student = student_map[log.student_id]
         company = company_map[log.company_id]
         
-        # Calculate credibility
-        cred = calculate_credibility_func(student)
+        # Calculate credibility (once per student - it does not depend on the company)
+        cred = cred_cache.get(log.student_id)
+        if cred is None:
+            cred = cred_cache[log.student_id] = calculate_credibility_func(student)
         
         # Calculate skill match ratio
-        student_skills = {s.name.lower() for s in student.skills}
-        required_skills = set(s.lower() for s in company.eligibility_rules.mandatory_skills)
-        match_ratio = len(student_skills & required_skills) / len(required_skills) if required_skills else 0.5
+        rules = company.eligibility_rules
+        match_ratio = rules.mandatory_ratios[(student.skill_bits & rules.mandatory_bits).bit_count()] if rules.mandatory_bits else 0.5
         
-        # Determine outcome
-        outcome = 1 if log.interview_result == "selected" else 0
-        
-        training_data.append({
-            "cgpa": student.cgpa,
-            "credibility_score": cred.score,
-            "communication_score": student.communication_score,
-            "risk_score": 0,  # Will be calculated separately
-            "skill_match_ratio": match_ratio,
-            "mock_interview_score": student.mock_interview_score,
-            "outcome": outcome
-        })
+        yield (
+            student.cgpa,
+            cred.score,
+            student.communication_score,
+            0,  # risk_score - will be calculated separately
+            match_ratio,
+            student.mock_interview_score,
+            1 if log.interview_result == "selected" else 0  # outcome
+        )
+
+
+def prepare_training_data(
+    students: List,
+    companies: List,
+    logs: List,
+    calculate_credibility_func,
+    credibilities: Optional[Dict] = None
+) -> List[Dict]:
+    """
+    Prepare training data from placement logs
     
-    return training_data
+    credibilities: optional {student_id: CredibilityResult} already computed by the
+    caller; students missing from it are scored with calculate_credibility_func
+    """
+    return [
+        dict(zip(ML_FEATURES, row[:-1]), outcome=row[-1])
+        for row in _training_rows(students, companies, logs, calculate_credibility_func, credibilities)
+    ]
+
+
+def prepare_training_arrays(
+    students: List,
+    companies: List,
+    logs: List,
+    calculate_credibility_func,
+    credibilities: Optional[Dict] = None
+) -> TrainingData:
+    """
+    prepare_training_data as columns: X (N, F) float64 in ML_FEATURES order and
+    y (N,) int8 outcomes, without the intermediate list of per-row dicts
+    """
+    rows = np.array(
+        list(_training_rows(students, companies, logs, calculate_credibility_func, credibilities)),
+        dtype=np.float64
+    ).reshape(-1, len(ML_FEATURES) + 1)
+    return TrainingData(X=rows[:, :-1], y=rows[:, -1].astype(np.int8))
 
 
 def generate_ml_prediction_report(prediction: MLPredictionResult, student_name: str, company_name: str) -> str:
     """Generate ML prediction explanation"""
     
-    confidence_indicator = {
-        "HIGH": "[***]",
-        "MEDIUM": "[**-]",
-        "LOW": "[*--]"
-    }
-    
-    report = f"""
+    parts = [f"""
 === ML SUCCESS PROBABILITY PREDICTION ===
 Model: {prediction.model_used}
 Student: {student_name} ({prediction.student_id})
@@ -687,33 +937,22 @@ Company: {company_name} ({prediction.company_id})
 
 --- PREDICTION ---
 Success Probability: {prediction.probability:.1%}
-Decision Confidence: {confidence_indicator[prediction.confidence]} {prediction.confidence}
+Decision Confidence: {CONFIDENCE_INDICATOR[prediction.confidence]} {prediction.confidence}
 
 --- FEATURE IMPORTANCE ---
-"""
+"""]
     
     if prediction.feature_importance:
         sorted_features = sorted(prediction.feature_importance.items(), key=lambda x: -x[1])
         for feat, importance in sorted_features:
-            bar = "#" * int(importance * 20)
-            report += f"  {feat:25s}: {importance:.1%} {bar}\n"
-    
-    report += f"""
---- INTERPRETATION ---
-"""
+            bar = BARS[min(20, int(importance * 20))]
+            parts.append(f"  {feat:25s}: {importance:.1%} {bar}\n")
     
-    if prediction.probability >= 0.7:
-        report += "Strong candidate. High likelihood of selection.\n"
-    elif prediction.probability >= 0.5:
-        report += "Moderate candidate. Outcome depends on interview performance.\n"
-    elif prediction.probability >= 0.3:
-        report += "Weak candidate. Significant improvement needed.\n"
-    else:
-        report += "Very low chance. Consider targeting different companies.\n"
+    parts.append("\n--- INTERPRETATION ---\n")
+    parts.append(INTERPRETATION_TEXT[bisect_right(INTERPRETATION_EDGES, prediction.probability)])
+    parts.append("\nNote: ML prediction is for decision CONFIDENCE, not the decision itself.\n")
     
-    report += "\nNote: ML prediction is for decision CONFIDENCE, not the decision itself.\n"
-    
-    return report
+    return "".join(parts)
 
 
 
@@ -824,16 +1063,106 @@ def calculate_credibility_v2(student) -> Dict:
     }
 
 
-def validate_credibility_fix(create_test_student_func=None) -> Dict:
+def calculate_credibility_v2_batch(students: List) -> List[Dict]:
     """
-    Validate that credibility fix works correctly
+    calculate_credibility_v2 for many students at once (same results, input order)
     
-    Test: Student A (3 strong) should rank higher than Student B (8 weak inflated)
+    Evidence, penalties and the quality-weighted averages are computed over one flat
+    array of every student's skills; only the flag strings are built per skill.
     """
-    from data_engine import Skill, SkillEvidence
+    n = len(students)
+    counts = np.array([len(s.skills) for s in students], dtype=np.int64)
+    owner = np.repeat(np.arange(n), counts)
+    skills = [skill for s in students for skill in s.skills]
+    
+    github = np.array([sk.evidence.github for sk in skills], dtype=bool)
+    projects = np.array([sk.evidence.projects for sk in skills], dtype=np.float64)
+    certifications = np.array([sk.evidence.certifications for sk in skills], dtype=np.float64)
+    internship = np.array([sk.evidence.internship for sk in skills], dtype=bool)
+    levels = np.array([sk.claimed_level for sk in skills], dtype=object)
+    
+    # Evidence-based quality score per skill (terms summed in the scalar order, so results match)
+    evidence = (
+        0.35 * github
+        + 0.25 * np.minimum(1.0, projects / 3)
+        + 0.2 * np.minimum(1.0, certifications / 2)
+        + 0.2 * internship
+    )
+    advanced_inflated = (levels == "advanced") & ~(github | (projects >= 2))
+    intermediate_weak = (levels == "intermediate") & (evidence < 0.2)
+    skill_penalty = np.where(advanced_inflated, 0.15, np.where(intermediate_weak, 0.05, 0.0))
+    quality = np.maximum(0.0, evidence - skill_penalty)
+    
+    # Per-student sums (bincount adds in order, like the scalar sum())
+    weighted_sum = np.bincount(owner, weights=quality * (1 + quality), minlength=n)
+    weight_total = np.bincount(owner, weights=1 + quality, minlength=n)
+    inflated_count = np.bincount(owner[advanced_inflated], minlength=n)
+    github_count = np.bincount(owner[github], minlength=n)
+    
+    advanced_inflated = advanced_inflated.tolist()
+    intermediate_weak = intermediate_weak.tolist()
+    evidence = evidence.tolist()
+    
+    results = []
+    start = 0
+    for i in range(n):
+        end = start + int(counts[i])
+        if start == end:
+            results.append({
+                "score": 0.5,
+                "level": "MEDIUM",
+                "red_flags": ["No skills listed"],
+                "strengths": [],
+                "penalty_breakdown": {}
+            })
+            continue
+        
+        red_flags = []
+        strengths = []
+        inflation_penalties = []
+        for k in range(start, end):
+            if advanced_inflated[k]:
+                inflation_penalties.append(skills[k].name)
+                red_flags.append(f"{skills[k].name}: Claimed 'advanced' without evidence")
+            elif intermediate_weak[k]:
+                red_flags.append(f"{skills[k].name}: Claimed 'intermediate' with weak evidence")
+            if evidence[k] >= 0.6:
+                strengths.append(f"{skills[k].name}: Strong evidence ({evidence[k]:.0%})")
+        start = end
+        
+        base_score = float(weighted_sum[i]) / float(weight_total[i]) if weight_total[i] > 0 else 0.5
+        total_inflation_penalty = min(0.6, int(inflated_count[i]) * 0.1)  # Cap at 0.6
+        final_score = max(0.0, min(1.0, base_score - total_inflation_penalty))
+        
+        if final_score >= 0.7:
+            level = "HIGH"
+        elif final_score >= 0.4:
+            level = "MEDIUM"
+        else:
+            level = "LOW"
+        
+        if github_count[i] >= 3:
+            strengths.append(f"{github_count[i]} skills backed by GitHub")
+        
+        results.append({
+            "score": round(final_score, 2),
+            "level": level,
+            "red_flags": red_flags,
+            "strengths": strengths,
+            "penalty_breakdown": {
+                "inflated_skills": inflation_penalties,
+                "total_penalty": round(total_inflation_penalty, 2),
+                "penalty_cap_applied": total_inflation_penalty >= 0.6
+            }
+        })
     
-    # Student A: 3 strong skills with good evidence
-    student_a_skills = [
+    return results
+
+
+# Fixed validation profiles, built once at import (calculate_credibility_v2 only reads them)
+# Student A: 3 strong skills with good evidence
+_FIX_STUDENT_A = _TempStudent(
+    skills=(
         Skill(
             name="Python",
             claimed_level="advanced",
@@ -849,25 +1178,32 @@ def validate_credibility_fix(create_test_student_func=None) -> Dict:
             claimed_level="intermediate",
             evidence=SkillEvidence(github=True, projects=2, certifications=1, internship=False)
         ),
-    ]
-    
-    # Student B: 8 weak inflated skills
-    student_b_skills = [
+    ),
+    resume_trust_score=0.5
+)
+
+# Student B: 8 weak inflated skills
+_FIX_STUDENT_B = _TempStudent(
+    skills=tuple(
         Skill(
             name=f"Skill_{i}",
             claimed_level="advanced",
             evidence=SkillEvidence(github=False, projects=0, certifications=0, internship=False)
         )
         for i in range(8)
-    ]
-    
-    class MockStudent:
-        def __init__(self, skills, resume_trust_score=0.5):
-            self.skills = skills
-            self.resume_trust_score = resume_trust_score
+    ),
+    resume_trust_score=0.5
+)
+
+
+def validate_credibility_fix(create_test_student_func=None) -> Dict:
+    """
+    Validate that credibility fix works correctly
     
-    student_a = MockStudent(student_a_skills)
-    student_b = MockStudent(student_b_skills)
+    Test: Student A (3 strong) should rank higher than Student B (8 weak inflated)
+    """
+    student_a = _FIX_STUDENT_A
+    student_b = _FIX_STUDENT_B
     
     cred_a = calculate_credibility_v2(student_a)
     cred_b = calculate_credibility_v2(student_b)
@@ -875,7 +1211,7 @@ def validate_credibility_fix(create_test_student_func=None) -> Dict:
     result = {
         "student_a": {
             "description": "3 strong skills with GitHub, projects, certs",
-            "skills_count": len(student_a_skills),
+            "skills_count": len(student_a.skills),
             "credibility_score": cred_a["score"],
             "credibility_level": cred_a["level"],
             "strengths": cred_a["strengths"],
@@ -883,7 +1219,7 @@ def validate_credibility_fix(create_test_student_func=None) -> Dict:
         },
         "student_b": {
             "description": "8 weak inflated skills (advanced with no evidence)",
-            "skills_count": len(student_b_skills),
+            "skills_count": len(student_b.skills),
             "credibility_score": cred_b["score"],
             "credibility_level": cred_b["level"],
             "strengths": cred_b["strengths"],
@@ -899,8 +1235,158 @@ def validate_credibility_fix(create_test_student_func=None) -> Dict:
 
 # ==================== UPGRADE 5: BIAS & FAIRNESS AUDIT ====================
 
+# Bucket labels in report order; np.digitize on the edges gives the label index
+CGPA_BUCKET_LABELS = ("low (5.0-6.5)", "medium (6.5-7.5)", "high (7.5-8.5)", "star (8.5+)")
+CGPA_BUCKET_EDGES = (6.5, 7.5, 8.5)
+COMM_BUCKET_LABELS = ("low (1-4)", "medium (5-7)", "high (8-10)")
+COMM_BUCKET_EDGES = (5, 8)
+CRED_LEVELS = ("LOW", "MEDIUM", "HIGH")
+CRED_LEVEL_IDS = MappingProxyType({level: i for i, level in enumerate(CRED_LEVELS)})
+
+# Report rating by fairness score: bisect_right over the lower edges (>= 40 / 60 / 80)
+FAIRNESS_RATING_EDGES = (40, 60, 80)
+FAIRNESS_RATINGS = (
+    "POOR - Significant bias detected",
+    "FAIR - Review recommendations",
+    "GOOD - Minor improvements possible",
+    "EXCELLENT - System is fair",
+)
+
+
+def _credibility_level_getter(sample):
+    """Level accessor chosen once: CredibilityResult attribute or calculate_credibility_v2 dict key"""
+    if hasattr(sample, 'level'):
+        return lambda cred: cred.level
+    return lambda cred: cred.get('level', 'MEDIUM')
+
+
+@njit(cache=True)
+def _audit_kernel(cgpa, comm, cred_id, branch_id, selected,
+                  n_levels, n_branches, cgpa_edges, comm_edges, high_id):
+    """
+    Single pass over the audited logs
+    
+    counts[cgpa_bucket, cred, branch, comm_bucket] = (total, selected); buckets
+    count the edges at or below the value (np.digitize). heavy rows are
+    (total, selected) for skill-heavy (HIGH cred, 6.5 <= CGPA < 8.0) and
+    GPA-heavy (CGPA >= 8.0, LOW/MEDIUM cred) logs.
+    """
+    counts = np.zeros((len(cgpa_edges) + 1, n_levels, n_branches, len(comm_edges) + 1, 2), dtype=np.int64)
+    heavy = np.zeros((2, 2), dtype=np.int64)
+    for i in range(len(cgpa)):
+        g = cgpa[i]
+        cgpa_bucket = 0
+        for edge in cgpa_edges:
+            if g >= edge:
+                cgpa_bucket += 1
+        comm_bucket = 0
+        for edge in comm_edges:
+            if comm[i] >= edge:
+                comm_bucket += 1
+        hit = 1 if selected[i] else 0
+        cell = counts[cgpa_bucket, cred_id[i], branch_id[i], comm_bucket]
+        cell[0] += 1
+        cell[1] += hit
+        if cred_id[i] == high_id:
+            if 6.5 <= g < 8.0:
+                heavy[0, 0] += 1
+                heavy[0, 1] += hit
+        elif g >= 8.0:
+            heavy[1, 0] += 1
+            heavy[1, 1] += hit
+    return counts, heavy
+
+
+def _audit_columns(students: List, logs: List, calculate_credibility_func, credibilities: Optional[Dict]):
+    """
+    Per-log audit columns (cgpa, comm, cred_id, branch_id, is_selected) for logs of
+    known students, plus branch labels in first-appearance order (branch_id indexes them)
+    """
+    student_map = {s.student_id: s for s in students}
+    
+    # Factorize logs onto the students they mention (first-appearance order)
+    student_pos = {}
+    rows = []
+    selected = []
+    for log in logs:
+        if log.student_id not in student_map:
+            continue
+        pos = student_pos.get(log.student_id)
+        if pos is None:
+            pos = student_pos[log.student_id] = len(student_pos)
+        rows.append(pos)
+        selected.append(log.interview_result == "selected")
+    
+    # Per-student columns - credibility once per student instead of once per log
+    audited = [student_map[sid] for sid in student_pos]
+    cgpa = np.array([s.cgpa for s in audited], dtype=np.float64)
+    comm = np.array([s.communication_score for s in audited], dtype=np.float64)
+    cred_cache = {} if credibilities is None else credibilities
+    audit_creds = []
+    for s in audited:
+        cred = cred_cache.get(s.student_id)
+        if cred is None:
+            cred = calculate_credibility_func(s)
+        audit_creds.append(cred)
+    get_level = _credibility_level_getter(audit_creds[0]) if audit_creds else None
+    cred_ids = np.array([CRED_LEVEL_IDS[get_level(cred)] for cred in audit_creds], dtype=np.int64)
+    branch_ids = {}
+    branch_of = np.array([branch_ids.setdefault(s.branch, len(branch_ids)) for s in audited], dtype=np.int64)
+    
+    # Broadcast student columns to one entry per log
+    rows = np.array(rows, dtype=np.intp)
+    columns = (cgpa[rows], comm[rows], cred_ids[rows], branch_of[rows], np.array(selected, dtype=np.bool_))
+    return columns, list(branch_ids)
+
+
+def _audit_counts(cgpa, comm, cred_id, branch_id, is_selected, n_branches: int):
+    """_audit_kernel with the module's bucket edges and credibility levels"""
+    return _audit_kernel(
+        cgpa, comm, cred_id, branch_id, is_selected,
+        len(CRED_LEVELS), n_branches, CGPA_BUCKET_EDGES, COMM_BUCKET_EDGES, CRED_LEVEL_IDS["HIGH"]
+    )
+
+
+def _selection_rate(selected: int, total: int) -> float:
+    """Selection percentage, rounded like the report (0 for an empty group)"""
+    return round(selected / total * 100, 1) if total > 0 else 0
+
+
+def _fairness(skill_rate: float, gpa_rate: float, branch_rates: List[float], high_rate: float, low_rate: float):
+    """(fairness_score, branch_variance, skill_advantage) from the audit's selection rates"""
+    # Lower variance in branch rates = more fair
+    branch_variance = 0
+    if branch_rates:
+        n_branches = len(branch_rates)
+        mean_rate = sum(branch_rates) / n_branches
+        branch_variance = sum((r - mean_rate) ** 2 for r in branch_rates) / n_branches
+    
+    # Check if skill evidence outweighs pure CGPA
+    skill_advantage = skill_rate - gpa_rate
+    
+    # Score terms on top of the 70 base; new audit dimensions add a term here
+    fairness_terms = [
+        10 if skill_advantage > 0 else -10,  # Bonus if skills matter
+        -branch_variance * 0.5,  # Penalty for branch bias
+        5 if high_rate > low_rate else -5  # Bonus if credibility matters
+    ]
+    return max(0, min(100, sum(fairness_terms, 70))), branch_variance, skill_advantage
+
+
+def _marginal(counts: np.ndarray, axis: int, labels) -> Dict[str, Dict[str, int]]:
+    """{label: {"total", "selected"}} for one dimension of the (..., 2) cross-tab"""
+    others = tuple(a for a in range(counts.ndim - 1) if a != axis)
+    return {
+        label: {"total": t, "selected": c}
+        for label, (t, c) in zip(labels, counts.sum(axis=others).tolist())
+    }
+
+
 class BiasAuditResult:
     """Result of bias and fairness audit"""
+    __slots__ = ("cgpa_analysis", "credibility_analysis", "skill_vs_gpa_analysis", "branch_analysis",
+                 "communication_analysis", "overall_fairness_score", "recommendations")
+    
     def __init__(
         self,
         cgpa_analysis: Dict,
@@ -935,7 +1421,8 @@ def conduct_bias_audit(
     students: List,
     companies: List,
     logs: List,
-    calculate_credibility_func
+    calculate_credibility_func,
+    credibilities: Optional[Dict] = None
 ) -> BiasAuditResult:
     """
     UPGRADE 5: Bias & Fairness Audit
@@ -951,93 +1438,30 @@ def conduct_bias_audit(
     3. Skill-heavy vs GPA-heavy success comparison
     4. Branch-wise fairness
     5. Communication score impact
-    """
-    student_map = {s.student_id: s for s in students}
     
-    # Initialize counters
-    cgpa_buckets = {
-        "low (5.0-6.5)": {"total": 0, "selected": 0},
-        "medium (6.5-7.5)": {"total": 0, "selected": 0},
-        "high (7.5-8.5)": {"total": 0, "selected": 0},
-        "star (8.5+)": {"total": 0, "selected": 0}
-    }
+    credibilities: optional {student_id: credibility result} precomputed with
+    calculate_credibility_func (e.g. from calculate_credibility_v2_batch); students
+    missing from it fall back to calculate_credibility_func
+    """
+    (cgpa, comm, cred_id, branch_id, is_selected), branch_labels = _audit_columns(
+        students, logs, calculate_credibility_func, credibilities
+    )
     
-    cred_levels = {
-        "LOW": {"total": 0, "selected": 0},
-        "MEDIUM": {"total": 0, "selected": 0},
-        "HIGH": {"total": 0, "selected": 0}
-    }
+    # One fused pass: cross-tab over (CGPA bucket, credibility, branch, communication)
+    # plus the skill-heavy / GPA-heavy groups; each analysis is then a marginal
+    dims = (CGPA_BUCKET_LABELS, CRED_LEVELS, branch_labels, COMM_BUCKET_LABELS)
+    counts, heavy = _audit_counts(cgpa, comm, cred_id, branch_id, is_selected, len(branch_labels))
+    cgpa_buckets, cred_levels, branch_stats, comm_buckets = (
+        _marginal(counts, axis, labels) for axis, labels in enumerate(dims)
+    )
     
     # Track skill-heavy vs GPA-heavy
-    skill_heavy = {"total": 0, "selected": 0}  # HIGH cred, medium CGPA
-    gpa_heavy = {"total": 0, "selected": 0}    # HIGH CGPA, LOW/MEDIUM cred
-    
-    branch_stats = defaultdict(lambda: {"total": 0, "selected": 0})
-    comm_buckets = {
-        "low (1-4)": {"total": 0, "selected": 0},
-        "medium (5-7)": {"total": 0, "selected": 0},
-        "high (8-10)": {"total": 0, "selected": 0}
-    }
-    
-    # Process logs
-    for log in logs:
-        if log.student_id not in student_map:
-            continue
-        
-        student = student_map[log.student_id]
-        cred = calculate_credibility_func(student)
-        cred_level = cred.level if hasattr(cred, 'level') else cred.get('level', 'MEDIUM')
-        is_selected = log.interview_result == "selected"
-        
-        # CGPA bucket
-        if student.cgpa >= 8.5:
-            bucket = "star (8.5+)"
-        elif student.cgpa >= 7.5:
-            bucket = "high (7.5-8.5)"
-        elif student.cgpa >= 6.5:
-            bucket = "medium (6.5-7.5)"
-        else:
-            bucket = "low (5.0-6.5)"
-        
-        cgpa_buckets[bucket]["total"] += 1
-        if is_selected:
-            cgpa_buckets[bucket]["selected"] += 1
-        
-        # Credibility level
-        cred_levels[cred_level]["total"] += 1
-        if is_selected:
-            cred_levels[cred_level]["selected"] += 1
-        
-        # Skill-heavy vs GPA-heavy analysis
-        if cred_level == "HIGH" and 6.5 <= student.cgpa < 8.0:
-            skill_heavy["total"] += 1
-            if is_selected:
-                skill_heavy["selected"] += 1
-        elif student.cgpa >= 8.0 and cred_level in ["LOW", "MEDIUM"]:
-            gpa_heavy["total"] += 1
-            if is_selected:
-                gpa_heavy["selected"] += 1
-        
-        # Branch
-        branch_stats[student.branch]["total"] += 1
-        if is_selected:
-            branch_stats[student.branch]["selected"] += 1
-        
-        # Communication bucket
-        if student.communication_score >= 8:
-            comm_bucket = "high (8-10)"
-        elif student.communication_score >= 5:
-            comm_bucket = "medium (5-7)"
-        else:
-            comm_bucket = "low (1-4)"
-        
-        comm_buckets[comm_bucket]["total"] += 1
-        if is_selected:
-            comm_buckets[comm_bucket]["selected"] += 1
+    skill_heavy = {"total": int(heavy[0, 0]), "selected": int(heavy[0, 1])}  # HIGH cred, medium CGPA
+    gpa_heavy = {"total": int(heavy[1, 0]), "selected": int(heavy[1, 1])}    # HIGH CGPA, LOW/MEDIUM cred
     
     # Calculate rates
     def calc_rate(data):
-        return round(data["selected"] / data["total"] * 100, 1) if data["total"] > 0 else 0
+        return _selection_rate(data["selected"], data["total"])
     
     cgpa_analysis = {k: {"count": v["total"], "selected": v["selected"], "rate": calc_rate(v)} for k, v in cgpa_buckets.items()}
     cred_analysis = {k: {"count": v["total"], "selected": v["selected"], "rate": calc_rate(v)} for k, v in cred_levels.items()}
@@ -1049,20 +1473,13 @@ def conduct_bias_audit(
         "gpa_heavy": {"description": "HIGH CGPA (8.0+) + LOW/MEDIUM credibility", "rate": calc_rate(gpa_heavy), "count": gpa_heavy["total"]}
     }
     
-    # Calculate fairness score
-    # Lower variance in branch rates = more fair
-    branch_rates = [v["rate"] for v in branch_analysis.values() if v["count"] > 0]
-    branch_variance = sum((r - sum(branch_rates)/len(branch_rates))**2 for r in branch_rates) / len(branch_rates) if branch_rates else 0
-    
-    # Check if skill evidence outweighs pure CGPA
-    skill_advantage = skill_vs_gpa["skill_heavy"]["rate"] - skill_vs_gpa["gpa_heavy"]["rate"]
-    
-    fairness_score = max(0, min(100, 
-        70 +  # Base score
-        (10 if skill_advantage > 0 else -10) +  # Bonus if skills matter
-        (-branch_variance * 0.5) +  # Penalty for branch bias
-        (5 if cred_analysis["HIGH"]["rate"] > cred_analysis["LOW"]["rate"] else -5)  # Bonus if credibility matters
-    ))
+    fairness_score, branch_variance, skill_advantage = _fairness(
+        skill_vs_gpa["skill_heavy"]["rate"],
+        skill_vs_gpa["gpa_heavy"]["rate"],
+        [v["rate"] for v in branch_analysis.values() if v["count"] > 0],
+        cred_analysis["HIGH"]["rate"],
+        cred_analysis["LOW"]["rate"]
+    )
     
     # Generate recommendations
     recommendations = []
@@ -1094,68 +1511,93 @@ def conduct_bias_audit(
     )
 
 
-def generate_bias_audit_report(audit: BiasAuditResult) -> str:
-    """Generate human-readable bias audit report"""
+def bootstrap_fairness_score(
+    students: List,
+    logs: List,
+    calculate_credibility_func,
+    n_resamples: int = 500,
+    seed: Optional[int] = None,
+    credibilities: Optional[Dict] = None
+) -> Tuple[float, float]:
+    """
+    Stability of the fairness score: (mean, std) over bootstrap resamples of the logs
     
-    report = """
-=== BIAS & FAIRNESS AUDIT REPORT ===
-This report analyzes placement outcomes for potential bias.
+    A single set of outcomes can over- or under-state bias; resampling the logs
+    with replacement shows how much the score moves with the data. Each resample
+    is one index draw plus one _audit_kernel pass over the per-log columns.
+    credibilities: as in conduct_bias_audit
+    """
+    columns, branch_labels = _audit_columns(students, logs, calculate_credibility_func, credibilities)
+    n = len(columns[0])
+    n_branches = len(branch_labels)
+    high, low = CRED_LEVEL_IDS["HIGH"], CRED_LEVEL_IDS["LOW"]
+    
+    rng = np.random.default_rng(seed)
+    samples = rng.integers(0, n, size=(n_resamples, n)) if n else np.zeros((1, 0), dtype=np.intp)
+    scores = np.empty(len(samples), dtype=np.float64)
+    for b, idx in enumerate(samples):
+        counts, heavy = _audit_counts(*(col[idx] for col in columns), n_branches)
+        cred = counts.sum(axis=(0, 2, 3)).tolist()
+        branches = counts.sum(axis=(0, 1, 3)).tolist()
+        scores[b] = _fairness(
+            _selection_rate(heavy[0, 1], heavy[0, 0]),
+            _selection_rate(heavy[1, 1], heavy[1, 0]),
+            [_selection_rate(chosen, total) for total, chosen in branches if total > 0],
+            _selection_rate(cred[high][1], cred[high][0]),
+            _selection_rate(cred[low][1], cred[low][0])
+        )[0]
+    
+    return round(float(scores.mean()), 1), round(float(scores.std()), 1)
 
---- CGPA BUCKET ANALYSIS ---
-"""
-    
-    for bucket, data in audit.cgpa_analysis.items():
-        bar = "#" * int(data["rate"] / 5)
-        report += f"  {bucket:20s}: {data['rate']:5.1f}% selected ({data['selected']}/{data['count']}) {bar}\n"
-    
-    report += "\n--- CREDIBILITY LEVEL ANALYSIS ---\n"
-    for level, data in audit.credibility_analysis.items():
-        bar = "#" * int(data["rate"] / 5)
-        report += f"  {level:20s}: {data['rate']:5.1f}% selected ({data['selected']}/{data['count']}) {bar}\n"
+
+def _rate_rows(analysis: Dict, width: int) -> str:
+    """Selection-rate lines (with bars) for one audit breakdown"""
+    return "".join(
+        f"  {label:{width}s}: {data['rate']:5.1f}% selected ({data['selected']}/{data['count']}) "
+        f"{BARS[min(20, int(data['rate'] / 5))]}\n"
+        for label, data in analysis.items()
+    )
+
+
+def generate_bias_audit_report(audit: BiasAuditResult) -> str:
+    """Generate human-readable bias audit report"""
     
-    report += "\n--- SKILL vs GPA COMPARISON ---\n"
     skill_data = audit.skill_vs_gpa_analysis["skill_heavy"]
     gpa_data = audit.skill_vs_gpa_analysis["gpa_heavy"]
-    report += f"  Skill-heavy students: {skill_data['rate']:.1f}% success (n={skill_data['count']})\n"
-    report += f"    ({skill_data['description']})\n"
-    report += f"  GPA-heavy students:   {gpa_data['rate']:.1f}% success (n={gpa_data['count']})\n"
-    report += f"    ({gpa_data['description']})\n"
-    
     if skill_data['rate'] > gpa_data['rate']:
-        report += "  Conclusion: Skill evidence outweighs GPA in final outcomes [GOOD]\n"
-    else:
-        report += "  Conclusion: GPA outweighs skill evidence [REVIEW NEEDED]\n"
-    
-    report += "\n--- BRANCH-WISE ANALYSIS ---\n"
-    for branch, data in audit.branch_analysis.items():
-        bar = "#" * int(data["rate"] / 5)
-        report += f"  {branch:10s}: {data['rate']:5.1f}% selected ({data['selected']}/{data['count']}) {bar}\n"
-    
-    report += "\n--- COMMUNICATION IMPACT ---\n"
-    for bucket, data in audit.communication_analysis.items():
-        bar = "#" * int(data["rate"] / 5)
-        report += f"  {bucket:15s}: {data['rate']:5.1f}% selected ({data['selected']}/{data['count']}) {bar}\n"
-    
-    report += f"\n--- OVERALL FAIRNESS SCORE ---\n"
-    report += f"  Score: {audit.overall_fairness_score}/100\n"
-    
-    if audit.overall_fairness_score >= 80:
-        report += "  Rating: EXCELLENT - System is fair\n"
-    elif audit.overall_fairness_score >= 60:
-        report += "  Rating: GOOD - Minor improvements possible\n"
-    elif audit.overall_fairness_score >= 40:
-        report += "  Rating: FAIR - Review recommendations\n"
+        conclusion = "Skill evidence outweighs GPA in final outcomes [GOOD]"
     else:
-        report += "  Rating: POOR - Significant bias detected\n"
+        conclusion = "GPA outweighs skill evidence [REVIEW NEEDED]"
+    rating = FAIRNESS_RATINGS[bisect_right(FAIRNESS_RATING_EDGES, audit.overall_fairness_score)]
+    recommendations = "".join(f"  {i}. {rec}\n" for i, rec in enumerate(audit.recommendations, 1))
     
-    report += "\n--- RECOMMENDATIONS ---\n"
-    for i, rec in enumerate(audit.recommendations, 1):
-        report += f"  {i}. {rec}\n"
-    
-    report += "\nThis audit protects the institution AND the students.\n"
-    
-    return report
+    return f"""
+=== BIAS & FAIRNESS AUDIT REPORT ===
+This report analyzes placement outcomes for potential bias.
 
+--- CGPA BUCKET ANALYSIS ---
+{_rate_rows(audit.cgpa_analysis, 20)}
+--- CREDIBILITY LEVEL ANALYSIS ---
+{_rate_rows(audit.credibility_analysis, 20)}
+--- SKILL vs GPA COMPARISON ---
+  Skill-heavy students: {skill_data['rate']:.1f}% success (n={skill_data['count']})
+    ({skill_data['description']})
+  GPA-heavy students:   {gpa_data['rate']:.1f}% success (n={gpa_data['count']})
+    ({gpa_data['description']})
+  Conclusion: {conclusion}
+
+--- BRANCH-WISE ANALYSIS ---
+{_rate_rows(audit.branch_analysis, 10)}
+--- COMMUNICATION IMPACT ---
+{_rate_rows(audit.communication_analysis, 15)}
+--- OVERALL FAIRNESS SCORE ---
+  Score: {audit.overall_fairness_score}/100
+  Rating: {rating}
+
+--- RECOMMENDATIONS ---
+{recommendations}
+This audit protects the institution AND the students.
+"""
 
 
 # ==================== DEMONSTRATION & MAIN EXECUTION ====================
@@ -1172,6 +1614,8 @@ def run_all_upgrades_demo():
     from data_engine import SyntheticDataGenerator
     from intelligence import calculate_credibility
     
+    warm_up_kernels()
+    
     print("=" * 70)
     print("COLLEGE PLACEMENT INTELLIGENCE SYSTEM - UPGRADES DEMO")
     print("=" * 70)
@@ -1184,6 +1628,9 @@ def run_all_upgrades_demo():
     logs = generator.generate_placement_logs(students, companies, 200)
     print(f"    Generated: {len(students)} students, {len(companies)} companies, {len(logs)} logs")
     
+    # Credibility depends only on the student - score everyone once for all upgrades below
+    creds = {s.student_id: calculate_credibility(s) for s in students}
+    
     # Import match function
     from intelligence import match_student_to_job
     
@@ -1195,7 +1642,8 @@ def run_all_upgrades_demo():
         company=company,
         logs=logs,
         match_function=match_student_to_job,
-        open_positions=5
+        open_positions=5,
+        credibilities=creds
     )
     # Show allocation summary
     print(f"\n    === ALLOCATION SUMMARY FOR {allocation.company_name} ===")
@@ -1222,21 +1670,20 @@ def run_all_upgrades_demo():
     # --- UPGRADE 3: ML PREDICTION ---
     print("\n[4/6] Running Upgrade 3: ML Success Prediction...")
     predictor = PlacementSuccessPredictor()
-    training_data = prepare_training_data(students, companies, logs, calculate_credibility)
+    training_data = prepare_training_arrays(students, companies, logs, calculate_credibility, credibilities=creds)
+    has_model = len(training_data.y) >= 10
     
-    if len(training_data) >= 10:
+    if has_model:
         predictor.train(training_data)
         
         # Predict for a new student
         test_student = students[5]
         test_company = companies[0]
-        cred = calculate_credibility(test_student)
-        cred_score = cred.score if hasattr(cred, 'score') else cred.get('score', 0.5)
+        cred_score = creds[test_student.student_id].score
         
         # Calculate skill match ratio
-        student_skills = {s.name.lower() for s in test_student.skills}
-        required_skills = set(s.lower() for s in test_company.eligibility_rules.mandatory_skills)
-        skill_match = len(student_skills & required_skills) / len(required_skills) if required_skills else 0.5
+        rules = test_company.eligibility_rules
+        skill_match = rules.mandatory_ratios[(test_student.skill_bits & rules.mandatory_bits).bit_count()] if rules.mandatory_bits else 0.5
         
         prediction = predictor.predict(
             student=test_student,
@@ -1260,8 +1707,13 @@ def run_all_upgrades_demo():
     
     # --- UPGRADE 5: BIAS AUDIT ---
     print("\n[6/6] Running Upgrade 5: Bias & Fairness Audit...")
-    audit = conduct_bias_audit(students, companies, logs, calculate_credibility_v2)
+    creds_v2 = dict(zip((s.student_id for s in students), calculate_credibility_v2_batch(students)))
+    audit = conduct_bias_audit(students, companies, logs, calculate_credibility_v2, credibilities=creds_v2)
     print(generate_bias_audit_report(audit))
+    score_mean, score_std = bootstrap_fairness_score(
+        students, logs, calculate_credibility_v2, n_resamples=200, seed=42, credibilities=creds_v2
+    )
+    print(f"    Fairness score stability (200 bootstrap resamples): {score_mean} +/- {score_std}")
     
     print("\n" + "=" * 70)
     print("ALL UPGRADES COMPLETED SUCCESSFULLY")
@@ -1270,7 +1722,7 @@ def run_all_upgrades_demo():
     return {
         "allocation": allocation,
         "profile": profile,
-        "prediction": prediction if len(training_data) >= 10 else None,
+        "prediction": prediction if has_model else None,
         "validation": validation,
         "audit": audit
     }